@@ -0,0 +1,160 @@
+"""Preallocated PCM capture buffer for the recorder."""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioBuffer:
+    """
+    Growable int16 PCM buffer backed by a single preallocated NumPy array.
+
+    Replaces the old list-of-bytes capture: appending a chunk is a slice copy into
+    spare capacity instead of a new allocation, and the recorded audio is exposed as a
+    zero-copy view instead of a b"".join() of every chunk. Capacity doubles when
+    exhausted, so a long note session costs a handful of reallocations rather than
+    one per 1024-frame chunk.
+    """
+
+    def __init__(self, sample_rate: int = 16000, channels: int = 1, initial_seconds: float = 60.0):
+        """
+        Initialize the buffer.
+
+        Args:
+            sample_rate: Sample rate in Hz (used to size the initial allocation)
+            channels: Number of interleaved channels
+            initial_seconds: Seconds of audio to preallocate up front
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._initial_capacity = max(1, int(sample_rate * channels * initial_seconds))
+        self._data = np.zeros(self._initial_capacity, dtype=np.int16)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of recorded samples (all channels)."""
+        return self._size
+
+    @property
+    def frames(self) -> int:
+        """Number of recorded frames (samples per channel)."""
+        return self._size // self.channels
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples that fit without reallocating."""
+        return len(self._data)
+
+    def append(self, data: bytes | np.ndarray) -> None:
+        """
+        Append a chunk of int16 PCM.
+
+        Args:
+            data: Raw little-endian int16 bytes (as returned by PyAudio) or an int16 array
+        """
+        if isinstance(data, np.ndarray):
+            samples = data.reshape(-1)
+        else:
+            samples = np.frombuffer(data, dtype=np.int16)
+        end = self._size + len(samples)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self._size : end] = samples
+        self._size = end
+
+    def view(self) -> np.ndarray:
+        """
+        Zero-copy view of the recorded samples.
+
+        The view aliases the internal storage, so it is only valid until the next
+        append that grows the buffer (the samples move to a new array) and its
+        contents are overwritten once the buffer is cleared and reused.
+        """
+        return self._data[: self._size]
+
+    def as_bytes(self) -> memoryview:
+        """Zero-copy byte view of the recorded PCM (for wave.writeframes)."""
+        return memoryview(self.view()).cast("B")
+
+    def clear(self) -> None:
+        """Reset for a new recording, releasing oversized capacity from long sessions."""
+        self._size = 0
+        if len(self._data) > self._initial_capacity * 4:
+            self._data = np.zeros(self._initial_capacity, dtype=np.int16)
+
+    def _grow(self, required: int) -> None:
+        """Reallocate to at least `required` samples (amortized doubling)."""
+        new_capacity = max(required, len(self._data) * 2)
+        logger.debug(
+            f"AudioBuffer growing to {new_capacity / (self.sample_rate * self.channels):.0f}s"
+        )
+        grown = np.zeros(new_capacity, dtype=np.int16)
+        grown[: self._size] = self._data[: self._size]
+        self._data = grown
+
+
+class PreRollBuffer:
+    """
+    Fixed-size ring holding the most recent int16 samples.
+
+    Filled continuously while a warm input stream is idle so that a new recording
+    can start from audio captured just before the hotkey was pressed.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the ring.
+
+        Args:
+            capacity: Number of samples (all channels) to retain
+        """
+        self._data = np.zeros(max(1, capacity), dtype=np.int16)
+        self._pos = 0
+        self._filled = 0
+
+    def __len__(self) -> int:
+        """Number of samples currently held."""
+        return self._filled
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained."""
+        return len(self._data)
+
+    def write(self, data: bytes | np.ndarray) -> None:
+        """Append samples, overwriting the oldest ones once full."""
+        if isinstance(data, np.ndarray):
+            samples = data.reshape(-1)
+        else:
+            samples = np.frombuffer(data, dtype=np.int16)
+        cap = len(self._data)
+        n = len(samples)
+
+        if n >= cap:
+            self._data[:] = samples[-cap:]
+            self._pos = 0
+            self._filled = cap
+            return
+
+        end = self._pos + n
+        if end <= cap:
+            self._data[self._pos : end] = samples
+        else:
+            first = cap - self._pos
+            self._data[self._pos :] = samples[:first]
+            self._data[: n - first] = samples[first:]
+        self._pos = end % cap
+        self._filled = min(cap, self._filled + n)
+
+    def snapshot(self) -> np.ndarray:
+        """Return the held samples, oldest first (a copy)."""
+        if self._filled < len(self._data):
+            return self._data[: self._filled].copy()
+        return np.concatenate((self._data[self._pos :], self._data[: self._pos]))
+
+    def clear(self) -> None:
+        """Discard all held samples."""
+        self._pos = 0
+        self._filled = 0
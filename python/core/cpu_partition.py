@@ -0,0 +1,128 @@
+"""CPU partitioning between Whisper and a local Ollama server, and per-stage CPU accounting."""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+
+def plan_partition(whisper_cores: int | None = None) -> tuple[list[int], int]:
+    """
+    Split the logical CPUs between the transcriber and Ollama.
+
+    Args:
+        whisper_cores: CPUs reserved for Whisper (default: half, at least one left for Ollama)
+
+    Returns:
+        (CPU indices for the transcriber's affinity, num_thread for Ollama)
+    """
+    total = psutil.cpu_count(logical=True) or os.cpu_count() or 2
+    if total < 2:
+        return [0], 1
+    cores = min(max(1, int(whisper_cores or total // 2)), total - 1)
+    return list(range(cores)), total - cores
+
+
+def set_affinity(pid: int, cpus: list[int] | None) -> bool:
+    """
+    Pin a process (and all its threads) to a set of CPUs.
+
+    Args:
+        pid: Process to pin
+        cpus: CPU indices, or None to allow every CPU again
+
+    Returns:
+        False if the platform or permissions don't allow it (e.g. macOS)
+    """
+    try:
+        process = psutil.Process(pid)
+        if hasattr(os, "sched_setaffinity"):
+            # Linux affinity is per thread: pin the CTranslate2 pool that already exists too
+            allowed = cpus if cpus is not None else range(psutil.cpu_count() or 1)
+            for thread in process.threads():
+                os.sched_setaffinity(thread.id, allowed)
+        else:
+            process.cpu_affinity(cpus if cpus is not None else [])  # [] = all CPUs
+        logger.info(f"[CPU] Affinity of pid {pid}: {cpus if cpus is not None else 'all CPUs'}")
+        return True
+    except (AttributeError, psutil.Error, OSError, ValueError) as e:
+        logger.warning(f"[CPU] Could not set CPU affinity of pid {pid}: {e}")
+        return False
+
+
+class StageCpuMeter:
+    """
+    Measures CPU time the engines spend during pipeline stages.
+
+    Hooked into PerformanceMetrics: when a 'transcription' stage is timed, the CPU
+    time of the process running Whisper (the server, or its transcription worker) is
+    measured; for LLM stages, the CPU time of the local Ollama processes. Wall time
+    alone can't tell a slow stage from one that was starved by the other engine.
+    """
+
+    # Pipeline stages (PerformanceMetrics names) run by each engine
+    WHISPER_STAGES = {"transcription", "language_detection"}
+    LLM_STAGES = {"processing", "ask", "translation"}
+    # Re-scan for Ollama processes at most this often (the runner restarts on model load)
+    OLLAMA_SCAN_INTERVAL_S = 60.0
+
+    def __init__(self, whisper_pid: Callable[[], int | None]):
+        """
+        Initialize the meter.
+
+        Args:
+            whisper_pid: Returns the pid of the process currently running Whisper
+        """
+        self.whisper_pid = whisper_pid
+        self._starts: dict[str, tuple[list[int], float]] = {}
+        self._ollama_pids: list[int] = []
+        self._ollama_scanned_at = 0.0
+
+    def start(self, stage: str) -> None:
+        """Snapshot CPU time of the processes that do the work for this stage."""
+        pids = self._pids_for(stage)
+        if pids:
+            self._starts[stage] = (pids, self._cpu_seconds(pids))
+
+    def end(self, stage: str) -> float | None:
+        """Return the CPU milliseconds spent since start(stage), or None if not measured."""
+        started = self._starts.pop(stage, None)
+        if started is None:
+            return None
+        pids, before = started
+        return max(0.0, (self._cpu_seconds(pids) - before) * 1000)
+
+    def _pids_for(self, stage: str) -> list[int]:
+        if stage in self.WHISPER_STAGES:
+            pid = self.whisper_pid()
+            return [pid] if pid else []
+        if stage in self.LLM_STAGES:
+            return self._find_ollama()
+        return []
+
+    def _find_ollama(self) -> list[int]:
+        """Pids of the local Ollama server and runner processes (cached)."""
+        now = time.monotonic()
+        if now - self._ollama_scanned_at > self.OLLAMA_SCAN_INTERVAL_S:
+            self._ollama_scanned_at = now
+            self._ollama_pids = [
+                p.info["pid"]
+                for p in psutil.process_iter(["pid", "name"])
+                if (p.info["name"] or "").lower().startswith("ollama")
+            ]
+        return self._ollama_pids
+
+    @staticmethod
+    def _cpu_seconds(pids: list[int]) -> float:
+        total = 0.0
+        for pid in pids:
+            try:
+                times = psutil.Process(pid).cpu_times()
+                total += times.user + times.system
+            except psutil.Error:
+                continue  # Process exited; its time is simply not counted
+        return total
@@ -0,0 +1,186 @@
+"""CTranslate2 thread/compute-type calibration for CPU-only Whisper inference."""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TUNING_FILE = Path.home() / ".diktate" / "cpu_tuning.json"
+
+# Compute types benchmarked by default (all supported by CTranslate2 on x86/ARM CPUs)
+DEFAULT_COMPUTE_TYPES = ("int8", "int16", "float32")
+# Length of the benchmark clip and the decoder work allowed per run. Encoder cost does
+# not depend on what is said; capping the tokens makes every configuration decode the
+# same amount, so the timings compare thread settings rather than transcripts.
+BENCH_CLIP_S = 10.0
+BENCH_MAX_TOKENS = 48
+# Timed runs per configuration (after one warm-up run); the fastest counts
+BENCH_RUNS = 2
+SAMPLE_RATE = 16000
+
+
+def load_tuning(model_size: str, path: Path = TUNING_FILE) -> dict | None:
+    """
+    Return the calibrated CPU settings for a model, if any.
+
+    Settings measured on a machine with a different core count are ignored.
+
+    Args:
+        model_size: Whisper model size
+        path: Tuning file
+
+    Returns:
+        {"compute_type", "cpu_threads", "num_workers", ...} or None
+    """
+    try:
+        if not path.exists():
+            return None
+        with open(path) as f:
+            entry = json.load(f).get(model_size)
+    except Exception as e:
+        logger.warning(f"[CPU_TUNE] Could not read {path}: {e}")
+        return None
+    if not entry or entry.get("cpu_count") != os.cpu_count():
+        return None
+    return entry
+
+
+def save_tuning(model_size: str, entry: dict, path: Path = TUNING_FILE) -> None:
+    """Persist the calibrated settings for a model (other models' entries are kept)."""
+    data = {}
+    try:
+        if path.exists():
+            with open(path) as f:
+                data = json.load(f)
+    except Exception:
+        data = {}
+    data[model_size] = entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def candidate_threads(cpu_count: int | None = None) -> list[int]:
+    """Thread counts worth trying: a few fixed points plus fractions of the core count."""
+    cores = cpu_count or os.cpu_count() or 4
+    candidates = {2, 4, cores // 2, (cores * 3) // 4, cores}
+    return sorted(t for t in candidates if 1 <= t <= cores)
+
+
+def calibrate(
+    model_size: str,
+    clip_path: str | None = None,
+    compute_types: tuple[str, ...] = DEFAULT_COMPUTE_TYPES,
+    thread_counts: list[int] | None = None,
+    path: Path = TUNING_FILE,
+) -> dict:
+    """
+    Benchmark a model on CPU across thread counts and compute types, and persist the fastest.
+
+    Every combination loads the model once (CTranslate2 fixes the thread pool at load
+    time), runs one warm-up decode and BENCH_RUNS timed greedy decodes of the clip.
+
+    Args:
+        model_size: Whisper model size
+        clip_path: Audio file to benchmark with (default: a synthetic speech-like clip)
+        compute_types: CTranslate2 compute types to try
+        thread_counts: Intra-op thread counts to try (default: candidate_threads())
+        path: Tuning file to update
+
+    Returns:
+        The persisted entry (fastest setting plus every measurement)
+    """
+    from .transcriber import Transcriber  # Transcriber reads this module's tuning file
+
+    audio = _load_clip(clip_path)
+    thread_counts = thread_counts or candidate_threads()
+    results = []
+    for compute_type in compute_types:
+        for threads in thread_counts:
+            try:
+                transcriber = Transcriber(
+                    model_size=model_size,
+                    device="cpu",
+                    compute_type=compute_type,
+                    cpu_threads=threads,
+                )
+            except Exception as e:
+                logger.warning(f"[CPU_TUNE] {compute_type} not usable here: {e}")
+                break  # Unsupported compute type: no point trying other thread counts
+            seconds = _time_decode(transcriber, audio)
+            del transcriber
+            results.append(
+                {"compute_type": compute_type, "cpu_threads": threads, "seconds": round(seconds, 3)}
+            )
+            logger.info(f"[CPU_TUNE] {model_size} {compute_type} x{threads}: {seconds:.2f}s")
+
+    if not results:
+        raise RuntimeError("No CPU configuration could be benchmarked")
+
+    best = min(results, key=lambda r: r["seconds"])
+    entry = {
+        "compute_type": best["compute_type"],
+        "cpu_threads": best["cpu_threads"],
+        "num_workers": 1,  # Transcriptions are serialized, extra workers only cost memory
+        "seconds": best["seconds"],
+        "rtf": round(best["seconds"] / (len(audio) / SAMPLE_RATE), 3),
+        "cpu_count": os.cpu_count(),
+        "calibrated_at": datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+    }
+    save_tuning(model_size, entry, path)
+    logger.info(
+        f"[CPU_TUNE] {model_size}: fastest is {best['compute_type']} with "
+        f"{best['cpu_threads']} threads ({best['seconds']:.2f}s)"
+    )
+    return entry
+
+
+def _time_decode(transcriber, audio: np.ndarray) -> float:
+    """Best wall time of BENCH_RUNS capped greedy decodes, after one warm-up."""
+    timings = []
+    for run in range(BENCH_RUNS + 1):
+        start = time.perf_counter()
+        segments, _ = transcriber.model.transcribe(
+            audio,
+            language="en",
+            beam_size=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            without_timestamps=True,
+            max_new_tokens=BENCH_MAX_TOKENS,
+        )
+        for _ in segments:
+            pass
+        if run > 0:
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _load_clip(clip_path: str | None) -> np.ndarray:
+    """Benchmark audio: the first BENCH_CLIP_S of a file, or a synthetic clip."""
+    if clip_path:
+        from faster_whisper import decode_audio
+
+        audio = decode_audio(str(Path(clip_path).expanduser()), sampling_rate=SAMPLE_RATE)
+        return audio[: int(BENCH_CLIP_S * SAMPLE_RATE)]
+
+    return synthetic_clip(BENCH_CLIP_S)
+
+
+def synthetic_clip(seconds: float) -> np.ndarray:
+    """Deterministic voiced-like signal: a harmonic stack with a syllable-rate envelope."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    audio = 0.2 * envelope * voice + 0.01 * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
@@ -0,0 +1,117 @@
+"""Audio input device resolution with caching."""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AudioDeviceRegistry:
+    """
+    Resolves audio device labels to PyAudio input device indexes and caches them.
+
+    Enumerating every device and fuzzy-matching on its label is slow on machines with
+    many virtual audio devices, so it only happens the first time a label is seen,
+    when a cached device has disappeared, or after invalidate() (e.g. when a stream
+    fails to open on the cached index).
+    """
+
+    # Labels that matched nothing are re-enumerated at most this often (seconds)
+    MISS_TTL_S = 30.0
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._cache: dict[str, dict] = {}  # label (lowercase) -> {"index", "name", "resolved_at"}
+        self._lock = threading.Lock()
+        self.last_resolved: dict = {
+            "label": None,
+            "index": None,
+            "name": "Default",
+            "cached": False,
+        }
+
+    def resolve(self, p, device_id: str | None, device_label: str | None) -> int | None:
+        """
+        Resolve a device label to a PyAudio input device index.
+
+        Args:
+            p: Open pyaudio.PyAudio instance used for enumeration/validation
+            device_id: Audio device ID (or 'default')
+            device_label: Audio device label for matching
+
+        Returns:
+            Device index, or None to use the system default
+        """
+        if not ((device_id and device_id != "default") or device_label):
+            self.last_resolved = {"label": None, "index": None, "name": "Default", "cached": False}
+            return None
+
+        key = (device_label or "").lower()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and self._is_fresh(p, entry):
+                self.last_resolved = {"label": device_label, **self._public(entry), "cached": True}
+                return entry["index"]
+
+            logger.info(f"Looking for audio device: ID={device_id}, Label={device_label}")
+            entry = self._enumerate(p, key)
+            self._cache[key] = entry
+            self.last_resolved = {"label": device_label, **self._public(entry), "cached": False}
+            return entry["index"]
+
+    def invalidate(self, device_label: str | None = None) -> None:
+        """Forget cached resolutions (one label, or all when no label is given)."""
+        with self._lock:
+            if device_label is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(device_label.lower(), None)
+        logger.info(f"Audio device cache invalidated ({device_label or 'all devices'})")
+
+    def status(self) -> dict:
+        """Return the most recent resolution (for the 'status' IPC command)."""
+        return dict(self.last_resolved)
+
+    def _is_fresh(self, p, entry: dict) -> bool:
+        """Check a cached entry without a full enumeration."""
+        if entry["index"] is None:
+            # A miss: retry enumeration periodically in case the device was plugged in
+            return time.time() - entry["resolved_at"] < self.MISS_TTL_S
+        try:
+            info = p.get_device_info_by_index(entry["index"])
+            return info.get("name") == entry["name"] and info.get("maxInputChannels", 0) > 0
+        except Exception:
+            logger.info(f"Cached audio device '{entry['name']}' is missing, re-enumerating")
+            return False
+
+    def _enumerate(self, p, key: str) -> dict:
+        """Walk the input devices of host API 0 and fuzzy-match the label."""
+        entry = {"index": None, "name": "Default", "resolved_at": time.time()}
+        try:
+            info = p.get_host_api_info_by_index(0)
+            numdevices = info.get("deviceCount")
+
+            for i in range(0, numdevices):
+                device_info = p.get_device_info_by_host_api_device_index(0, i)
+                if device_info.get("maxInputChannels") > 0:
+                    dev_name = device_info.get("name")
+                    # Match against label if provided (fuzzy match)
+                    if key and key in dev_name.lower():
+                        index = device_info.get("index", i)
+                        logger.info(
+                            f"Found matching device by label: '{dev_name}' (Index: {index})"
+                        )
+                        entry.update({"index": index, "name": dev_name})
+                        return entry
+
+            logger.warning(
+                f"Device not found, falling back to default. Available devices checked: {numdevices}"
+            )
+        except Exception as e:
+            logger.warning(f"Warning: Error enumerating devices (falling back to default): {e}")
+        return entry
+
+    def _public(self, entry: dict) -> dict:
+        """Strip internal bookkeeping from a cache entry."""
+        return {"index": entry["index"], "name": entry["name"]}
@@ -0,0 +1,176 @@
+"""Shared HTTP transport: pooled keep-alive connections for every LLM processor."""
+
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Hosts that keep a connection pool (Ollama, one or two cloud providers, the trial proxy)
+DEFAULT_POOL_CONNECTIONS = 8
+# Connections kept open per host (concurrent refine/ask/dictation requests)
+DEFAULT_POOL_MAXSIZE = 4
+# A host used this recently still has an open connection; prewarm() leaves it alone.
+# Below the ~60s idle timeout of typical provider load balancers
+WARM_TTL_S = 30.0
+PREWARM_TIMEOUT_S = 5.0
+
+_transport: "HttpTransport | None" = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> "HttpTransport":
+    """Return the process-wide transport (created on first use)."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class HttpTransport:
+    """
+    One requests.Session with per-host connection pools, shared by all processors.
+
+    A fresh requests.post() opens a new TCP connection (and TLS session) for every
+    call, which costs 100-300 ms per dictation against a cloud provider. Here every
+    processor sends through the same session, so a request reuses the idle
+    keep-alive connection the previous one left in its host's pool.
+
+    prewarm() opens a connection to a host ahead of the first request, and re-opens
+    it once it has been idle long enough for the server to have dropped it.
+    stats() reports per-host request and connection counts for the 'status' command.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            pool_connections: Number of hosts that keep a connection pool
+            pool_maxsize: Connections kept open per host
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.prewarms = 0
+        self._last_used: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {"Connection": "keep-alive", "Keep-Alive": "timeout=60, max=100"}
+        )
+        self.session.hooks["response"].append(self._on_response)
+        self._mount()
+        logger.info(
+            f"[HTTP] Shared transport created ({pool_connections} host pools x "
+            f"{pool_maxsize} connections, keep-alive)"
+        )
+
+    def configure(self, pool_connections: int | None = None, pool_maxsize: int | None = None):
+        """
+        Resize the connection pools. Open connections are dropped if anything changes.
+
+        Args:
+            pool_connections: Number of hosts that keep a connection pool
+            pool_maxsize: Connections kept open per host
+        """
+        pool_connections = int(pool_connections or self.pool_connections)
+        pool_maxsize = int(pool_maxsize or self.pool_maxsize)
+        if (pool_connections, pool_maxsize) == (self.pool_connections, self.pool_maxsize):
+            return
+        self.pool_connections, self.pool_maxsize = pool_connections, pool_maxsize
+        old_adapters = set(self.session.adapters.values())
+        self._mount()
+        for adapter in old_adapters:
+            adapter.close()
+        with self._lock:
+            self._last_used.clear()
+        logger.info(f"[HTTP] Pools resized to {pool_connections} hosts x {pool_maxsize}")
+
+    def prewarm(self, url: str) -> bool:
+        """
+        Open a connection to the host of `url` in the background, unless one is warm.
+
+        Args:
+            url: Any URL on the host (only scheme and host are used)
+
+        Returns:
+            True if a connection is being opened, False if the host is already warm
+        """
+        origin = _origin(url)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_used.get(origin, float("-inf")) < WARM_TTL_S:
+                return False
+            self._last_used[origin] = now  # Claimed: no second prewarm while this one runs
+            self.prewarms += 1
+        threading.Thread(target=self._open, args=(origin,), daemon=True).start()
+        return True
+
+    def stats(self) -> dict:
+        """Per-host connection reuse for the 'status' IPC command."""
+        hosts = {}
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue  # Evicted meanwhile
+                origin = f"{pool.scheme}://{pool.host}:{pool.port}"
+                hosts[origin] = {
+                    "requests": pool.num_requests,
+                    "connections": pool.num_connections,
+                    "reused": max(0, pool.num_requests - pool.num_connections),
+                    # The queue is padded with None up to pool_maxsize
+                    "idle": sum(1 for conn in list(pool.pool.queue) if conn) if pool.pool else 0,
+                }
+        total_requests = sum(h["requests"] for h in hosts.values())
+        total_reused = sum(h["reused"] for h in hosts.values())
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "prewarms": self.prewarms,
+            "reuse_rate": round(total_reused / total_requests, 3) if total_requests else None,
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def _mount(self) -> None:
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _on_response(self, response: requests.Response, *args, **kwargs) -> None:
+        with self._lock:
+            self._last_used[_origin(response.url)] = time.monotonic()
+
+    def _open(self, origin: str) -> None:
+        t0 = time.perf_counter()
+        try:
+            # Any status will do: the point is the TCP/TLS connection left in the pool
+            with self.session.head(origin, timeout=PREWARM_TIMEOUT_S, allow_redirects=False):
+                pass
+            logger.info(f"[HTTP] Prewarmed {origin} in {(time.perf_counter() - t0) * 1000:.0f}ms")
+        except Exception as e:
+            with self._lock:
+                self._last_used.pop(origin, None)  # Let the next prewarm try again
+            logger.debug(f"[HTTP] Prewarm of {origin} failed: {e}")
@@ -136,6 +136,31 @@ class Injector:
             # self._type_fallback(text)
             raise
 
+    def replace_last(self, previous: str, text: str) -> None:
+        """
+        Replace text this injector just pasted, in place.
+
+        Selects the previous paste (and its trailing space) backwards with Shift+Left,
+        then pastes the new text over the selection. Only valid while the cursor is
+        still right after the previous paste.
+
+        Args:
+            previous: Text of the previous paste (without the trailing space)
+            text: Replacement text
+        """
+        try:
+            count = len(previous) + (1 if self.add_trailing_space else 0)
+            logger.info(f"Replacing last paste ({count} characters)...")
+            with self.keyboard.pressed(Key.shift):
+                for _ in range(count):
+                    self.keyboard.press(Key.left)
+                    self.keyboard.release(Key.left)
+            time.sleep(0.02)  # Let the app apply the selection before pasting over it
+            self.paste_text(text)
+        except Exception as e:
+            logger.error(f"Error replacing text: {e}")
+            raise
+
     def press_key(self, key_name: str) -> None:
         """
         Press a single key using keyboard simulation.
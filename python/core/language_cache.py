@@ -0,0 +1,135 @@
+"""Sticky spoken-language cache so Whisper doesn't re-detect the language on every clip."""
+
+import getpass
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class LanguageCache:
+    """
+    Remembers the last detected language per user and input device.
+
+    In auto-translate mode every clip used to be transcribed with language=None,
+    making Whisper run language detection each time - a noticeable share of the
+    decode on short clips. A confident detection is reused for the following
+    clips; detection runs again when the last result was not confident enough,
+    after REDETECT_EVERY reuses, or once the entry is older than MAX_AGE_S.
+    Entries persist in ~/.diktate/language_cache.json across restarts.
+    """
+
+    # Detections below this probability are not reused
+    MIN_PROBABILITY = 0.8
+    # Re-detect after this many clips reused the cached language
+    REDETECT_EVERY = 20
+    # Re-detect once the cached detection is this old
+    MAX_AGE_S = 6 * 3600
+
+    def __init__(self, path: Path | None = None):
+        """
+        Initialize the cache, loading persisted entries.
+
+        Args:
+            path: Cache file (default: ~/.diktate/language_cache.json)
+        """
+        self.path = path or Path.home() / ".diktate" / "language_cache.json"
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(device_label: str | None) -> str:
+        """Cache key for the current OS user and an input device."""
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = "unknown"
+        return f"{user}|{(device_label or 'default').lower()}"
+
+    def lookup(self, key: str) -> str | None:
+        """
+        Return the cached language if it can be reused, counting the reuse.
+
+        Args:
+            key: Cache key (see key_for)
+
+        Returns:
+            Language code, or None if the language should be detected again
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.get("probability", 0.0) < self.MIN_PROBABILITY
+                or entry.get("uses", 0) >= self.REDETECT_EVERY
+                or time.time() - entry.get("detected_at", 0.0) > self.MAX_AGE_S
+            ):
+                self.misses += 1
+                return None
+            entry["uses"] = entry.get("uses", 0) + 1
+            self.hits += 1
+            return entry["language"]
+
+    def update(self, key: str, language: str, probability: float) -> None:
+        """
+        Store a fresh detection and persist the cache.
+
+        Args:
+            key: Cache key (see key_for)
+            language: Detected language code
+            probability: Detection probability (0-1)
+        """
+        with self._lock:
+            self._entries[key] = {
+                "language": language,
+                "probability": round(float(probability), 3),
+                "detected_at": time.time(),
+                "uses": 0,
+            }
+        self._save()
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Forget one entry (or all entries), forcing detection on the next clip."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        self._save()
+
+    def status(self) -> dict:
+        """Cache contents and hit counts for the 'status' IPC command."""
+        with self._lock:
+            return {
+                "entries": {k: dict(v) for k, v in self._entries.items()},
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _load(self) -> dict:
+        """Read persisted entries, ignoring a missing or corrupt file."""
+        try:
+            if self.path.exists():
+                with open(self.path) as f:
+                    data = json.load(f)
+                    if isinstance(data, dict):
+                        return data
+        except Exception as e:
+            logger.warning(f"[LANG] Could not read language cache: {e}")
+        return {}
+
+    def _save(self) -> None:
+        """Write entries to disk (best-effort)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                data = json.dumps(self._entries, indent=2)
+            with open(self.path, "w") as f:
+                f.write(data)
+        except Exception as e:
+            logger.warning(f"[LANG] Could not save language cache: {e}")
@@ -0,0 +1,170 @@
+"""Incremental transcription of a recording while it is still being captured."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from .silence_trim import trim_silence
+
+logger = logging.getLogger(__name__)
+
+
+class LiveTranscriber:
+    """
+    Transcribes the growing capture buffer in the background during recording.
+
+    Every `interval_s` the uncommitted part of the recording is decoded. Segments
+    that end well before the current end of the buffer are treated as stable: their
+    text is committed and the window start moves past them, so each decode only
+    covers the last few seconds of speech. Results are reported through `emit` as
+    `partial-transcript` events. When recording stops, finalize() decodes only the
+    remaining uncommitted window instead of the whole recording.
+    """
+
+    # Segments ending this close to the end of the buffer may still change
+    COMMIT_MARGIN_S = 1.0
+    # Past this window length, commit everything but the last segment regardless
+    MAX_WINDOW_S = 20.0
+    # Don't bother decoding less audio than this
+    MIN_WINDOW_S = 1.0
+    # Trailing context kept when a fully silent window is skipped
+    SILENCE_KEEP_S = 0.5
+    # Committed text passed to Whisper as the prompt for the next window
+    PROMPT_CHARS = 200
+
+    def __init__(
+        self,
+        transcriber,
+        recorder,
+        emit: Callable[[str, dict], None],
+        language: str | None = None,
+        interval_s: float = 2.0,
+        profile: str | None = None,
+    ):
+        """
+        Initialize the live transcriber.
+
+        Args:
+            transcriber: Loaded Transcriber (shared with the pipelines)
+            recorder: Recorder whose capture buffer is being filled
+            emit: Event callback (IpcServer._emit_event)
+            language: Language code for Whisper (None for auto-detection)
+            interval_s: Seconds between background decodes
+            profile: Decoding profile for the final tail decode (partials always use instant)
+        """
+        self.transcriber = transcriber
+        self.recorder = recorder
+        self.emit = emit
+        self.language = language
+        self.interval_s = interval_s
+        self.profile = profile
+        self.sample_rate = recorder.sample_rate
+
+        self.committed_samples = 0  # Samples of the recording covered by committed text
+        self.committed_segments: list[str] = []
+        self.decodes = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def committed_text(self) -> str:
+        """Text of all committed segments."""
+        return " ".join(self.committed_segments).strip()
+
+    def start(self) -> None:
+        """Start the background worker."""
+        self._thread = threading.Thread(target=self._run, daemon=True, name="LiveTranscriber")
+        self._thread.start()
+        logger.info(f"[LIVE] Live transcription started (every {self.interval_s:.1f}s)")
+
+    def stop(self) -> None:
+        """Stop the worker, waiting for a decode in progress to finish."""
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join()
+        self._thread = None
+
+    def finalize(self, tail: np.ndarray | None) -> str:
+        """
+        Decode the uncommitted tail of the recording and return the full transcript.
+
+        Args:
+            tail: Samples after committed_samples (None/empty if nothing left to decode)
+
+        Returns:
+            Committed text followed by the tail transcription
+        """
+        self.stop()
+        parts = list(self.committed_segments)
+        if tail is not None and len(tail) > 0:
+            segments = self.transcriber.transcribe_segments(
+                tail, language=self.language, initial_prompt=self._prompt(), profile=self.profile
+            )
+            parts.extend(segment.text for segment in segments)
+        logger.info(
+            f"[LIVE] Finalized: {len(self.committed_segments)} committed segment(s), "
+            f"{len(tail) / self.sample_rate if tail is not None else 0:.2f}s tail, "
+            f"{self.decodes} background decode(s)"
+        )
+        return " ".join(parts).strip()
+
+    def _run(self) -> None:
+        """Worker loop: decode the uncommitted window every interval."""
+        while not self._stop.wait(self.interval_s):
+            try:
+                self._decode_window()
+            except Exception as e:
+                # Live results are best-effort; finalize() still covers the whole tail
+                logger.warning(f"[LIVE] Partial transcription failed: {e}")
+
+    def _decode_window(self) -> None:
+        """Decode the current window, commit stable segments and emit the partial."""
+        audio = self.recorder.get_audio(start_frame=self.committed_samples)
+        window_s = len(audio) / self.sample_rate
+        if window_s < self.MIN_WINDOW_S or self._stop.is_set():
+            return
+
+        trimmed, _ = trim_silence(audio, self.sample_rate)
+        if len(trimmed) == 0:
+            # Nothing said yet: skip ahead so the silence is never decoded
+            self.committed_samples += max(
+                0, len(audio) - int(self.SILENCE_KEEP_S * self.sample_rate)
+            )
+            return
+
+        t0 = time.perf_counter()
+        segments = self.transcriber.transcribe_segments(
+            audio, language=self.language, initial_prompt=self._prompt(), profile="instant"
+        )
+        self.decodes += 1
+
+        stable_until = window_s - self.COMMIT_MARGIN_S
+        force = window_s >= self.MAX_WINDOW_S
+        pending = list(segments)
+        advanced = 0.0
+        while len(pending) > 1 and (force or pending[0].end <= stable_until):
+            segment = pending.pop(0)
+            self.committed_segments.append(segment.text)
+            advanced = segment.end
+        self.committed_samples += int(advanced * self.sample_rate)
+
+        pending_text = " ".join(segment.text for segment in pending).strip()
+        logger.debug(
+            f"[LIVE] Decoded {window_s:.1f}s window in {(time.perf_counter() - t0) * 1000:.0f}ms"
+        )
+        self.emit(
+            "partial-transcript",
+            {
+                "text": f"{self.committed_text} {pending_text}".strip(),
+                "committed": self.committed_text,
+                "pending": pending_text,
+            },
+        )
+
+    def _prompt(self) -> str | None:
+        """Recent committed text, used to keep Whisper consistent across windows."""
+        text = self.committed_text
+        return text[-self.PROMPT_CHARS :] if text else None
@@ -0,0 +1,242 @@
+"""Parallel long-form transcription: silence-aligned chunks decoded in a process pool."""
+
+import logging
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import psutil
+
+from .model_pool import TranscriberPool
+from .silence_trim import FRAME_MS
+from .transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+# Chunk length bounds; within them chunks are sized so every worker gets work
+MIN_CHUNK_S = 30.0
+MAX_CHUNK_S = 120.0
+# A cut is placed at the quietest point this close to the target chunk end
+CUT_SEARCH_S = 8.0
+# Energy is smoothed over this window so a cut lands in a pause, not between syllables
+CUT_SMOOTH_MS = 300
+# Smoothed level (dBFS) below which a candidate cut point counts as a pause
+CUT_THRESHOLD_DB = -45.0
+# Each worker gets at least this many CTranslate2 threads
+MIN_THREADS_PER_WORKER = 2
+# Share of the available memory the worker models may use
+MEMORY_HEADROOM = 0.8
+
+# Per-process model of a pool worker (set by _init_worker)
+_worker_transcriber: Transcriber | None = None
+
+
+def plan_workers(model_size: str, max_workers: int | None = None) -> tuple[int, int]:
+    """
+    Size the process pool to the machine: by cores, then by available memory.
+
+    Args:
+        model_size: Whisper model size (each worker loads its own int8 copy)
+        max_workers: Upper bound on the worker count (default: no bound)
+
+    Returns:
+        (worker count, CTranslate2 threads per worker)
+    """
+    cores = os.cpu_count() or 2
+    workers = max(1, cores // MIN_THREADS_PER_WORKER)
+    model_gb = TranscriberPool.MODEL_SIZE_GB.get(model_size, 1.0)
+    available_gb = psutil.virtual_memory().available / 1024**3
+    workers = min(workers, max(1, int(available_gb * MEMORY_HEADROOM / model_gb)))
+    if max_workers:
+        workers = min(workers, max(1, int(max_workers)))
+    return workers, max(1, cores // workers)
+
+
+def split_on_silence(
+    audio: np.ndarray,
+    chunk_s: float,
+    sample_rate: int = SAMPLE_RATE,
+    threshold_db: float = CUT_THRESHOLD_DB,
+) -> list[tuple[int, int]]:
+    """
+    Split a recording into chunks of about `chunk_s`, cutting in pauses.
+
+    Each cut is placed at the quietest point (smoothed frame energy) within
+    CUT_SEARCH_S of the target boundary, preferring frames below `threshold_db`, so
+    no word is split between two chunks.
+
+    Args:
+        audio: 1-D float32 samples
+        chunk_s: Target chunk length in seconds
+        sample_rate: Sample rate in Hz
+        threshold_db: Frame level (dBFS) below which a frame counts as silence
+
+    Returns:
+        (start, end) sample ranges covering the whole recording, in order
+    """
+    total = len(audio)
+    frame_len = max(1, int(sample_rate * FRAME_MS / 1000))
+    n_frames = total // frame_len
+    chunk_frames = max(1, int(chunk_s * 1000 / FRAME_MS))
+    if n_frames <= chunk_frames + chunk_frames // 2:
+        return [(0, total)]
+
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    smooth = max(1, CUT_SMOOTH_MS // FRAME_MS)
+    rms = np.convolve(rms, np.ones(smooth) / smooth, mode="same")
+    level_db = 20.0 * np.log10(rms + 1e-10)
+    search = int(CUT_SEARCH_S * 1000 / FRAME_MS)
+
+    bounds = []
+    start = 0
+    while n_frames - start > chunk_frames + chunk_frames // 2:
+        target = start + chunk_frames
+        lo, hi = max(start + 1, target - search), min(n_frames - 1, target + search)
+        window = level_db[lo:hi]
+        silent = np.flatnonzero(window < threshold_db)
+        if len(silent):
+            # A pause in range: cut at the silent frame closest to the target
+            cut = lo + int(silent[np.argmin(np.abs(silent + lo - target))])
+        else:
+            cut = lo + int(np.argmin(window))
+        bounds.append((start * frame_len, cut * frame_len))
+        start = cut
+    bounds.append((start * frame_len, total))
+    return bounds
+
+
+def _init_worker(model_size: str, cpu_threads: int) -> None:
+    """Load this worker's own CPU model (runs once per pool process)."""
+    global _worker_transcriber
+    _worker_transcriber = Transcriber(model_size=model_size, device="cpu", cpu_threads=cpu_threads)
+
+
+def _transcribe_chunk(audio: np.ndarray, language: str | None, profile: str | None) -> str:
+    """Decode one chunk with the worker's model."""
+    return _worker_transcriber.transcribe_array(audio, language=language, profile=profile)
+
+
+class LongFormTranscriber:
+    """
+    Transcribes long recordings by decoding silence-aligned chunks in parallel.
+
+    A single Whisper decode of a 10-minute note walks its 30s windows one after
+    another and leaves most cores of a large machine idle, while CTranslate2's own
+    threading stops scaling well past a few threads per decode. Here the recording is
+    cut in pauses into chunks that are decoded by a pool of worker processes, each
+    with its own CPU model instance, and the texts are joined in order.
+
+    The workers load their models on first use and are shut down after
+    IDLE_SHUTDOWN_S without long-form work, since every worker holds a full model.
+    """
+
+    IDLE_SHUTDOWN_S = 600.0
+
+    def __init__(self, model_size: str, max_workers: int | None = None):
+        """
+        Initialize the long-form transcriber (no worker is started yet).
+
+        Args:
+            model_size: Whisper model size for the worker models
+            max_workers: Upper bound on the worker count (default: sized to the machine)
+        """
+        self.model_size = model_size
+        self.max_workers = max_workers
+        self.workers, self.cpu_threads = plan_workers(model_size, max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._idle_timer: threading.Timer | None = None
+
+    def transcribe(
+        self, audio: np.ndarray, language: str | None = None, profile: str | None = None
+    ) -> str:
+        """
+        Transcribe a 16 kHz recording chunk by chunk across the worker pool.
+
+        Chunks are decoded independently, so pass a language: auto-detection per
+        chunk could pick different languages for different parts of the note.
+
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            language: Language code (None for per-chunk auto-detection)
+            profile: Decoding profile name (see Transcriber.DECODING_PROFILES)
+
+        Returns:
+            The chunk texts joined in recording order
+        """
+        duration_s = len(audio) / SAMPLE_RATE
+        chunk_s = min(MAX_CHUNK_S, max(MIN_CHUNK_S, duration_s / self.workers))
+        bounds = split_on_silence(audio, chunk_s)
+        chunks = [audio[start:end] for start, end in bounds]
+
+        t0 = time.perf_counter()
+        with self._lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+            executor = self._get_executor()
+            try:
+                texts = list(
+                    executor.map(
+                        _transcribe_chunk,
+                        chunks,
+                        [language] * len(chunks),
+                        [profile] * len(chunks),
+                    )
+                )
+            except Exception:
+                self._shutdown_executor()  # A crashed worker breaks the whole pool
+                raise
+            finally:
+                self._schedule_idle_shutdown()
+
+        logger.info(
+            f"[LONGFORM] {duration_s:.0f}s in {len(chunks)} chunk(s) on {self.workers} "
+            f"worker(s) x{self.cpu_threads} threads: {time.perf_counter() - t0:.1f}s"
+        )
+        return " ".join(text.strip() for text in texts if text and text.strip())
+
+    def status(self) -> dict:
+        """Pool sizing and state for the 'status' IPC command."""
+        return {
+            "model": self.model_size,
+            "workers": self.workers,
+            "cpu_threads": self.cpu_threads,
+            "running": self._executor is not None,
+        }
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+            self._shutdown_executor()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(
+                f"[LONGFORM] Starting {self.workers} worker(s) with {self.model_size} "
+                f"({self.cpu_threads} threads each)"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=mp.get_context("spawn"),  # No forked copies of the server's threads
+                initializer=_init_worker,
+                initargs=(self.model_size, self.cpu_threads),
+            )
+        return self._executor
+
+    def _schedule_idle_shutdown(self) -> None:
+        self._idle_timer = threading.Timer(self.IDLE_SHUTDOWN_S, self.close)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _shutdown_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("[LONGFORM] Workers stopped")
@@ -0,0 +1,337 @@
+"""Pool of loaded Whisper models with background loading and LRU eviction."""
+
+import gc
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+from .transcriber import Transcriber
+from .transcription_worker import RemoteTranscriber
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriberPool:
+    """
+    Keeps loaded Transcribers keyed by (model, device, compute_type).
+
+    Switching models through `configure` used to construct a new Transcriber on the
+    command thread, blocking dictation for the whole load. With the pool, a model
+    that was loaded before is reused instantly, and a new one loads on a background
+    thread while the current model keeps serving dictation; the caller swaps it in
+    (a single reference assignment) once it is ready. Idle models are evicted
+    least-recently-used first when the pool exceeds its memory budget. Models on the
+    GPU have their own budget, which is zero by default: VRAM is usually much smaller
+    than RAM, so an idle CUDA model is evicted as soon as another becomes active.
+
+    With `out_of_process`, every pooled model runs in its own worker process
+    (RemoteTranscriber) so inference never competes with the IPC threads.
+    """
+
+    # Approximate resident size of each model with int8 weights (GB)
+    MODEL_SIZE_GB = {
+        "tiny": 0.1,
+        "base": 0.15,
+        "small": 0.35,
+        "medium": 0.9,
+        "large": 1.7,
+        "turbo": 0.9,
+    }
+    # Size multiplier for non-int8 compute types (int8_float16 etc. keep int8 weights)
+    COMPUTE_FACTOR = {"float16": 2.0, "bfloat16": 2.0, "float32": 4.0}
+
+    def __init__(
+        self,
+        budget_gb: float = 4.0,
+        gpu_budget_gb: float = 0.0,
+        out_of_process: bool = False,
+        worker_log_file: Path | None = None,
+        warmup: bool = True,
+    ):
+        """
+        Initialize an empty pool.
+
+        Args:
+            budget_gb: Memory budget for pooled models on the CPU (the active model is
+                always kept)
+            gpu_budget_gb: Memory budget for pooled models on the GPU (0: keep only the
+                active and pinned models loaded)
+            out_of_process: Load models in dedicated transcription worker processes
+            worker_log_file: Log file for the worker processes
+            warmup: Run Transcriber.warmup() on every newly loaded model
+        """
+        self.budget_gb = budget_gb
+        self.gpu_budget_gb = gpu_budget_gb
+        self.out_of_process = out_of_process
+        self.worker_log_file = worker_log_file
+        self.warmup = warmup
+        self._models: OrderedDict[tuple, Transcriber] = OrderedDict()  # LRU order, newest last
+        self._loading: set[tuple] = set()
+        self._lock = threading.Lock()
+        self.active_key: tuple | None = None
+        self.requested_key: tuple | None = None
+        # Models kept loaded next to the active one (e.g. the cascade draft model)
+        self.pinned: set[tuple] = set()
+
+    @staticmethod
+    def key_for(model_size: str, device: str = "auto", compute_type: str | None = None) -> tuple:
+        """Pool key for a model configuration."""
+        return (model_size, device, compute_type or "default")
+
+    def estimate_gb(self, key: tuple) -> float:
+        """Estimated memory footprint of a pooled model, by the compute type it loaded with."""
+        model_size, _, compute_type = key
+        # The key says "default" unless a compute type was configured
+        loaded = self._models.get(key)
+        compute_type = getattr(loaded, "resolved_compute_type", None) or compute_type
+        factor = self.COMPUTE_FACTOR.get(compute_type, 1.0)
+        return self.MODEL_SIZE_GB.get(model_size, 1.0) * factor
+
+    def get(self, key: tuple) -> Transcriber | None:
+        """Return a loaded model (marking it most recently used), or None."""
+        with self._lock:
+            transcriber = self._models.get(key)
+            if transcriber is not None:
+                self._models.move_to_end(key)
+            return transcriber
+
+    def load(
+        self, model_size: str, device: str = "auto", compute_type: str | None = None
+    ) -> Transcriber:
+        """
+        Return the model for this configuration, loading it on the calling thread if needed.
+
+        The returned model becomes the active one (never evicted).
+        """
+        key = self.key_for(model_size, device, compute_type)
+        self.requested_key = key
+        transcriber = self.get(key)
+        if transcriber is None:
+            transcriber = self._create(model_size, device, compute_type)
+            self._add(key, transcriber)
+        self.activate(key)
+        return transcriber
+
+    def acquire(
+        self,
+        model_size: str,
+        device: str = "auto",
+        compute_type: str | None = None,
+        on_ready: Callable[[Transcriber], None] | None = None,
+        activate: bool = True,
+    ) -> Transcriber | None:
+        """
+        Return the pooled model if it is loaded; otherwise load it in the background.
+
+        Args:
+            model_size: Whisper model size
+            device: Device to use ('cuda', 'cpu', or 'auto')
+            compute_type: CTranslate2 compute type (None for the Transcriber default)
+            on_ready: Called with the new Transcriber once a background load finishes,
+                      unless a different model has been requested in the meantime
+            activate: Make it the active model; False loads a secondary model (see
+                      `pinned`) without touching the active/requested model
+
+        Returns:
+            The loaded Transcriber, or None if a background load was started
+        """
+        key = self.key_for(model_size, device, compute_type)
+        if activate:
+            self.requested_key = key
+        transcriber = self.get(key)
+        if transcriber is not None:
+            if activate:
+                self.activate(key)
+            return transcriber
+
+        with self._lock:
+            if key in self._loading:
+                return None  # Already loading; the latest request wins on completion
+            self._loading.add(key)
+
+        def worker():
+            try:
+                loaded = self._create(model_size, device, compute_type)
+                self._add(key, loaded)
+                if activate and self.requested_key != key:
+                    logger.info(f"[POOL] {model_size} loaded but no longer requested, kept idle")
+                    self._enforce_budget()
+                    return
+                if activate:
+                    self.activate(key)
+                else:
+                    self._enforce_budget()
+                if on_ready:
+                    on_ready(loaded)
+            except Exception as e:
+                logger.error(f"[POOL] Background load of {model_size} failed: {e}")
+            finally:
+                with self._lock:
+                    self._loading.discard(key)
+
+        logger.info(f"[POOL] Loading {model_size} in the background (current model stays active)")
+        threading.Thread(target=worker, daemon=True, name=f"ModelLoad-{model_size}").start()
+        return None
+
+    def reload(
+        self,
+        model_size: str,
+        device: str = "auto",
+        compute_type: str | None = None,
+        on_ready: Callable[[Transcriber], None] | None = None,
+    ) -> None:
+        """
+        Load a fresh instance of a pooled model in the background and replace the old one.
+
+        Used when load-time settings changed (e.g. after CPU calibration). The old
+        instance stays pooled and keeps serving until the new one has loaded; it is then
+        replaced (on_ready is called if the model is the active one) and released. If the
+        load fails, the old instance stays. Skipped if the model is already loading.
+        """
+        key = self.key_for(model_size, device, compute_type)
+        with self._lock:
+            if key in self._loading:
+                logger.info(f"[POOL] {model_size} is already loading, reload skipped")
+                return
+            self._loading.add(key)
+
+        def worker():
+            try:
+                loaded = self._create(model_size, device, compute_type)
+            except Exception as e:
+                logger.error(f"[POOL] Reload of {model_size} failed, keeping old instance: {e}")
+                return
+            finally:
+                with self._lock:
+                    self._loading.discard(key)
+            with self._lock:
+                old = self._models.pop(key, None)
+            self._add(key, loaded)
+            if key == self.active_key:
+                self.activate(key)
+                if on_ready:
+                    on_ready(loaded)
+            else:
+                self._enforce_budget()
+            self._release(old)
+            logger.info(f"[POOL] Reloaded {model_size}")
+
+        threading.Thread(target=worker, daemon=True, name=f"ModelReload-{model_size}").start()
+
+    def activate(self, key: tuple) -> None:
+        """Mark a pooled model as the active one and evict idle models over budget."""
+        with self._lock:
+            self.active_key = key
+            if key in self._models:
+                self._models.move_to_end(key)
+        self._enforce_budget()
+
+    def drop(self, key: tuple) -> None:
+        """Remove a model from the pool (e.g. to force a clean reload)."""
+        with self._lock:
+            transcriber = self._models.pop(key, None)
+        if transcriber is not None:
+            self._release(transcriber)
+            del transcriber
+            gc.collect()
+            logger.info(f"[POOL] Dropped {key[0]}")
+
+    def set_budget(
+        self, budget_gb: float | None = None, gpu_budget_gb: float | None = None
+    ) -> None:
+        """Change the CPU and/or GPU memory budget, evicting idle models if needed."""
+        if budget_gb is not None:
+            self.budget_gb = budget_gb
+        if gpu_budget_gb is not None:
+            self.gpu_budget_gb = gpu_budget_gb
+        self._enforce_budget()
+
+    def status(self) -> dict:
+        """Pool contents for the 'status' IPC command."""
+        with self._lock:
+            status = {
+                "loaded": [key[0] for key in self._models],
+                "loading": [key[0] for key in self._loading],
+                "active": self.active_key[0] if self.active_key else None,
+                "used_gb": round(sum(self.estimate_gb(k) for k in self._models), 2),
+                "budget_gb": self.budget_gb,
+                "gpu_budget_gb": self.gpu_budget_gb,
+                "out_of_process": self.out_of_process,
+            }
+            models = list(self._models.items())
+        if self.out_of_process:
+            status["workers"] = {key[0]: t.health() for key, t in models}
+        return status
+
+    def close(self) -> None:
+        """Remove every model, stopping their worker processes."""
+        with self._lock:
+            models = list(self._models.values())
+            self._models.clear()
+            self.active_key = None
+        self._release(*models)
+
+    def _create(
+        self, model_size: str, device: str, compute_type: str | None
+    ) -> Transcriber | RemoteTranscriber:
+        """Load a model in this process or in a new transcription worker, then warm it up."""
+        if self.out_of_process:
+            transcriber = RemoteTranscriber(
+                model_size=model_size,
+                device=device,
+                compute_type=compute_type,
+                log_file=self.worker_log_file,
+            )
+        else:
+            transcriber = Transcriber(
+                model_size=model_size, device=device, compute_type=compute_type
+            )
+        if self.warmup:
+            try:
+                transcriber.warmup()
+            except Exception as e:
+                logger.warning(f"[POOL] Warm-up decode of {model_size} failed (non-fatal): {e}")
+        return transcriber
+
+    @staticmethod
+    def _release(*transcribers) -> None:
+        """Stop the worker processes of removed models (in-process models are freed by GC)."""
+        for transcriber in transcribers:
+            if isinstance(transcriber, RemoteTranscriber):
+                transcriber.close()
+
+    def _add(self, key: tuple, transcriber: Transcriber) -> None:
+        """Insert a loaded model as most recently used."""
+        with self._lock:
+            self._models[key] = transcriber
+            self._models.move_to_end(key)
+
+    def _on_gpu(self, key: tuple) -> bool:
+        """Whether a pooled model was loaded on CUDA."""
+        return getattr(self._models.get(key), "resolved_device", None) == "cuda"
+
+    def _enforce_budget(self) -> None:
+        """Evict least-recently-used idle models until CPU and GPU models fit their budgets."""
+        evicted = []
+        with self._lock:
+            budget = {False: self.budget_gb, True: self.gpu_budget_gb}
+            used = {False: 0.0, True: 0.0}
+            for key in self._models:
+                used[self._on_gpu(key)] += self.estimate_gb(key)
+            for key in list(self._models):
+                gpu = self._on_gpu(key)
+                if used[gpu] <= budget[gpu] or key == self.active_key or key in self.pinned:
+                    continue
+                used[gpu] -= self.estimate_gb(key)
+                evicted.append((key, self._models.pop(key)))
+        self._release(*(transcriber for _, transcriber in evicted))
+        evicted = [key for key, _ in evicted]  # Drop the last references before collecting
+        if evicted:
+            gc.collect()  # Release the evicted models' memory now, not at some later GC
+            logger.info(
+                f"[POOL] Evicted {', '.join(k[0] for k in evicted)} "
+                f"(in use: {used[False]:.1f}/{self.budget_gb:.1f}GB RAM, "
+                f"{used[True]:.1f}/{self.gpu_budget_gb:.1f}GB VRAM)"
+            )
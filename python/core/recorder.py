@@ -2,12 +2,17 @@
 
 import logging
 import os
+import threading
 import time
 import wave
 from collections.abc import Callable
 
+import numpy as np
 import pyaudio
 
+from .audio_buffer import AudioBuffer, PreRollBuffer
+from .device_registry import AudioDeviceRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,12 +40,31 @@ class Recorder:
         self.chunk_size = chunk_size
         self.temp_dir = temp_dir
         self.is_recording = False
-        self.audio_data = []
+        self.audio_data = AudioBuffer(sample_rate=sample_rate, channels=channels)
         self.p: pyaudio.PyAudio | None = None
         self.stream: pyaudio.Stream | None = None
         self.max_duration = 0  # seconds, 0 = unlimited
         self.start_time = 0
+        self._max_frames = 0  # max_duration in frames, 0 = unlimited
         self.auto_stop_callback: Callable | None = None
+        self.device_registry = AudioDeviceRegistry()  # Label -> index cache, kept across recordings
+
+        # Warm input mode: keep the stream open between dictations and fill a pre-roll ring
+        self.warm_input = False
+        self.preroll_ms = 0
+        self.preroll: PreRollBuffer | None = None
+        self._capturing = False  # True while the callback stream is running
+        self._stream_device: str | None = None  # Device key the open stream was resolved for
+        self._lock = threading.Lock()  # Guards the idle -> recording handover
+
+        # Hotkey-to-first-sample latency of the last start() (ms)
+        self.first_sample_latency_ms: float | None = None
+        self._start_requested_at = 0.0
+
+        # Capture health for the current recording (reported to perf metrics)
+        self.overflow_count = 0  # Callbacks flagged with paInputOverflow
+        self.dropped_frames = 0  # Frames lost in overflows (estimated from the ADC clock)
+        self._last_adc_time = 0.0
 
         # Create temp directory if it doesn't exist
         os.makedirs(temp_dir, exist_ok=True)
@@ -55,6 +79,9 @@ class Recorder:
         """
         Start recording from microphone.
 
+        In warm-input mode with an open stream this is instant: the pre-roll ring is
+        copied into the capture buffer and no device setup happens.
+
         Args:
             device_id: Audio device ID (or 'default')
             device_label: Audio device label for matching
@@ -62,63 +89,35 @@ class Recorder:
             auto_stop_callback: Function to call when auto-stopped due to duration limit
         """
         try:
+            self._start_requested_at = time.perf_counter()
+            self.first_sample_latency_ms = None
             self.max_duration = max_duration
+            self._max_frames = int(max_duration * self.sample_rate) if max_duration > 0 else 0
             self.auto_stop_callback = auto_stop_callback
+            device_key = self._device_key(device_id, device_label)
+
+            if self.warm_input and self._stream_alive() and self._stream_device == device_key:
+                with self._lock:
+                    self._reset_capture_stats()
+                    self.audio_data.clear()
+                    if self.preroll is not None and len(self.preroll) > 0:
+                        self.audio_data.append(self.preroll.snapshot())
+                        self._mark_first_sample()
+                    self.start_time = time.time()
+                    self.is_recording = True
+                logger.info(
+                    f"Recording started (warm stream, pre-roll: {self.duration * 1000:.0f}ms)"
+                )
+                return
+
+            # Cold path (or the warm stream is on another device / has died)
+            self._close_stream()
+            input_device_index = self._open_stream(device_id, device_label)
+            self._reset_capture_stats()
+            self.audio_data.clear()
             self.start_time = time.time()
-            self.p = pyaudio.PyAudio()
-
-            # Resolve device index
-            input_device_index = None
-
-            if (device_id and device_id != "default") or device_label:
-                logger.info(f"Looking for audio device: ID={device_id}, Label={device_label}")
-                try:
-                    info = self.p.get_host_api_info_by_index(0)
-                    numdevices = info.get("deviceCount")
-
-                    found_device = None
-
-                    for i in range(0, numdevices):
-                        device_info = self.p.get_device_info_by_host_api_device_index(0, i)
-                        if device_info.get("maxInputChannels") > 0:
-                            dev_name = device_info.get("name")
-                            # Match against label if provided (fuzzy match)
-                            if device_label and device_label.lower() in dev_name.lower():
-                                found_device = i
-                                logger.info(
-                                    f"Found matching device by label: '{dev_name}' (Index: {i})"
-                                )
-                                break
-                            # Fallback: check if mapped ID could work (unlikely with browser hashes)
-
-                    if found_device is not None:
-                        input_device_index = found_device
-                    else:
-                        logger.warning(
-                            f"Device not found, falling back to default. Available devices checked: {numdevices}"
-                        )
-
-                except Exception as e:
-                    logger.warning(
-                        f"Warning: Error enumerating devices (falling back to default): {e}"
-                    )
-
-            self.stream = self.p.open(
-                format=pyaudio.paInt16,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                input_device_index=input_device_index,
-                frames_per_buffer=self.chunk_size,
-            )
             self.is_recording = True
-            self.audio_data = []
-
-            # Start background thread to read audio
-            import threading
-
-            self.record_thread = threading.Thread(target=self._record_loop)
-            self.record_thread.start()
+            self._start_capture()
 
             logger.info(
                 f"Recording started (Device: {input_device_index if input_device_index is not None else 'Default'})"
@@ -127,67 +126,237 @@ class Recorder:
             logger.error(f"Failed to start recording: {e}")
             raise
 
-    def _record_loop(self) -> None:
-        """Background loop to read audio chunks."""
-        while self.is_recording and self.stream:
+    def enable_warm_input(
+        self,
+        preroll_ms: int = 300,
+        device_id: str | None = None,
+        device_label: str | None = None,
+    ) -> None:
+        """
+        Keep the input stream open between dictations and buffer a pre-roll while idle.
+
+        Args:
+            preroll_ms: Milliseconds of audio kept from before start() is called
+            device_id: Audio device ID (or 'default')
+            device_label: Audio device label for matching
+        """
+        self.warm_input = True
+        if preroll_ms != self.preroll_ms or self.preroll is None:
+            self.preroll_ms = preroll_ms
+            frames = int(self.sample_rate * preroll_ms / 1000)
+            self.preroll = PreRollBuffer(frames * self.channels)
+
+        if self.is_recording:
+            return  # The running stream becomes warm once this recording stops
+
+        if self._stream_alive() and self._stream_device == self._device_key(
+            device_id, device_label
+        ):
+            return
+
+        self._close_stream()
+        self._open_stream(device_id, device_label)
+        self._start_capture()
+        logger.info(f"Warm input enabled (pre-roll: {preroll_ms}ms)")
+
+    def disable_warm_input(self) -> None:
+        """Leave warm-input mode and release the device unless a recording is running."""
+        self.warm_input = False
+        self.preroll = None
+        if not self.is_recording:
+            self._close_stream()
+        logger.info("Warm input disabled")
+
+    def _device_key(self, device_id: str | None, device_label: str | None) -> str:
+        """Key identifying which device a stream was opened for (only labels resolve).
+
+        The synced audioDeviceLabel setting calls the system default "Default" while
+        start_recording leaves the label out; both map to the same key.
+        """
+        key = (device_label or "").lower()
+        return "" if key == "default" else key
+
+    def _resolve_device_index(self, device_id: str | None, device_label: str | None) -> int | None:
+        """Resolve a device label to a PyAudio input device index (None = default)."""
+        if not self._device_key(device_id, device_label):
+            device_label = None
+        return self.device_registry.resolve(self.p, device_id, device_label)
+
+    def _open_stream(self, device_id: str | None, device_label: str | None) -> int | None:
+        """
+        Create the PyAudio instance and open the input stream.
+
+        If the stream fails to open on a cached device index, the cache entry is
+        dropped and the device is re-resolved once before giving up.
+        """
+        self.p = pyaudio.PyAudio()
+        input_device_index = self._resolve_device_index(device_id, device_label)
+        try:
+            self.stream = self._open_input(input_device_index)
+        except Exception as e:
+            if input_device_index is None:
+                raise
+            logger.warning(f"Failed to open input device {input_device_index} ({e}), re-resolving")
+            self.device_registry.invalidate(device_label)
+            input_device_index = self._resolve_device_index(device_id, device_label)
+            self.stream = self._open_input(input_device_index)
+        self._stream_device = self._device_key(device_id, device_label)
+        return input_device_index
+
+    def _open_input(self, input_device_index: int | None):
+        """Open a paInt16 callback-mode input stream on the given device (not started)."""
+        return self.p.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            input_device_index=input_device_index,
+            frames_per_buffer=self.chunk_size,
+            stream_callback=self._on_audio,
+            start=False,
+        )
+
+    def _start_capture(self) -> None:
+        """Start delivering audio to _on_audio for the open stream."""
+        self._capturing = True
+        self._last_adc_time = 0.0
+        self.stream.start_stream()
+
+    def _stream_alive(self) -> bool:
+        """True if the callback stream is open and still delivering audio."""
+        if not (self._capturing and self.stream):
+            return False
+        try:
+            return self.stream.is_active()
+        except Exception:
+            return False
+
+    def _close_stream(self) -> None:
+        """Stop the callback stream and release the stream and PyAudio instance."""
+        self._capturing = False
+        if self.stream:
             try:
-                # Check if max duration exceeded
-                if self.max_duration > 0:
-                    elapsed = time.time() - self.start_time
-                    if elapsed >= self.max_duration:
-                        logger.warning(
-                            f"Recording auto-stopped: max duration ({self.max_duration}s) reached"
-                        )
-                        self.is_recording = False
-                        # Call callback if provided
-                        if self.auto_stop_callback:
-                            self.auto_stop_callback(self.max_duration)
-                        break
-
-                self.read_chunk()
+                self.stream.stop_stream()
+                self.stream.close()
             except Exception as e:
-                if self.is_recording:  # Only log if we expect to be recording
-                    logger.error(f"Error in record loop: {e}")
-                break
+                logger.warning(f"Error closing audio stream: {e}")
+            self.stream = None
+        if self.p:
+            self.p.terminate()
+            self.p = None
+        self._stream_device = None
+
+    def _reset_capture_stats(self) -> None:
+        """Reset overflow/drop counters for a new recording."""
+        self.overflow_count = 0
+        self.dropped_frames = 0
+
+    def _on_audio(self, in_data: bytes, frame_count: int, time_info: dict, status_flags: int):
+        """
+        PortAudio stream callback (runs on the audio thread for every chunk).
+
+        Keeps the work per chunk to a slice copy under a short lock so capture does
+        not compete with Whisper or HTTP threads for the GIL, and enforces max_duration
+        by frame count rather than wall-clock time.
+        """
+        self._track_overflow(frame_count, time_info, status_flags)
+
+        auto_stopped = False
+        with self._lock:
+            if self.is_recording:
+                if self._max_frames > 0:
+                    remaining = self._max_frames - self.audio_data.frames
+                    if frame_count >= remaining:
+                        # Keep exactly max_duration worth of audio
+                        in_data = in_data[: max(remaining, 0) * self.channels * 2]
+                        auto_stopped = True
+                if in_data:
+                    self.audio_data.append(in_data)
+                    self._mark_first_sample()
+                if auto_stopped:
+                    self.is_recording = False
+            elif self.preroll is not None:
+                self.preroll.write(in_data)
+
+        if auto_stopped:
+            logger.warning(f"Recording auto-stopped: max duration ({self.max_duration}s) reached")
+            if self.auto_stop_callback:
+                # Never block the audio thread on the callback
+                threading.Thread(
+                    target=self.auto_stop_callback,
+                    args=(self.max_duration,),
+                    daemon=True,
+                    name="RecorderAutoStop",
+                ).start()
+            if not self.warm_input:
+                self._capturing = False
+                return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+
+    def _track_overflow(self, frame_count: int, time_info: dict, status_flags: int) -> None:
+        """Count input overflows and estimate the frames they dropped."""
+        adc_time = (time_info or {}).get("input_buffer_adc_time", 0.0)
+        if status_flags & pyaudio.paInputOverflow:
+            self.overflow_count += 1
+            # Host APIs without an ADC clock report 0; the overflow is still counted
+            if adc_time and self._last_adc_time:
+                expected = frame_count / float(self.sample_rate)
+                gap = adc_time - self._last_adc_time - expected
+                if gap > 0:
+                    self.dropped_frames += int(round(gap * self.sample_rate))
+        self._last_adc_time = adc_time
+
+    def _mark_first_sample(self) -> None:
+        """Record hotkey-to-first-sample latency for the current recording."""
+        if self.first_sample_latency_ms is None:
+            self.first_sample_latency_ms = (time.perf_counter() - self._start_requested_at) * 1000
 
     def stop(self) -> None:
-        """Stop recording and clean up resources."""
+        """Stop recording. In warm-input mode the stream stays open to refill the pre-roll."""
         try:
-            self.is_recording = False  # Signal thread to stop
+            with self._lock:
+                self.is_recording = False  # Callback routes further audio to the pre-roll
 
-            if hasattr(self, "record_thread") and self.record_thread.is_alive():
-                self.record_thread.join(timeout=1.0)
-
-            if self.stream:
-                self.stream.stop_stream()
-                self.stream.close()
-            if self.p:
-                self.p.terminate()
+            if self.warm_input and self._stream_alive():
+                if self.preroll is not None:
+                    self.preroll.clear()  # Don't replay the tail of this dictation
+                logger.info("Recording stopped (warm stream kept open)")
+                return
 
+            self._close_stream()
             logger.info("Recording stopped")
         except Exception as e:
             logger.error(f"Error stopping recording: {e}")
 
-    def read_chunk(self) -> bytes:
-        """
-        Read a chunk of audio data from the stream.
+    def close(self) -> None:
+        """Stop any recording and release the audio device (including a warm stream)."""
+        self.is_recording = False
+        self._close_stream()
 
-        Returns:
-            Audio data as bytes
+    @property
+    def duration(self) -> float:
+        """Duration of the recorded audio in seconds."""
+        return self.audio_data.frames / float(self.sample_rate)
 
-        Raises:
-            RuntimeError: If not currently recording
+    def get_audio(self, start_frame: int = 0) -> np.ndarray:
         """
-        if not self.is_recording or not self.stream:
-            raise RuntimeError("Recorder is not active")
+        Return the recorded audio as a float32 mono array in [-1.0, 1.0].
 
-        try:
-            data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-            self.audio_data.append(data)
-            return data
-        except Exception as e:
-            logger.error(f"Error reading chunk: {e}")
-            raise
+        This is the in-memory handoff used by Transcriber.transcribe_array, so the
+        pipeline does not need to write and re-read a WAV file. Safe to call while
+        recording (live transcription reads the growing buffer).
+
+        Args:
+            start_frame: First frame to return (0 = whole recording)
+
+        Returns:
+            1-D float32 array sampled at self.sample_rate
+        """
+        with self._lock:
+            pcm = self.audio_data.view()[start_frame * self.channels :]
+            if self.channels > 1:
+                pcm = pcm.reshape(-1, self.channels).mean(axis=1)
+            return pcm.astype(np.float32) / 32768.0
 
     def save_to_file(self, filepath: str) -> str:
         """
@@ -202,9 +371,9 @@ class Recorder:
         try:
             with wave.open(filepath, "wb") as wav_file:
                 wav_file.setnchannels(self.channels)
-                wav_file.setsampwidth(self.p.get_sample_size(pyaudio.paInt16))
+                wav_file.setsampwidth(pyaudio.get_sample_size(pyaudio.paInt16))
                 wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(b"".join(self.audio_data))
+                wav_file.writeframes(self.audio_data.as_bytes())
             logger.info(f"Audio saved to {filepath}")
             return filepath
         except Exception as e:
@@ -0,0 +1,260 @@
+"""LLM response cache: repeated short inputs skip the processor round-trip."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_S = 7 * 24 * 3600.0
+# Only short inputs repeat word for word ("new paragraph", "thanks, talk soon")
+MAX_INPUT_CHARS = 500
+# Trailing punctuation Whisper adds or drops between two readings of the same phrase
+_TRAILING_PUNCTUATION = ".,!?;: "
+
+
+def normalize_text(text: str) -> str:
+    """Fold case, Unicode forms, whitespace runs and trailing punctuation."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(text.split()).rstrip(_TRAILING_PUNCTUATION)
+
+
+class ResponseCache:
+    """
+    Caches processor.process() results by normalized input, resolved prompt and model.
+
+    Entries live in an in-memory LRU bounded by max_entries and ttl_s. With a
+    persist_path they are also written to a small SQLite database, so common phrases
+    stay cached across restarts. Only inputs up to MAX_INPUT_CHARS are cached.
+
+    Disabling the cache (e.g. when the privacy level drops below the configured
+    threshold) forgets every entry, in memory and on disk.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_s: float = DEFAULT_TTL_S,
+        persist_path: str | None = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in memory (least recently used are evicted)
+            ttl_s: Seconds an entry stays valid
+            persist_path: SQLite database file for persistence (None: memory only)
+            enabled: Whether lookups and stores happen at all (see configure())
+        """
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.persist_path: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        if persist_path and enabled:
+            self._open_db(persist_path)
+
+    def configure(
+        self,
+        enabled: bool = True,
+        max_entries: int | None = None,
+        ttl_s: float | None = None,
+        persist_path: str | None = None,
+    ) -> None:
+        """
+        Apply settings. Disabling clears all entries; dropping persistence clears the file.
+
+        Args:
+            enabled: Whether lookups and stores happen at all
+            max_entries: Entries kept in memory
+            ttl_s: Seconds an entry stays valid
+            persist_path: SQLite database file (None: memory only). When disabling, a
+                database left there by an earlier run is deleted as well.
+        """
+        with self._lock:
+            self.max_entries = int(max_entries or self.max_entries)
+            self.ttl_s = float(ttl_s or self.ttl_s)
+            self._evict()
+        if not enabled:
+            if self.enabled:
+                logger.info("[LLM_CACHE] Disabled, entries cleared")
+            self.clear()
+            self._close_db()
+            if persist_path:
+                self._delete_db_file(persist_path)
+        elif persist_path != self.persist_path:
+            self._close_db(wipe=True)
+            if persist_path:
+                self._open_db(persist_path)
+        self.enabled = bool(enabled)
+
+    def process(self, processor, text: str, prompt_override: str | None = None) -> str:
+        """
+        processor.process(text, prompt_override=...) behind the cache.
+
+        Args:
+            processor: Any processor (LocalProcessor, CloudProcessor, ...)
+            text: Text to process
+            prompt_override: Optional prompt, as for processor.process()
+
+        Returns:
+            The cached or freshly processed text
+        """
+        cached = self.lookup(processor, text, prompt_override)
+        if cached is not None:
+            return cached
+        result = processor.process(text, prompt_override=prompt_override)
+        self.store(processor, text, result, prompt_override)
+        return result
+
+    def lookup(self, processor, text: str, prompt_override: str | None = None) -> str | None:
+        """Return the cached response for this input, prompt and model, or None."""
+        key = self._key(processor, text, prompt_override)
+        if key is None:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self.ttl_s:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.info(f"[LLM_CACHE] Hit ({len(text)} chars, {self.hit_rate():.0%} hit rate)")
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]  # Expired
+            self.misses += 1
+        return None
+
+    def store(
+        self, processor, text: str, response: str, prompt_override: str | None = None
+    ) -> None:
+        """Cache a processor response for this input, prompt and model."""
+        key = self._key(processor, text, prompt_override)
+        if key is None or not response:
+            return
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (response, now)
+            self._entries.move_to_end(key)
+            self._evict()
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO response_cache (key, response, created_at) "
+                        "VALUES (?, ?, ?)",
+                        (key, response, now),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"[LLM_CACHE] Failed to persist entry: {e}")
+
+    def clear(self) -> None:
+        """Forget all entries, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM response_cache")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"[LLM_CACHE] Failed to clear persisted entries: {e}")
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Size and hit rate for the 'status' IPC command."""
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_s": self.ttl_s,
+            "persisted": self._db is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate(), 3),
+        }
+
+    def close(self) -> None:
+        """Close the database (entries stay persisted)."""
+        self._close_db()
+
+    def _key(self, processor, text: str, prompt_override: str | None) -> str | None:
+        if not self.enabled or not text or len(text) > MAX_INPUT_CHARS:
+            return None
+        prompt = (
+            prompt_override if prompt_override is not None else getattr(processor, "prompt", "")
+        )
+        model = f"{type(processor).__name__}:{getattr(processor, 'model', '')}"
+        digest = hashlib.sha256()
+        for part in (normalize_text(text), prompt or "", model):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _open_db(self, path: str) -> None:
+        """Open (or create) the database and load its most recent live entries."""
+        try:
+            db = sqlite3.connect(path, check_same_thread=False)  # Used under self._lock
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            cutoff = time.time() - self.ttl_s
+            db.execute("DELETE FROM response_cache WHERE created_at < ?", (cutoff,))
+            db.commit()
+            rows = db.execute(
+                "SELECT key, response, created_at FROM response_cache "
+                "ORDER BY created_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"[LLM_CACHE] Persistence unavailable ({path}): {e}")
+            return
+        with self._lock:
+            for key, response, created_at in reversed(rows):  # Oldest first: LRU order
+                self._entries.setdefault(key, (response, created_at))
+            self._evict()
+            self._db = db
+            self.persist_path = path
+        logger.info(f"[LLM_CACHE] Loaded {len(rows)} persisted entries from {path}")
+
+    def _delete_db_file(self, path: str) -> None:
+        """Delete a database that is not open (entries persisted before a restart)."""
+        try:
+            os.remove(path)
+            logger.info(f"[LLM_CACHE] Deleted persisted entries ({path})")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[LLM_CACHE] Failed to delete {path}: {e}")
+
+    def _close_db(self, wipe: bool = False) -> None:
+        with self._lock:
+            if self._db is None:
+                return
+            try:
+                if wipe:
+                    self._db.execute("DELETE FROM response_cache")
+                    self._db.commit()
+                self._db.close()
+            except sqlite3.Error as e:
+                logger.warning(f"[LLM_CACHE] Failed to close database: {e}")
+            self._db = None
+            self.persist_path = None
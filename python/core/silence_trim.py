@@ -0,0 +1,70 @@
+"""Energy-based leading/trailing silence trimming for recorded audio."""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridable via configure: silenceRangeDb / silenceFloorDb / silencePaddingMs)
+# Frames this far below the recording's loudest frame count as silence. Relative to the
+# clip so quiet microphones and whispered dictation are kept like normal speech
+DEFAULT_RANGE_DB = 40.0
+# A recording whose loudest frame stays below this level (dBFS) is treated as silent,
+# e.g. a muted or disconnected input; well under whispered speech on a working mic
+DEFAULT_FLOOR_DB = -70.0
+DEFAULT_PADDING_MS = 200
+FRAME_MS = 20
+
+
+def trim_silence(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    range_db: float = DEFAULT_RANGE_DB,
+    floor_db: float = DEFAULT_FLOOR_DB,
+    padding_ms: int = DEFAULT_PADDING_MS,
+) -> tuple[np.ndarray, float]:
+    """
+    Cut leading and trailing silence from a float32 mono recording.
+
+    The signal is split into 20ms frames and the RMS level of every frame is computed
+    in one vectorized pass. A frame counts as speech when it is within `range_db` of the
+    loudest frame, so the gate follows the input level instead of assuming one.
+    Everything before the first and after the last speech frame is dropped, keeping
+    `padding_ms` on each side so word onsets and trailing consonants survive. Silence
+    in the middle of the recording is untouched.
+
+    Args:
+        audio: 1-D float32 samples in [-1.0, 1.0]
+        sample_rate: Sample rate in Hz
+        range_db: Frames more than this many dB below the loudest frame are silence
+        floor_db: Level (dBFS) the loudest frame must exceed for anything to count
+            as speech
+        padding_ms: Audio kept before the first and after the last speech frame
+
+    Returns:
+        (trimmed audio view, seconds removed). The trimmed audio is empty when the
+        loudest frame is below `floor_db`, i.e. the recording is entirely silent.
+    """
+    total = len(audio)
+    frame_len = max(1, int(sample_rate * FRAME_MS / 1000))
+    n_frames = total // frame_len
+    if n_frames == 0:
+        return audio, 0.0
+
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    level_db = 20.0 * np.log10(rms + 1e-10)
+    peak_db = float(level_db.max())
+    if peak_db < floor_db:
+        return audio[:0], total / float(sample_rate)
+    voiced = np.flatnonzero(level_db > peak_db - range_db)
+
+    pad = int(sample_rate * padding_ms / 1000)
+    start = max(0, int(voiced[0]) * frame_len - pad)
+    # The partial frame at the end is never measured; keep it if speech runs to the end
+    end = total if voiced[-1] == n_frames - 1 else (int(voiced[-1]) + 1) * frame_len
+    end = min(total, end + pad)
+
+    removed_s = (total - (end - start)) / float(sample_rate)
+    return audio[start:end], removed_s
@@ -31,6 +31,7 @@ class SystemMonitor:
         self.gpu_device_name = None
         self.gpu_total_memory = 0
         self._nvidia_smi_path = self._find_nvidia_smi()
+        self._cpu_times: tuple[float, float] | None = None  # (total, idle) at last cpu_load()
 
     def _find_nvidia_smi(self) -> str | None:
         """Find the nvidia-smi executable on Windows/Linux."""
@@ -194,6 +195,26 @@ class SystemMonitor:
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
 
+    def cpu_load(self) -> float | None:
+        """
+        System-wide CPU utilization since the previous call, without blocking.
+
+        get_snapshot() samples for 100ms (and may shell out to nvidia-smi), too slow to
+        run before every transcription. Calling this when a recording starts and again
+        when it is transcribed gives the average load over the recording.
+
+        Returns:
+            CPU percent, or None on the first call (no baseline yet)
+        """
+        times = psutil.cpu_times()
+        # Guest time is already included in user time on Linux
+        total = sum(times) - getattr(times, "guest", 0.0) - getattr(times, "guest_nice", 0.0)
+        idle = times.idle + getattr(times, "iowait", 0.0)
+        previous, self._cpu_times = self._cpu_times, (total, idle)
+        if previous is None or total <= previous[0]:
+            return None
+        return round(100.0 * (1.0 - (idle - previous[1]) / (total - previous[0])), 1)
+
     def get_summary(self) -> str:
         """
         Get a human-readable summary of system configuration.
@@ -1,12 +1,28 @@
 """Transcriber module using faster-whisper."""
 
+import bisect
 import logging
+import time
+from collections.abc import Iterator
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+
+from core.cpu_tuning import load_tuning, synthetic_clip
 
 logger = logging.getLogger(__name__)
 
 
+def resample(audio: np.ndarray, sample_rate: int, target_rate: int = 16000) -> np.ndarray:
+    """Linearly resample mono audio to target_rate (default: the 16 kHz Whisper expects)."""
+    target_len = int(round(len(audio) * target_rate / sample_rate))
+    if target_len == 0:
+        return np.zeros(0, dtype=np.float32)
+    source_times = np.arange(len(audio), dtype=np.float64) / sample_rate
+    target_times = np.arange(target_len, dtype=np.float64) / target_rate
+    return np.interp(target_times, source_times, audio).astype(np.float32)
+
+
 class Transcriber:
     """Transcribes audio using OpenAI Whisper."""
 
@@ -16,20 +32,77 @@ class Transcriber:
     # Mapping for special model names to HF paths
     MODEL_MAPPING = {"turbo": "deepdml/faster-whisper-large-v3-turbo-ct2"}
 
-    def __init__(self, model_size: str = "medium", device: str = "auto"):
+    # faster-whisper expects in-memory audio as 16 kHz mono float32
+    SAMPLE_RATE = 16000
+
+    # faster-whisper decoding parameters per latency profile. "accurate" matches
+    # faster-whisper's own defaults (what every transcription used before profiles).
+    DECODING_PROFILES = {
+        "instant": {
+            "beam_size": 1,
+            "best_of": 1,
+            "temperature": 0.0,
+            "condition_on_previous_text": False,
+            "vad_filter": True,
+        },
+        "balanced": {
+            "beam_size": 3,
+            "best_of": 3,
+            "temperature": [0.0, 0.4, 0.8],
+            "condition_on_previous_text": False,
+            "vad_filter": True,
+        },
+        "accurate": {
+            "beam_size": 5,
+            "best_of": 5,
+            "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+            "condition_on_previous_text": True,
+            "vad_filter": False,
+        },
+    }
+    DEFAULT_PROFILE = "accurate"
+
+    # Batched inference decodes 30s windows; longer clips are transcribed one by one
+    BATCH_MAX_CLIP_S = 30.0
+    # Silence inserted after each clip so neighbouring clips don't run together
+    BATCH_GAP_S = 0.3
+
+    # Synthetic clip decoded by warmup(); any length runs the full 30s encoder window
+    WARMUP_CLIP_S = 2.0
+    WARMUP_MAX_TOKENS = 16
+
+    def __init__(
+        self,
+        model_size: str = "medium",
+        device: str = "auto",
+        compute_type: str | None = None,
+        cpu_threads: int | None = None,
+    ):
         """
         Initialize the transcriber.
 
+        On CPU, when neither compute_type nor cpu_threads is given, the settings found
+        by the last calibration (see cpu_tuning.calibrate) are used if there are any.
+
         Args:
             model_size: Size of the Whisper model (default: medium)
             device: Device to use ('cuda', 'cpu', or 'auto')
+            compute_type: CTranslate2 compute type (default: int8 on CPU, int8_float16 on GPU)
+            cpu_threads: CTranslate2 intra-op threads on CPU (default: CTranslate2's own)
         """
         if model_size not in self.SUPPORTED_MODELS:
             raise ValueError(f"Model size must be one of {self.SUPPORTED_MODELS}")
 
         self.model_size = model_size
         self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.resolved_device: str | None = None  # "cuda" or "cpu" once loaded
+        self.resolved_compute_type: str | None = None  # Compute type actually loaded with
+        self.tuning: dict | None = None  # Calibrated CPU settings applied at load
         self.model: WhisperModel | None = None
+        self._batched: BatchedInferencePipeline | None = None  # Created on first batch call
+        self.warmup_timings: dict | None = None  # Cold/warm decode latency from warmup()
         self._load_model()
 
     def _load_model(self) -> None:
@@ -55,51 +128,320 @@ class Transcriber:
 
             # Resolve model path from mapping if it exists, otherwise use size name
             model_name = self.MODEL_MAPPING.get(self.model_size, self.model_size)
+            compute_type = self.compute_type or ("int8" if device == "cpu" else "int8_float16")
+            cpu_threads = self.cpu_threads or 0  # 0 = CTranslate2 default
+            num_workers = 1
 
+            if device == "cpu" and not (self.compute_type or self.cpu_threads):
+                self.tuning = load_tuning(self.model_size)
+                if self.tuning:
+                    compute_type = self.tuning["compute_type"]
+                    cpu_threads = self.tuning["cpu_threads"]
+                    num_workers = self.tuning.get("num_workers", 1)
+                    logger.info(
+                        f"[CPU_TUNE] Using calibrated {compute_type} with {cpu_threads} threads"
+                    )
+
+            options = {
+                "device": device,
+                "compute_type": compute_type,
+                "cpu_threads": cpu_threads,
+                "num_workers": num_workers,
+            }
             logger.info(f"Loading Whisper model '{model_name}' on {device}...")
             try:
                 # Optimized: Try local files first to avoid HF Hub network check (can take 30s+)
-                self.model = WhisperModel(
-                    model_name,
-                    device=device,
-                    compute_type="int8" if device == "cpu" else "int8_float16",
-                    local_files_only=True,
-                )
+                self.model = WhisperModel(model_name, local_files_only=True, **options)
             except Exception as e:
                 logger.info(f"Local model not found or check failed, attempting online load: {e}")
-                self.model = WhisperModel(
-                    model_name,
-                    device=device,
-                    compute_type="int8" if device == "cpu" else "int8_float16",
-                    local_files_only=False,
-                )
+                self.model = WhisperModel(model_name, local_files_only=False, **options)
+            self.resolved_device = device
+            self.resolved_compute_type = compute_type
             logger.info("Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
 
-    def transcribe(self, audio_path: str, language: str | None = None) -> str:
+    def transcribe(
+        self, audio_path: str, language: str | None = None, profile: str | None = None
+    ) -> str:
         """
         Transcribe audio file to text.
 
         Args:
             audio_path: Path to audio file
             language: Language code (default: None for auto-detection)
+            profile: Decoding profile name (see DECODING_PROFILES, default: accurate)
+
+        Returns:
+            Transcribed text
+        """
+        logger.info(f"Transcribing {audio_path}...")
+        return self._transcribe(audio_path, language, profile)
+
+    def transcribe_array(
+        self,
+        audio: np.ndarray,
+        language: str | None = None,
+        sample_rate: int = SAMPLE_RATE,
+        profile: str | None = None,
+    ) -> str:
+        """
+        Transcribe in-memory audio to text (no disk round trip).
+
+        Args:
+            audio: Mono float32 samples in [-1.0, 1.0] (see Recorder.get_audio)
+            language: Language code (default: None for auto-detection)
+            sample_rate: Sample rate of the audio in Hz (resampled to 16 kHz if different)
+            profile: Decoding profile name (see DECODING_PROFILES, default: accurate)
 
         Returns:
             Transcribed text
         """
+        audio = np.asarray(audio, dtype=np.float32)
+        if sample_rate != self.SAMPLE_RATE:
+            audio = self._resample(audio, sample_rate)
+
+        logger.info(f"Transcribing {len(audio) / self.SAMPLE_RATE:.2f}s of in-memory audio...")
+        return self._transcribe(audio, language, profile)
+
+    def iter_segments(
+        self,
+        audio: str | np.ndarray,
+        language: str | None = None,
+        initial_prompt: str | None = None,
+        profile: str | None = None,
+    ) -> Iterator:
+        """
+        Yield timed segments as faster-whisper decodes them.
+
+        faster-whisper decodes lazily, so the first segment is available long before
+        the whole recording is done; callers can start cleaning up or injecting
+        finished sentences while later segments are still decoding.
+
+        Args:
+            audio: Path to an audio file, or mono float32 samples at 16 kHz
+            language: Language code (default: None for auto-detection)
+            initial_prompt: Preceding text to condition the decode on
+            profile: Decoding profile name (see DECODING_PROFILES, default: accurate)
+
+        Yields:
+            faster-whisper segments (with .start, .end and .text)
+        """
         if not self.model:
             raise RuntimeError("Model not loaded")
 
-        try:
-            logger.info(f"Transcribing {audio_path}...")
-            segments, info = self.model.transcribe(audio_path, language=language, task="transcribe")
+        if not isinstance(audio, str):
+            audio = np.asarray(audio, dtype=np.float32)
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            task="transcribe",
+            initial_prompt=initial_prompt,
+            **self.decode_options(profile),
+        )
+        yield from segments
+
+    def transcribe_segments(
+        self,
+        audio: np.ndarray,
+        language: str | None = None,
+        initial_prompt: str | None = None,
+        profile: str | None = None,
+    ) -> list:
+        """
+        Transcribe 16 kHz in-memory audio and return all timed segments.
+
+        Used for incremental (live) transcription, where segment end times decide
+        which text is stable enough to commit.
+
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            language: Language code (default: None for auto-detection)
+            initial_prompt: Preceding text to condition the decode on
+            profile: Decoding profile name (see DECODING_PROFILES, default: accurate)
+
+        Returns:
+            List of faster-whisper segments (with .start, .end and .text)
+        """
+        return list(
+            self.iter_segments(
+                audio, language=language, initial_prompt=initial_prompt, profile=profile
+            )
+        )
+
+    def detect_language(self, audio: np.ndarray) -> tuple[str, float]:
+        """
+        Detect the spoken language of 16 kHz in-memory audio without transcribing it.
 
+        Args:
+            audio: Mono float32 samples at 16 kHz (only the first 30s are analyzed)
+
+        Returns:
+            (language code, detection probability)
+        """
+        if not self.model.model.is_multilingual:
+            return "en", 1.0  # English-only (.en) models can't detect anything else
+        language, probability, _ = self.model.detect_language(np.asarray(audio, dtype=np.float32))
+        return language, probability
+
+    def warmup(self) -> dict:
+        """
+        Run two short greedy decodes of a synthetic clip so the first real one is fast.
+
+        A freshly constructed WhisperModel allocates its buffers lazily and the weights
+        are only paged in on first use, so the first transcription after a load is
+        consistently slower. The first decode here absorbs that; the second shows the
+        steady-state latency.
+
+        Returns:
+            {"cold_ms": first decode, "warm_ms": second decode}
+        """
+        audio = synthetic_clip(self.WARMUP_CLIP_S)
+        options = {
+            **self.decode_options("instant"),
+            "vad_filter": False,  # VAD would drop the synthetic clip and skip the encoder
+            "without_timestamps": True,
+            "max_new_tokens": self.WARMUP_MAX_TOKENS,
+        }
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            segments, _ = self.model.transcribe(audio, language="en", **options)
+            for _ in segments:
+                pass
+            timings.append(round((time.perf_counter() - start) * 1000))
+        self.warmup_timings = {"cold_ms": timings[0], "warm_ms": timings[1]}
+        logger.info(f"Warm-up decode: {timings[0]}ms cold, {timings[1]}ms warm ({self.model_size})")
+        return self.warmup_timings
+
+    def transcribe_batch(
+        self,
+        clips: list[str | np.ndarray],
+        language: str | None = None,
+        batch_size: int = 8,
+        profile: str | None = None,
+    ) -> list[str]:
+        """
+        Transcribe many clips with faster-whisper's batched inference pipeline.
+
+        Clips are laid out back to back (with a short silence gap) and passed as
+        clip_timestamps, so up to `batch_size` 30s windows are decoded per forward
+        pass instead of paying the full per-call overhead for every clip. Segments are
+        mapped back to their clip by start time. Clips longer than 30s don't fit a
+        batch window and are transcribed sequentially.
+
+        Args:
+            clips: Audio file paths or mono float32 arrays at 16 kHz
+            language: Language code (default: None for auto-detection)
+            batch_size: Number of 30s windows decoded per batch
+            profile: Decoding profile name (VAD filtering is always off for batches)
+
+        Returns:
+            One transcription per clip, in input order
+        """
+        if not self.model:
+            raise RuntimeError("Model not loaded")
+
+        audios = [
+            decode_audio(clip, sampling_rate=self.SAMPLE_RATE)
+            if isinstance(clip, str)
+            else np.asarray(clip, dtype=np.float32)
+            for clip in clips
+        ]
+        results = [""] * len(audios)
+
+        batchable: list[int] = []
+        for i, audio in enumerate(audios):
+            if len(audio) == 0:
+                continue
+            if len(audio) <= self.BATCH_MAX_CLIP_S * self.SAMPLE_RATE:
+                batchable.append(i)
+            else:
+                results[i] = self._transcribe(audio, language, profile).strip()
+
+        if batchable:
+            texts = self._decode_batch(
+                [audios[i] for i in batchable], language, batch_size, profile
+            )
+            for i, text in zip(batchable, texts, strict=True):
+                results[i] = text
+        return results
+
+    def _decode_batch(
+        self, audios: list[np.ndarray], language: str | None, batch_size: int, profile: str | None
+    ) -> list[str]:
+        """Run clips of at most 30s through one BatchedInferencePipeline call."""
+        # Lay the clips out on one timeline, each followed by a short gap
+        gap = np.zeros(int(self.BATCH_GAP_S * self.SAMPLE_RATE), dtype=np.float32)
+        parts: list[np.ndarray] = []
+        clip_timestamps: list[dict] = []
+        starts: list[float] = []
+        offset = 0
+        for audio in audios:
+            start_s = offset / self.SAMPLE_RATE
+            offset += len(audio) + len(gap)
+            parts.extend((audio, gap))
+            starts.append(start_s)
+            clip_timestamps.append({"start": start_s, "end": offset / self.SAMPLE_RATE})
+
+        if self._batched is None or self._batched.model is not self.model:
+            self._batched = BatchedInferencePipeline(model=self.model)
+
+        # Clip boundaries come from clip_timestamps, so VAD must stay off
+        options = self.decode_options(profile)
+        options["vad_filter"] = False
+        options.pop("condition_on_previous_text", None)
+
+        logger.info(f"Batch transcribing {len(audios)} clips (batch size: {batch_size})...")
+        segments, info = self._batched.transcribe(
+            np.concatenate(parts),
+            language=language,
+            task="transcribe",
+            batch_size=batch_size,
+            clip_timestamps=clip_timestamps,
+            **options,
+        )
+
+        # Every clip_timestamps entry is decoded as its own chunk and segment times are on
+        # the joined timeline, so a segment belongs to the clip its start falls in
+        texts: list[list[str]] = [[] for _ in audios]
+        for segment in segments:
+            slot = max(0, bisect.bisect_right(starts, segment.start) - 1)
+            texts[slot].append(segment.text.strip())
+        return [" ".join(parts).strip() for parts in texts]
+
+    def decode_options(self, profile: str | None = None) -> dict:
+        """
+        Return the faster-whisper decoding parameters for a profile.
+
+        Args:
+            profile: Profile name (None for DEFAULT_PROFILE; unknown names fall back to it)
+
+        Returns:
+            Keyword arguments for WhisperModel.transcribe
+        """
+        name = profile or self.DEFAULT_PROFILE
+        if name not in self.DECODING_PROFILES:
+            logger.warning(f"Unknown decoding profile '{name}', using '{self.DEFAULT_PROFILE}'")
+            name = self.DEFAULT_PROFILE
+        return dict(self.DECODING_PROFILES[name])
+
+    def _transcribe(
+        self, audio: str | np.ndarray, language: str | None, profile: str | None = None
+    ) -> str:
+        """Run faster-whisper on a file path or a 16 kHz float32 array."""
+        try:
             # Combine all segments into single text
-            text = " ".join([segment.text for segment in segments])
+            text = " ".join(
+                [segment.text for segment in self.iter_segments(audio, language, profile=profile)]
+            )
             logger.info(f"Transcription complete: {text[:100]}...")
             return text
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
+
+    def _resample(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Linearly resample audio to the 16 kHz rate Whisper expects."""
+        return resample(audio, sample_rate, self.SAMPLE_RATE)
@@ -0,0 +1,422 @@
+"""Out-of-process Whisper transcription with audio handed over through shared memory."""
+
+import logging
+import multiprocessing as mp
+import threading
+import time
+import types
+from collections.abc import Iterator
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from pathlib import Path
+
+import numpy as np
+
+from .cpu_partition import set_affinity
+from .transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(conn, model_size: str, device: str, compute_type: str | None, log_file) -> None:
+    """
+    Entry point of the worker process: load the model, then serve requests.
+
+    Requests arrive on `conn` as (command, args) tuples. In-memory audio is read
+    straight out of the shared memory block named in the request; only segment text
+    and timings travel back over the pipe.
+    """
+    handlers = [logging.FileHandler(log_file)] if log_file else [logging.NullHandler()]
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - [WORKER] %(name)s - %(levelname)s - %(message)s",
+        handlers=handlers,
+        force=True,  # Replace the server's handlers inherited through the __main__ re-import
+    )
+    try:
+        transcriber = Transcriber(model_size=model_size, device=device, compute_type=compute_type)
+    except Exception as e:
+        conn.send(("error", f"Model load failed: {e}"))
+        return
+    conn.send(
+        (
+            "ready",
+            {
+                "pid": mp.current_process().pid,
+                "device": transcriber.resolved_device,
+                "compute_type": transcriber.resolved_compute_type,
+                "tuning": transcriber.tuning,
+            },
+        )
+    )
+
+    shm: shared_memory.SharedMemory | None = None
+    while True:
+        try:
+            command, args = conn.recv()
+        except (EOFError, OSError):
+            break  # Parent went away
+        if command == "stop":
+            break
+        if command == "ping":
+            conn.send(("pong", None))
+            continue
+
+        try:
+            if args.get("shm") and (shm is None or shm.name != args["shm"]):
+                if shm is not None:
+                    shm.close()
+                shm = shared_memory.SharedMemory(name=args["shm"])
+            _serve(conn, transcriber, command, args, shm)
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+    if shm is not None:
+        shm.close()
+
+
+def _serve(conn, transcriber: Transcriber, command: str, args: dict, shm) -> None:
+    """Run one request in the worker, streaming segments back as they decode."""
+    if args.get("shm"):
+        # Zero-copy view on the block the parent filled
+        audio = np.ndarray((args["samples"],), dtype=np.float32, buffer=shm.buf)
+    else:
+        audio = args.get("path")
+
+    if command == "warmup":
+        conn.send(("result", transcriber.warmup()))
+        return
+    if command == "detect_language":
+        conn.send(("result", transcriber.detect_language(audio)))
+        return
+    for segment in transcriber.iter_segments(
+        audio,
+        language=args.get("language"),
+        initial_prompt=args.get("initial_prompt"),
+        profile=args.get("profile"),
+    ):
+        conn.send(("segment", (segment.start, segment.end, segment.text)))
+    conn.send(("done", None))
+
+
+class RemoteTranscriber:
+    """
+    Transcriber that runs Whisper in a dedicated worker process.
+
+    Inference inside the IpcServer process competes for the GIL with the stdin
+    command loop, the TCP command server and the monitor threads, so `status` and
+    `health_check` stall while a long recording decodes. This class exposes the
+    Transcriber methods the pipelines use, but forwards each call to a child
+    process: the samples are copied once into a reusable shared memory block and
+    only the block name goes over the pipe; segments stream back as they decode.
+
+    A watchdog thread restarts the worker when it exits unexpectedly; a request
+    that was in flight when it crashed is retried once on the fresh worker.
+    """
+
+    DECODING_PROFILES = Transcriber.DECODING_PROFILES
+    DEFAULT_PROFILE = Transcriber.DEFAULT_PROFILE
+    SAMPLE_RATE = Transcriber.SAMPLE_RATE
+
+    # Model load can download weights on first use
+    START_TIMEOUT_S = 300.0
+    PING_TIMEOUT_S = 2.0
+    # Shared memory grows in steps of this size so most recordings reuse the block
+    SHM_STEP_BYTES = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        model_size: str = "medium",
+        device: str = "auto",
+        compute_type: str | None = None,
+        log_file: Path | None = None,
+    ):
+        """
+        Start the worker process and wait for its model to load.
+
+        Args:
+            model_size: Size of the Whisper model (default: medium)
+            device: Device to use ('cuda', 'cpu', or 'auto')
+            compute_type: CTranslate2 compute type (None for the Transcriber default)
+            log_file: Log file for the worker process (None to discard its logs)
+        """
+        if model_size not in Transcriber.SUPPORTED_MODELS:
+            raise ValueError(f"Model size must be one of {Transcriber.SUPPORTED_MODELS}")
+
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self.log_file = str(log_file) if log_file else None
+        self.restarts = 0
+        self.resolved_device: str | None = None  # Reported by the worker once loaded
+        self.resolved_compute_type: str | None = None
+        self.tuning: dict | None = None
+        self.affinity: list[int] | None = None  # Reapplied to restarted workers
+        self.warmup_timings: dict | None = None  # Restarted workers are warmed up again
+
+        self._ctx = mp.get_context("spawn")  # No forked copies of the server's threads
+        self._lock = threading.Lock()  # One request at a time on the pipe
+        self._state = threading.Condition()  # Guards _available/_generation across restarts
+        self._available = False
+        self._generation = 0  # Incremented every time a worker finishes loading
+        self._closing = False
+        self._busy = False
+        self._process = None
+        self._conn = None
+        self._shm: shared_memory.SharedMemory | None = None
+
+        self._start_process()
+        threading.Thread(target=self._watch, daemon=True, name="TranscriptionWatchdog").start()
+
+    def transcribe(
+        self, audio_path: str, language: str | None = None, profile: str | None = None
+    ) -> str:
+        """Transcribe an audio file in the worker (see Transcriber.transcribe)."""
+        return self._join(self.iter_segments(audio_path, language=language, profile=profile))
+
+    def transcribe_array(
+        self,
+        audio: np.ndarray,
+        language: str | None = None,
+        sample_rate: int = SAMPLE_RATE,
+        profile: str | None = None,
+    ) -> str:
+        """Transcribe in-memory audio in the worker (see Transcriber.transcribe_array)."""
+        if sample_rate != self.SAMPLE_RATE:
+            raise ValueError(f"Worker transcription expects {self.SAMPLE_RATE} Hz audio")
+        return self._join(self.iter_segments(audio, language=language, profile=profile))
+
+    def transcribe_segments(
+        self,
+        audio: np.ndarray,
+        language: str | None = None,
+        initial_prompt: str | None = None,
+        profile: str | None = None,
+    ) -> list:
+        """Transcribe in the worker and return all timed segments."""
+        return list(
+            self.iter_segments(
+                audio, language=language, initial_prompt=initial_prompt, profile=profile
+            )
+        )
+
+    def iter_segments(
+        self,
+        audio: str | np.ndarray,
+        language: str | None = None,
+        initial_prompt: str | None = None,
+        profile: str | None = None,
+    ) -> Iterator:
+        """
+        Yield timed segments as the worker decodes them.
+
+        Args:
+            audio: Path to an audio file, or mono float32 samples at 16 kHz
+            language: Language code (default: None for auto-detection)
+            initial_prompt: Preceding text to condition the decode on
+            profile: Decoding profile name (see Transcriber.DECODING_PROFILES)
+
+        Yields:
+            Segments with .start, .end and .text
+        """
+        args = {"language": language, "initial_prompt": initial_prompt, "profile": profile}
+        for start, end, text in self._request("transcribe", audio, args):
+            yield types.SimpleNamespace(start=start, end=end, text=text)
+
+    def detect_language(self, audio: np.ndarray) -> tuple[str, float]:
+        """Detect the spoken language in the worker (see Transcriber.detect_language)."""
+        return tuple(list(self._request("detect_language", audio, {}))[0])
+
+    def warmup(self) -> dict:
+        """Run the warm-up decodes in the worker (see Transcriber.warmup)."""
+        self.warmup_timings = list(self._request("warmup", None, {}))[0]
+        return self.warmup_timings
+
+    @property
+    def pid(self) -> int | None:
+        """Pid of the current worker process."""
+        return self._process.pid if self._process else None
+
+    def set_affinity(self, cpus: list[int] | None) -> None:
+        """Pin the worker to a set of CPUs (None for all), including after restarts."""
+        self.affinity = cpus
+        if self.pid:
+            set_affinity(self.pid, cpus)
+
+    def health(self) -> dict:
+        """
+        Worker state for the 'status' and 'health_check' IPC commands.
+
+        Never blocks behind a transcription: a busy worker is reported as such
+        without being pinged.
+        """
+        alive = self._process is not None and self._process.is_alive()
+        info = {
+            "pid": self._process.pid if self._process else None,
+            "alive": alive,
+            "busy": self._busy,
+            "restarts": self.restarts,
+        }
+        if alive and self._lock.acquire(blocking=False):
+            try:
+                start = time.perf_counter()
+                self._conn.send(("ping", {}))
+                responsive = self._conn.poll(self.PING_TIMEOUT_S)
+                if responsive:
+                    self._conn.recv()
+                    info["ping_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                info["responsive"] = responsive
+            except (EOFError, OSError):
+                info["responsive"] = False
+            finally:
+                self._lock.release()
+        return info
+
+    def close(self) -> None:
+        """Stop the worker process and release the shared memory block."""
+        self._closing = True
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.send(("stop", {}))
+                except (EOFError, OSError):
+                    pass
+            if self._process is not None:
+                self._process.join(timeout=5)
+                if self._process.is_alive():
+                    self._process.terminate()
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+                self._shm = None
+        logger.info(f"[WORKER] Transcription worker for {self.model_size} stopped")
+
+    def _start_process(self) -> None:
+        """Spawn a worker and block until its model is loaded."""
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.model_size, self.device, self.compute_type, self.log_file),
+            daemon=True,
+            name=f"TranscriptionWorker-{self.model_size}",
+        )
+        process.start()
+        child_conn.close()
+
+        if not parent_conn.poll(self.START_TIMEOUT_S):
+            process.terminate()
+            raise RuntimeError(f"Transcription worker did not start within {self.START_TIMEOUT_S}s")
+        try:
+            kind, payload = parent_conn.recv()
+        except EOFError:
+            kind, payload = "error", f"worker exited with code {process.exitcode}"
+        if kind != "ready":
+            process.join(timeout=5)
+            raise RuntimeError(f"Transcription worker failed to start: {payload}")
+
+        self.resolved_device, self.tuning = payload["device"], payload["tuning"]
+        self.resolved_compute_type = payload["compute_type"]
+        if self.affinity is not None:
+            set_affinity(process.pid, self.affinity)
+        with self._state:
+            self._process, self._conn = process, parent_conn
+            self._generation += 1
+            self._available = True
+            self._state.notify_all()
+        logger.info(
+            f"[WORKER] Transcription worker for {self.model_size} ready (pid {payload['pid']})"
+        )
+
+    def _watch(self) -> None:
+        """Restart the worker whenever it exits without being asked to."""
+        while not self._closing:
+            wait([self._process.sentinel])
+            if self._closing:
+                return
+            with self._state:
+                self._available = False
+            self._process.join(timeout=5)  # Reap it so the exit code is known
+            logger.error(
+                f"[WORKER] Transcription worker exited unexpectedly "
+                f"(code {self._process.exitcode}), restarting"
+            )
+            while not self._closing:
+                try:
+                    self._start_process()
+                    self.restarts += 1
+                    break
+                except Exception as e:
+                    logger.error(f"[WORKER] Restart failed: {e}")
+                    time.sleep(5)
+            if self.warmup_timings and not self._closing:
+                try:
+                    self.warmup()
+                except Exception as e:
+                    logger.warning(f"[WORKER] Warm-up after restart failed: {e}")
+
+    def _request(self, command: str, audio: str | np.ndarray | None, args: dict) -> Iterator:
+        """Send a request and yield its streamed payloads, retrying once after a crash."""
+        generation = 0
+        for attempt in (1, 2):
+            with self._state:
+                if not self._state.wait_for(
+                    lambda g=generation: self._available and self._generation > g,
+                    timeout=self.START_TIMEOUT_S,
+                ):
+                    raise RuntimeError("Transcription worker is not available")
+                generation = self._generation
+            with self._lock:
+                self._busy = True
+                finished = yielded = False
+                try:
+                    self._conn.send((command, {**args, **self._audio_args(audio)}))
+                    while not finished:
+                        kind, payload = self._conn.recv()
+                        if kind == "pong":
+                            continue  # Late reply to a health check that timed out
+                        finished = kind in ("done", "result", "error")
+                        if kind == "error":
+                            raise RuntimeError(f"Transcription worker: {payload}")
+                        if kind != "done":
+                            yielded = True
+                            yield payload
+                    return
+                except (EOFError, OSError):
+                    finished = True
+                    if attempt == 2 or yielded:
+                        raise RuntimeError("Transcription worker crashed mid-request") from None
+                    logger.warning("[WORKER] Worker crashed mid-request, retrying after restart")
+                finally:
+                    if not finished:
+                        self._drain()  # Caller stopped early; keep the pipe in sync
+                    self._busy = False
+
+    def _drain(self) -> None:
+        """Discard the rest of an abandoned request's replies."""
+        try:
+            while self._conn.recv()[0] not in ("done", "result", "error"):
+                pass
+        except (EOFError, OSError):
+            pass
+
+    def _audio_args(self, audio: str | np.ndarray | None) -> dict:
+        """Copy samples into the shared block (growing it if needed) and describe them."""
+        if audio is None:
+            return {}
+        if isinstance(audio, str):
+            return {"path": audio}
+        audio = np.asarray(audio, dtype=np.float32)
+        if self._shm is None or self._shm.size < audio.nbytes:
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            size = max(1, -(-audio.nbytes // self.SHM_STEP_BYTES)) * self.SHM_STEP_BYTES
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        np.ndarray(audio.shape, dtype=np.float32, buffer=self._shm.buf)[:] = audio
+        return {"shm": self._shm.name, "samples": len(audio)}
+
+    @staticmethod
+    def _join(segments: Iterator) -> str:
+        text = " ".join(segment.text for segment in segments)
+        logger.info(f"Transcription complete: {text[:100]}...")
+        return text
@@ -20,8 +20,6 @@ import warnings
 from datetime import datetime
 from pathlib import Path
 
-import requests
-
 # Silence pycaw/comtypes deprecation warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pycaw")
 
@@ -32,11 +30,23 @@ os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 # Add core module to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Transcription worker processes (multiprocessing spawn) re-import this script as
+# __mp_main__: they need the paths above but must skip the server's own side effects
+IS_WORKER_PROCESS = __name__ == "__mp_main__"
+
 from config.prompts import get_prompt  # noqa: E402
 from core import Injector, Recorder, SafeNoteWriter, Transcriber  # noqa: E402, F401
+from core.cpu_partition import StageCpuMeter, plan_partition  # noqa: E402
+from core.cpu_tuning import calibrate, load_tuning  # noqa: E402
+from core.http_transport import get_transport  # noqa: E402
+from core.language_cache import LanguageCache  # noqa: E402
+from core.live_transcriber import LiveTranscriber  # noqa: E402
+from core.longform import LongFormTranscriber  # noqa: E402
+from core.model_pool import TranscriberPool  # noqa: E402
 from core.mute_detector import MuteDetector  # noqa: E402
 from core.pipelines import PipelineExecutor  # noqa: E402
 from core.processor import Processor, create_processor  # noqa: E402
+from core.response_cache import ResponseCache  # noqa: E402
 from core.system_monitor import SystemMonitor  # noqa: E402
 from models import PerformanceMetrics, SessionStats, State  # noqa: E402
 from utils.history_manager import HistoryManager  # noqa: E402
@@ -82,7 +92,8 @@ def _cleanup_temp_audio_files():
         pass  # Fail silently on cleanup
 
 
-atexit.register(_cleanup_temp_audio_files)
+if not IS_WORKER_PROCESS:
+    atexit.register(_cleanup_temp_audio_files)
 # -----------------------------------------------------------------
 
 # Configure logging - Session-based log files
@@ -110,10 +121,14 @@ def cleanup_old_logs(log_dir: Path, keep_count: int = 10):
         pass  # Ignore errors listing logs
 
 
-cleanup_old_logs(log_dir)
+if not IS_WORKER_PROCESS:
+    cleanup_old_logs(log_dir)
 
 # Build handlers list - StreamHandler only in debug mode to avoid leaking transcripts
-log_handlers = [logging.FileHandler(session_log_file)]
+# (workers replace these with their own log file once they start)
+log_handlers = [
+    logging.NullHandler() if IS_WORKER_PROCESS else logging.FileHandler(session_log_file)
+]
 if os.environ.get("DEBUG") == "1":
     log_handlers.append(logging.StreamHandler())
 
@@ -136,24 +151,55 @@ logger.warning(f"Session log: {session_log_file} (Initial level: WARNING)")
 class IpcServer:
     """Server for handling IPC commands from Electron"""
 
+    # Whisper models loaded next to the configured one: attribute -> (enable key,
+    # model key, default model)
+    SECONDARY_MODELS = {
+        "draft_transcriber": ("cascadeEnabled", "cascadeDraftModel", "tiny"),
+        "fast_transcriber": ("modelRoutingEnabled", "routingFastModel", "base"),
+    }
+    # Processor mode that cleans up each recording mode (dictation uses current_mode)
+    RECORDING_PROCESSOR_MODES = {"ask": "ask", "refine": "refine_instruction", "note": "note"}
+    # Automatic CPU calibration waits until nothing happened for this long: it loads extra
+    # model instances and runs timed decodes that would compete with dictation
+    CPU_CALIBRATION_IDLE_S = 300.0
+
     def __init__(self):
         """Initialize the IPC server"""
         self.state = State.WARMUP  # Start in WARMUP state for startup visibility
+        self._started_at = time.perf_counter()
+        # Startup milestones (ms since launch) and warm-up latencies, see _mark_startup
+        self.startup_timeline: dict = {}
         self.recorder: Recorder | None = None
         self.transcriber: Transcriber | None = None
+        self.draft_transcriber: Transcriber | None = None  # Cascade draft model (cascadeEnabled)
+        self.fast_transcriber: Transcriber | None = None  # Routing model (modelRoutingEnabled)
+        # Loaded Whisper models (hot swap + LRU); DIKTATE_TRANSCRIPTION_WORKER=1 runs them
+        # in worker processes so inference doesn't stall the IPC threads
+        self.transcriber_pool = TranscriberPool(
+            out_of_process=os.environ.get("DIKTATE_TRANSCRIPTION_WORKER") == "1",
+            worker_log_file=log_dir / f"diktate_{session_timestamp}_worker.log",
+            # Warm-up decode on load; WHISPER_WARMUP=0 turns it off to measure the difference
+            warmup=os.environ.get("WHISPER_WARMUP", "1") != "0",
+        )
         self.processor: Processor | None = None
         self.injector: Injector | None = None
         self.recording = False
         self.recording_mode = "dictate"  # 'dictate', 'ask', 'refine', 'translate', or 'note'
-        self.audio_file = None
+        self.audio_file = None  # Only set when the recording is explicitly saved to disk
+        self.audio_data = None  # In-memory float32 capture handed to the transcriber
+        self.audio_sample_rate = 16000  # Rate of audio_data (pipelines resample to 16 kHz)
+        self.audio_duration: float | None = None
+        self.device_label: str | None = None  # Input device of the last start_recording
+        self.live_transcriber: LiveTranscriber | None = None  # Opt-in partial transcription
+        self.language_cache = LanguageCache()  # Sticky auto-detected language per user/device
+        self.longform: LongFormTranscriber | None = None  # Parallel note decode (longFormEnabled)
+        self.config: dict = {}
         self.perf = PerformanceMetrics()
+        self.perf.cpu_meter = StageCpuMeter(self._transcription_pid)  # *_cpu_ms per stage
+        self.cpu_partition: dict | None = None  # Whisper CPUs / Ollama threads when enabled
         self.session_stats = SessionStats()  # Session-level stats (A.2)
-        # Fix: Create persistent HTTP session for Ollama warmup
-        self.ollama_session = requests.Session()
-        self.ollama_session.headers.update(
-            {"Connection": "keep-alive", "Keep-Alive": "timeout=60, max=100"}
-        )
-        logger.info("Ollama warmup session created with keep-alive")
+        # Shared pooled keep-alive session (the processors send through it too)
+        self.ollama_session = get_transport().session
         self.trans_mode = "none"  # Translation mode: none, es-en, en-es
         self.consecutive_failures = 0  # Track consecutive processor failures for auto-recovery
         self.custom_prompts = {}  # Custom prompts: mode -> prompt_text mapping
@@ -216,9 +262,15 @@ class IpcServer:
         except Exception as e:
             logger.error(f"[HISTORY] Failed to initialize history manager: {e}")
 
+        # Processor responses for repeated short inputs; off until _update_response_cache
+        # has checked the settings and the privacy level
+        self.response_cache = ResponseCache(enabled=False)
+
         self.warmup_complete = False  # Track full readiness (LLM)
         self.dictation_ready = False  # Track partial readiness (Whisper)
         self.is_loading_transcriber = False  # Component lock (SPEC_035)
+        self.is_calibrating_cpu = False  # CTranslate2 CPU calibration in progress
+        self._last_state_change = time.monotonic()  # For deferring work until idle
         self.is_loading_processor = False  # Component lock (SPEC_035)
 
         # Pipeline executor (extracted from PROCESSING PIPELINES section)
@@ -257,6 +309,7 @@ class IpcServer:
 
             if self.processor:
                 self.warmup_complete = True
+            self._mark_startup("system_ready")
 
             # SIGNAL READY: Transition to IDLE once both are finished
             # This ensures the user enters a completely stable state
@@ -291,8 +344,17 @@ class IpcServer:
             if not self.transcriber:
                 # SPEC_041: Use configured model or default to turbo
                 whisper_model = os.environ.get("WHISPER_MODEL", "turbo")
-                self.transcriber = Transcriber(model_size=whisper_model, device="auto")
+                self.transcriber = self.transcriber_pool.load(whisper_model, device="auto")
                 logger.info(f"[OK] Transcriber initialized ({whisper_model.upper()})")
+                self._mark_startup("transcriber_ready")
+                self.startup_timeline["whisper_warmup"] = self.transcriber_pool.warmup
+                if self.transcriber.warmup_timings:
+                    self.startup_timeline["whisper_warmup_cold_ms"] = (
+                        self.transcriber.warmup_timings["cold_ms"]
+                    )
+                    self.startup_timeline["whisper_warmup_warm_ms"] = (
+                        self.transcriber.warmup_timings["warm_ms"]
+                    )
                 self._emit_event(
                     "startup-progress", {"message": "Transcription ready", "progress": 60}
                 )
@@ -304,6 +366,130 @@ class IpcServer:
         finally:
             self.is_loading_transcriber = False
 
+    def _mark_startup(self, milestone: str) -> None:
+        """Record when a startup milestone was reached (ms since the server started)."""
+        elapsed_ms = round((time.perf_counter() - self._started_at) * 1000)
+        self.startup_timeline[f"{milestone}_ms"] = elapsed_ms
+        logger.info(f"[STARTUP] {milestone} at {elapsed_ms}ms")
+
+    def _on_transcriber_ready(self, transcriber: Transcriber) -> None:
+        """Swap in a Whisper model that finished loading in the background."""
+        self.transcriber = transcriber  # Atomic swap; in-flight transcriptions keep the old one
+        logger.info(f"[CONFIG] Transcriber switched to {transcriber.model_size.upper()}")
+        self._apply_cpu_partition()  # A pooled model may live in a different worker process
+        self._emit_event("transcriber-changed", {"model": transcriber.model_size})
+
+    def _wanted_secondary_models(self) -> dict[str, str]:
+        """Secondary Whisper models the current config asks for (attribute -> model size)."""
+        wanted = {}
+        for attr, (enabled_key, model_key, default) in self.SECONDARY_MODELS.items():
+            if not self.config.get(enabled_key):
+                continue
+            model_size = self.config.get(model_key, default)
+            if model_size not in Transcriber.SUPPORTED_MODELS:
+                logger.warning(f"[CONFIG] Unknown {model_key} '{model_size}', using {default}")
+                model_size = default
+            wanted[attr] = model_size
+        return wanted
+
+    def _update_secondary_models(self) -> None:
+        """Load or drop the Whisper models kept loaded next to the configured transcriber.
+
+        The cascade draft model (cascadeEnabled) decodes dictation first and the
+        configured model refines it afterwards; the fast routing model
+        (modelRoutingEnabled) takes short clips and clips recorded under heavy CPU
+        load. Both live in the TranscriberPool as pinned, never-active models.
+        """
+        wanted = self._wanted_secondary_models()
+        for attr in self.SECONDARY_MODELS:
+            if attr not in wanted and getattr(self, attr) is not None:
+                logger.info(f"[CONFIG] Releasing {attr} ({getattr(self, attr).model_size})")
+                setattr(self, attr, None)
+        self.transcriber_pool.pinned = {
+            self.transcriber_pool.key_for(model_size, "auto") for model_size in wanted.values()
+        }
+        for attr, model_size in wanted.items():
+            if getattr(getattr(self, attr), "model_size", None) == model_size:
+                continue
+            setattr(
+                self,
+                attr,
+                self.transcriber_pool.acquire(
+                    model_size, device="auto", on_ready=self._on_secondary_ready, activate=False
+                ),
+            )
+
+    def _on_secondary_ready(self, transcriber: Transcriber) -> None:
+        """Use a secondary model that finished loading in the background (if still wanted)."""
+        for attr, model_size in self._wanted_secondary_models().items():
+            if model_size == transcriber.model_size:
+                setattr(self, attr, transcriber)
+                logger.info(f"[CONFIG] {attr} ready ({model_size.upper()})")
+
+    def _update_response_cache(self) -> None:
+        """Apply the response cache settings and the privacy level it requires.
+
+        Cached responses are transcript-derived text, so the cache only runs while the
+        history logging intensity is at least responseCacheMinPrivacyLevel (balanced by
+        default); below it, or with responseCacheEnabled off, every entry is forgotten,
+        including a response_cache.db persisted by an earlier run. With
+        responseCachePersist, entries are kept in response_cache.db next to the history
+        database and survive restarts.
+        """
+        intensity = self.history_manager.logging_intensity if self.history_manager else 2
+        enabled = bool(self.config.get("responseCacheEnabled", True)) and intensity >= int(
+            self.config.get("responseCacheMinPrivacyLevel", 2)
+        )
+        persist_path = None
+        if self.config.get("responseCachePersist", False) or not enabled:
+            db_dir = (
+                Path(self.history_manager.db_path).parent
+                if self.history_manager
+                else Path.home() / ".diktate"
+            )
+            persist_path = str(db_dir / "response_cache.db")
+        ttl_hours = self.config.get("responseCacheTtlHours")
+        self.response_cache.configure(
+            enabled=enabled,
+            max_entries=self.config.get("responseCacheMaxEntries"),
+            ttl_s=float(ttl_hours) * 3600 if ttl_hours else None,
+            persist_path=persist_path,
+        )
+
+    def _transcription_pid(self) -> int:
+        """Pid of the process running Whisper (a transcription worker, or this server)."""
+        return getattr(self.transcriber, "pid", None) or os.getpid()
+
+    def _apply_cpu_partition(self) -> None:
+        """Split CPUs between Whisper and Ollama so the two engines stop oversubscribing cores.
+
+        With cpuPartitionEnabled, the transcription worker process is pinned to the first
+        whisperCores CPUs (default: half) and local Ollama requests get num_thread set to
+        the remaining count. Disabling it restores all CPUs and Ollama's own default.
+
+        Whisper running in-process (no DIKTATE_TRANSCRIPTION_WORKER) is not pinned: the
+        affinity would apply to the whole server, squeezing the IPC loop, injector and
+        HTTP threads onto the Whisper cores. Only Ollama's threads are limited then.
+        """
+        if self.config.get("cpuPartitionEnabled"):
+            cpus, ollama_threads = plan_partition(self.config.get("whisperCores"))
+            self.cpu_partition = {"whisper_cpus": cpus, "ollama_threads": ollama_threads}
+        elif self.cpu_partition is not None:
+            cpus, ollama_threads = None, None  # Was enabled: undo the pinning
+            self.cpu_partition = None
+        else:
+            return
+
+        if hasattr(self.transcriber, "set_affinity"):
+            self.transcriber.set_affinity(cpus)  # Worker process, kept across restarts
+        elif self.cpu_partition is not None and self.transcriber is not None:
+            self.cpu_partition["whisper_cpus"] = None
+            logger.info("[CPU] Whisper runs in-process: not pinned, it shares the server's CPUs")
+        for processor in list(self.processors.values()):
+            if hasattr(processor, "num_thread"):
+                processor.num_thread = ollama_threads
+        logger.info(f"[CPU] Partition: {self.cpu_partition or 'disabled'}")
+
     def _load_processor_async(self):
         """Asynchronously warm up the LLM processor and Ollama API.
 
@@ -323,6 +509,7 @@ class IpcServer:
             self._ensure_ollama_ready()
 
             logger.info("[STARTUP] Ollama API ready (processor will be created on first request)")
+            self._mark_startup("processor_ready")
             self._emit_event("startup-progress", {"message": "AI Engine ready", "progress": 90})
         except Exception as e:
             logger.error(f"Failed to initialize Processor: {e}")
@@ -345,6 +532,78 @@ class IpcServer:
         except Exception:
             pass
 
+        # CPU-only hosts: calibrate CTranslate2 threads once per model (results persist),
+        # once the app has been idle for a while
+        if self._needs_cpu_calibration():
+            threading.Thread(
+                target=self._calibrate_cpu_when_idle, daemon=True, name="CpuCalibrationWait"
+            ).start()
+
+    def _needs_cpu_calibration(self) -> bool:
+        """Whether the active model runs on CPU with settings that were never calibrated."""
+        t = self.transcriber
+        return (
+            t is not None
+            and getattr(t, "resolved_device", None) == "cpu"
+            and t.compute_type is None
+            and load_tuning(t.model_size) is None
+            and os.environ.get("DIKTATE_CPU_CALIBRATION", "1") != "0"
+        )
+
+    def _calibrate_cpu_when_idle(self, poll_s: float = 30.0) -> None:
+        """Start the automatic calibration once the app has idled for CPU_CALIBRATION_IDLE_S."""
+        while self._needs_cpu_calibration():
+            idle_s = time.monotonic() - self._last_state_change
+            if self.state == State.IDLE and idle_s >= self.CPU_CALIBRATION_IDLE_S:
+                self._calibrate_cpu_async(self.transcriber.model_size)
+                return
+            time.sleep(poll_s)
+
+    def _calibrate_cpu_async(self, model_size: str, clip_path: str | None = None) -> bool:
+        """Benchmark CPU thread/compute-type settings in the background and apply the winner.
+
+        Returns:
+            False if a calibration is already running
+        """
+        if self.is_calibrating_cpu:
+            return False
+        self.is_calibrating_cpu = True
+
+        def run():
+            # This process's CPU time now includes the benchmark: stop per-stage CPU metering
+            cpu_meter, self.perf.cpu_meter = self.perf.cpu_meter, None
+            try:
+                logger.info(f"[CPU_TUNE] Calibrating {model_size} on CPU...")
+                self._emit_event("cpu-calibration", {"status": "running", "model": model_size})
+                entry = calibrate(model_size, clip_path=clip_path)
+                self._emit_event(
+                    "cpu-calibration",
+                    {
+                        "status": "complete",
+                        "model": model_size,
+                        "compute_type": entry["compute_type"],
+                        "cpu_threads": entry["cpu_threads"],
+                        "rtf": entry["rtf"],
+                    },
+                )
+                # Reload the active model with the new settings (hot swap when ready)
+                t = self.transcriber
+                if t is not None and t.model_size == model_size and t.compute_type is None:
+                    self.transcriber_pool.reload(
+                        model_size, device="auto", on_ready=self._on_transcriber_ready
+                    )
+            except Exception as e:
+                logger.error(f"[CPU_TUNE] Calibration failed: {e}")
+                self._emit_event(
+                    "cpu-calibration", {"status": "failed", "model": model_size, "error": str(e)}
+                )
+            finally:
+                self.perf.cpu_meter = cpu_meter
+                self.is_calibrating_cpu = False
+
+        threading.Thread(target=run, daemon=True, name="CpuCalibration").start()
+        return True
+
     def _startup_warmup(self):
         """Deprecated: Replaced by _startup_tiered_warmup"""
         pass
@@ -381,7 +640,7 @@ class IpcServer:
             if self._check_ollama_port():
                 logger.info("[STARTUP] Ollama port is open, verifying API...")
                 try:
-                    response = requests.get("http://localhost:11434/api/tags", timeout=2)
+                    response = self.ollama_session.get("http://localhost:11434/api/tags", timeout=2)
                     if response.status_code == 200:
                         logger.info("[STARTUP] Ollama API responded successfully")
                         self._emit_event(
@@ -444,7 +703,7 @@ class IpcServer:
             # Check if model is already loaded (SPEC_035 optimization)
             model_in_vram = False
             try:
-                ps_response = requests.get("http://localhost:11434/api/ps", timeout=2)
+                ps_response = self.ollama_session.get("http://localhost:11434/api/ps", timeout=2)
                 if ps_response.status_code == 200:
                     loaded_models = ps_response.json().get("models", [])
                     # Robust matching: check for exact name, name with tag, or case-insensitive match
@@ -699,6 +958,7 @@ class IpcServer:
 
         logger.info(f"State transition: {old_state.value} -> {new_state.value}")
         self.state = new_state
+        self._last_state_change = time.monotonic()
         self._emit_event("state-change", {"state": new_state.value})
 
         # System monitoring hooks (SPEC_027)
@@ -727,6 +987,25 @@ class IpcServer:
     # ==============================================================================================
     # SECTION: CORE ACTIONS (RECORDING)
     # ==============================================================================================
+    def _preconnect_processor(self, recording_mode: str) -> None:
+        """Warm the processor this recording will be cleaned up with while the user speaks.
+
+        Resolves the processor the pipeline will use (same routing as processing) and
+        lets it open or refresh its pooled connection; the local processor also pings
+        Ollama so the model is resident when the transcript arrives. Non-fatal.
+        """
+        if not self.config.get("preconnectOnRecord", True):
+            return
+        mode = self.RECORDING_PROCESSOR_MODES.get(recording_mode, self.current_mode)
+        if mode == "raw" or (mode == "note" and not self.config.get("noteUseProcessor", True)):
+            return  # No LLM stage
+        try:
+            processor, provider = self._get_processor_for_mode(mode)
+            if processor and hasattr(processor, "prewarm") and processor.prewarm():
+                logger.info(f"[PRECONNECT] Warming {provider} for '{mode}' while recording")
+        except Exception as e:
+            logger.debug(f"[PRECONNECT] Skipped: {e}")
+
     def start_recording(
         self,
         device_id: str | None = None,
@@ -767,9 +1046,12 @@ class IpcServer:
             self.perf.reset()
             self.perf.start("total")
             self.perf.start("recording")
+            if self.system_monitor:
+                self.system_monitor.cpu_load()  # Baseline: routing sees the load over the recording
 
             # Store the mode for processing
             self.recording_mode = mode
+            self.device_label = device_label
             duration_msg = f" (max: {max_duration}s)" if max_duration > 0 else " (unlimited)"
             logger.info(f"[REC] Recording started in {mode} mode{duration_msg}")
 
@@ -781,6 +1063,22 @@ class IpcServer:
                 auto_stop_callback=self._on_recording_auto_stopped,
             )
             self.recording = True
+            self._preconnect_processor(mode)
+
+            # Opt-in: transcribe while speaking so only the last window is left at stop
+            if self.live_transcriber:
+                self.live_transcriber.stop()  # Left over from a recording that never processed
+                self.live_transcriber = None
+            if self.config.get("liveTranscriptionEnabled", False) and self.transcriber:
+                self.live_transcriber = LiveTranscriber(
+                    self.transcriber,
+                    self.recorder,
+                    self._emit_event,
+                    language="en" if mode == "dictate" else None,
+                    interval_s=int(self.config.get("liveTranscriptionIntervalMs", 2000)) / 1000,
+                )
+                self.live_transcriber.start()
+
             return {"success": True}
         except Exception as e:
             error_msg = str(e)
@@ -812,9 +1110,33 @@ class IpcServer:
             self.perf.end("recording")
             logger.info(f"[STOP] Recording stopped (mode: {self.recording_mode})")
 
-            # Save audio to temporary file
-            self.audio_file = os.path.join(self.recorder.temp_dir, "recording.wav")
-            self.recorder.save_to_file(self.audio_file)
+            # Hotkey-to-first-sample latency (warm stream + pre-roll vs cold device open)
+            if self.recorder.first_sample_latency_ms is not None:
+                self.perf.record("first_sample", self.recorder.first_sample_latency_ms)
+                logger.info(
+                    f"[REC] First sample after {self.recorder.first_sample_latency_ms:.0f}ms "
+                    f"({'warm' if self.recorder.warm_input else 'cold'} input)"
+                )
+
+            # Capture health: overflows mean PortAudio dropped input while we were busy
+            self.perf.record_count("input_overflows", self.recorder.overflow_count)
+            self.perf.record_count("dropped_frames", self.recorder.dropped_frames)
+            if self.recorder.overflow_count:
+                logger.warning(
+                    f"[REC] {self.recorder.overflow_count} input overflow(s), "
+                    f"~{self.recorder.dropped_frames} frames dropped"
+                )
+
+            # Hand the capture to the transcriber in memory (no WAV round trip)
+            self.audio_data = self.recorder.get_audio()
+            self.audio_sample_rate = self.recorder.sample_rate
+            self.audio_duration = self.recorder.duration
+            self.audio_file = None
+
+            # Only write a WAV when explicitly requested (debugging); the pipelines keep it
+            if self.config.get("saveAudioFile") or os.environ.get("DIKTATE_SAVE_AUDIO") == "1":
+                self.audio_file = os.path.join(self.recorder.temp_dir, "recording.wav")
+                self.recorder.save_to_file(self.audio_file)
 
             # Process based on mode (pipelines extracted to core.pipelines)
             if self.recording_mode == "ask":
@@ -925,29 +1247,41 @@ class IpcServer:
             should_clear_processors = False
             updates = []
 
-            # 1. Transcriber Model
-            model_size = config.get("model")
-            if model_size:
-                current_size = getattr(self.transcriber, "model_size", "")
-                if not self.transcriber or model_size != current_size:
-                    # HOTFIX: Explicitly cleanup old model before loading new one
-                    # This prevents multiple Whisper models from staying in VRAM
-                    if self.transcriber:
-                        logger.info(f"[CONFIG] Unloading old transcriber model ({current_size})...")
-                        old_transcriber = self.transcriber
-                        self.transcriber = None
-                        del old_transcriber
-
-                        # Force garbage collection to free VRAM immediately
-                        import gc
+            # 1. Transcriber Model (pooled: models loaded before swap in instantly, new ones
+            # load in the background while the current model keeps serving dictation.
+            # Idle models beyond modelPoolBudgetGb (RAM) / modelPoolGpuBudgetGb (VRAM, default
+            # 0: only the active model stays on the GPU) are evicted)
+            pool_budget = config.get("modelPoolBudgetGb")
+            gpu_budget = config.get("modelPoolGpuBudgetGb")
+            if pool_budget is not None or gpu_budget is not None:
+                self.transcriber_pool.set_budget(
+                    float(pool_budget) if pool_budget is not None else None,
+                    float(gpu_budget) if gpu_budget is not None else None,
+                )
 
-                        gc.collect()
-                        logger.info("[CONFIG] Old model unloaded, VRAM freed")
+            # 1a. Connection pools of the shared HTTP transport (all processors)
+            if "httpPoolConnections" in config or "httpPoolMaxsize" in config:
+                get_transport().configure(
+                    config.get("httpPoolConnections"), config.get("httpPoolMaxsize")
+                )
 
-                    self.transcriber = Transcriber(model_size=model_size, device="auto")
+            model_size = config.get("model")
+            if model_size:
+                if not self.transcriber:
+                    # Nothing to keep serving dictation with: load synchronously
+                    self.transcriber = self.transcriber_pool.load(model_size, device="auto")
                     updates.append(f"Model: {model_size}")
                 else:
-                    logger.debug(f"[CONFIG] Transcriber model already set to {model_size}")
+                    pooled = self.transcriber_pool.acquire(
+                        model_size, device="auto", on_ready=self._on_transcriber_ready
+                    )
+                    if pooled is None:
+                        updates.append(f"Model: {model_size} (loading)")
+                    elif pooled is not self.transcriber:
+                        self.transcriber = pooled
+                        updates.append(f"Model: {model_size}")
+                    else:
+                        logger.debug(f"[CONFIG] Transcriber model already set to {model_size}")
 
             # 2. Global Default Provider
             provider = config.get("provider")
@@ -1072,6 +1406,8 @@ class IpcServer:
                 logger.info(f"[CONFIG] Update: {self._get_config_summary(config)}")
 
             self.config = config  # Update internal state
+            self._apply_cpu_partition()
+            self._update_secondary_models()
 
             # 7. Privacy Settings (SPEC_030)
             privacy_int = config.get("privacyLoggingIntensity")
@@ -1106,6 +1442,9 @@ class IpcServer:
 
                     updates.append(f"Privacy: Int={intensity}, Scrub={scrub}")
 
+            # 8. Response cache (after privacy: the logging intensity gates it)
+            self._update_response_cache()
+
             # Store all incoming API keys
             for p in ["gemini", "anthropic", "openai"]:
                 key = config.get(f"{p}ApiKey")
@@ -1126,12 +1465,45 @@ class IpcServer:
                 self.mute_detector.update_device_label(device_label)
                 updates.append(f"AudioDevice: {device_label}")
 
+            # 7.5. Warm input: keep the mic stream open with a pre-roll (opt-in). Opened on
+            # the device start_recording will ask for (the synced audioDeviceLabel), so the
+            # next recording finds the stream already running
+            warm_input = config.get("warmInputEnabled")
+            if warm_input is not None and self.recorder:
+                try:
+                    if warm_input:
+                        preroll_ms = int(config.get("preRollMs", 300))
+                        was_warm = self.recorder.warm_input
+                        self.recorder.enable_warm_input(
+                            preroll_ms=preroll_ms,
+                            device_label=config.get("audioDeviceLabel", self.device_label),
+                        )
+                        if not was_warm:
+                            updates.append(f"WarmInput: on ({preroll_ms}ms pre-roll)")
+                    elif self.recorder.warm_input:
+                        self.recorder.disable_warm_input()
+                        updates.append("WarmInput: off")
+                except Exception as e:
+                    logger.warning(f"[CONFIG] Could not open warm input stream: {e}")
+
             return {"success": True, "updates": updates}
 
         except Exception as e:
             logger.error(f"Configuration failed: {e}")
             return {"success": False, "error": str(e)}
 
+    def _get_longform_transcriber(self) -> LongFormTranscriber:
+        """Get or create the parallel long-form transcriber for the current Whisper model."""
+        model_size = self.transcriber.model_size
+        max_workers = self.config.get("longFormWorkers")
+        current = self.longform
+        if current and (current.model_size, current.max_workers) == (model_size, max_workers):
+            return current
+        if current:
+            current.close()  # Model or worker count changed: restart with the new settings
+        self.longform = LongFormTranscriber(model_size, max_workers=max_workers)
+        return self.longform
+
     def _get_processor_for_mode(self, mode_name: str):  # noqa: C901
         """Get or create the processor using dual-profile system (SPEC_038: VRAM Optimization).
 
@@ -1275,6 +1647,8 @@ class IpcServer:
 
         # SPEC_034_EXTRAS: Update current processor reference so 'status' command reports correct model
         self.processor = p
+        if hasattr(p, "num_thread"):
+            p.num_thread = self.cpu_partition["ollama_threads"] if self.cpu_partition else None
 
         # Apply custom prompt if provided, otherwise use mode-specific defaults
         if custom_prompt and hasattr(p, "prompt"):
@@ -1331,7 +1705,29 @@ class IpcServer:
                 else:
                     data["processor"] = "NO MODEL SELECTED"
 
+                # Resolved input device (label -> PyAudio index, from the device cache)
+                if self.recorder:
+                    data["audio_device"] = self.recorder.device_registry.status()
+                data["transcriber_pool"] = self.transcriber_pool.status()
+                data["language_cache"] = self.language_cache.status()
+                data["cpu_tuning"] = getattr(self.transcriber, "tuning", None)
+                data["cpu_calibrating"] = self.is_calibrating_cpu
+                data["startup_timeline"] = self.startup_timeline
+                data["longform"] = self.longform.status() if self.longform else None
+                data["http_transport"] = get_transport().stats()
+                data["response_cache"] = self.response_cache.stats()
+
                 return {"success": True, "data": data}
+            elif cmd_name == "calibrate_cpu":
+                # Benchmark CTranslate2 thread counts/compute types for a model on CPU;
+                # progress and the result arrive as 'cpu-calibration' events
+                model_size = command.get("model") or getattr(self.transcriber, "model_size", None)
+                if not model_size:
+                    return {"success": False, "error": "No model loaded or specified"}
+                started = self._calibrate_cpu_async(model_size, clip_path=command.get("clipPath"))
+                if not started:
+                    return {"success": False, "error": "Calibration already running"}
+                return {"success": True, "data": {"model": model_size}}
             elif cmd_name == "quick_warmup":
                 # Quick warmup: Send "Hi" to the default model to prime the HTTP session
                 # This is triggered when user clicks buttons on the loading screen
@@ -1340,7 +1736,10 @@ class IpcServer:
             elif cmd_name == "configure":
                 return self.configure(command.get("config", {}))
             elif cmd_name == "health_check":
-                return self.check_health()
+                health = self.check_health()
+                if self.transcriber_pool.out_of_process and hasattr(self.transcriber, "health"):
+                    health["transcription_worker"] = self.transcriber.health()
+                return health
             elif cmd_name == "inject_text":
                 text = command.get("text", "")
                 if self.injector:
@@ -1352,6 +1751,7 @@ class IpcServer:
                 else:
                     return {"success": False, "error": "Injector not initialized"}
             elif cmd_name == "clear_history_data":
+                self.response_cache.clear()
                 if self.history_manager:
                     success = self.history_manager.wipe_all_data()
                     return {"success": success}
@@ -1397,8 +1797,8 @@ class IpcServer:
                             # SPEC_033: Use per-mode prompt
                             base_prompt = get_prompt("refine", model=model_name)
 
-                            refined_text = active_processor.process(
-                                selected_text, prompt_override=base_prompt
+                            refined_text = self.response_cache.process(
+                                active_processor, selected_text, prompt_override=base_prompt
                             )
 
                             logger.info(f"[REFINE] Refined to {len(refined_text)} chars")
@@ -1561,6 +1961,7 @@ class IpcServer:
                 scrub = command.get("scrub")
                 if level is not None and scrub is not None and self.history_manager:
                     self.history_manager.set_privacy_settings(level, scrub)
+                    self._update_response_cache()
 
                     # Updates log verbosity immediately
                     if level == 0:
@@ -1797,17 +2198,21 @@ class IpcServer:
 
                         # Get current model size
                         current_model = getattr(self.transcriber, "model_size", "medium")
+                        compute_type = getattr(self.transcriber, "compute_type", None)
 
-                        # Explicitly cleanup
+                        # Explicitly cleanup (the pool holds the other reference)
                         if self.transcriber:
-                            old_transcriber = self.transcriber
                             self.transcriber = None
-                            del old_transcriber
+                            self.transcriber_pool.drop(
+                                self.transcriber_pool.key_for(current_model, "auto", compute_type)
+                            )
                             gc.collect()
                             logger.info("[CMD] Old transcriber unloaded, VRAM freed")
 
                         # Reload with same model
-                        self.transcriber = Transcriber(model_size=current_model, device="auto")
+                        self.transcriber = self.transcriber_pool.load(
+                            current_model, device="auto", compute_type=compute_type
+                        )
                         logger.info(f"[CMD] Transcriber reloaded: {current_model}")
                         conn.sendall(b"OK")
                     except Exception as e:
@@ -1891,15 +2296,26 @@ class IpcServer:
         logger.info(f"  Session Duration: {summary['session_duration_s']:.1f}s")
         logger.info("=" * 60)
 
-        if self.recording and self.recorder:
+        if self.recorder:
             try:
-                self.recorder.stop()
+                self.recorder.close()  # Also releases a warm input stream
             except Exception as e:
                 logger.warning(f"Error stopping recorder: {e}")
 
         if hasattr(self, "listener") and self.listener:
             self.listener.stop()
 
+        # Stop transcription worker processes (no-op for in-process models)
+        try:
+            self.transcriber_pool.close()
+            if self.longform:
+                self.longform.close()
+        except Exception as e:
+            logger.warning(f"Error stopping transcription workers: {e}")
+
+        get_transport().close()
+        self.response_cache.close()
+
         # Gracefully shutdown history manager (SPEC_029)
         if self.history_manager:
             try:
@@ -59,6 +59,7 @@ class DiktatePipeline:
         self.listener: keyboard.Listener | None = None
         self.recording = False
         self.audio_file = None
+        self.audio_data = None
 
         logger.info("Initializing dIKtate pipeline...")
         self._initialize_components()
@@ -127,9 +128,8 @@ class DiktatePipeline:
             self.recorder.stop()
             logger.info("[STOP] Recording stopped")
 
-            # Save audio to temporary file
-            self.audio_file = os.path.join(self.recorder.temp_dir, "recording.wav")
-            self.recorder.save_to_file(self.audio_file)
+            # Hand the capture over in memory (no WAV round trip)
+            self.audio_data = self.recorder.get_audio()
 
             # Process the recording
             self._process_recording()
@@ -145,7 +145,7 @@ class DiktatePipeline:
 
             # Transcribe
             logger.info("[TRANSCRIBE] Transcribing audio...")
-            raw_text = self.transcriber.transcribe(self.audio_file)
+            raw_text = self.transcriber.transcribe_array(self.audio_data)
             logger.info(f"[RESULT] Transcribed: {raw_text}")
 
             # Process (clean up text)
@@ -172,6 +172,7 @@ class DiktatePipeline:
             logger.info("[SUCCESS] Text injected successfully")
 
             # Cleanup
+            self.audio_data = None
             if self.audio_file and os.path.exists(self.audio_file):
                 try:
                     os.remove(self.audio_file)
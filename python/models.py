@@ -69,10 +69,13 @@ class PerformanceMetrics:
     def __init__(self):
         self.metrics: dict[str, float] = {}
         self.start_times: dict[str, float] = {}
+        self.cpu_meter = None  # Optional StageCpuMeter: adds '<stage>_cpu_ms' metrics
 
     def start(self, metric_name: str) -> None:
         """Start timing a metric"""
         self.start_times[metric_name] = time.time()
+        if self.cpu_meter:
+            self.cpu_meter.start(metric_name)
 
     def end(self, metric_name: str) -> float:
         """End timing a metric and return duration"""
@@ -84,9 +87,24 @@ class PerformanceMetrics:
         self.metrics[metric_name] = duration
         del self.start_times[metric_name]
 
-        logger.info(f"[PERF] {metric_name}: {duration:.0f}ms")
+        cpu_ms = self.cpu_meter.end(metric_name) if self.cpu_meter else None
+        if cpu_ms is not None:
+            self.metrics[f"{metric_name}_cpu_ms"] = cpu_ms
+            logger.info(f"[PERF] {metric_name}: {duration:.0f}ms (CPU {cpu_ms:.0f}ms)")
+        else:
+            logger.info(f"[PERF] {metric_name}: {duration:.0f}ms")
         return duration
 
+    def record(self, metric_name: str, duration_ms: float) -> None:
+        """Record a duration measured elsewhere (e.g. by a component's own clock)"""
+        self.metrics[metric_name] = duration_ms
+        logger.info(f"[PERF] {metric_name}: {duration_ms:.0f}ms")
+
+    def record_count(self, metric_name: str, count: int) -> None:
+        """Record a counter (e.g. dropped audio frames) alongside the timings"""
+        self.metrics[metric_name] = count
+        logger.info(f"[PERF] {metric_name}: {count}")
+
     def get_metrics(self) -> dict[str, float]:
         """Get all recorded metrics"""
         return self.metrics.copy()
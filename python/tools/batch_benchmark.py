@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for batched transcription.
+
+Transcribes the same set of clips one by one (Transcriber.transcribe_array) and with
+Transcriber.transcribe_batch at each requested batch size, and reports clips/second
+and the speedup over the sequential baseline.
+
+Clips come from a directory of audio files (e.g. archived recordings), or from one
+long file cut into fixed-length chunks (e.g. a corpus downloaded for audio_feeder.py).
+
+Usage:
+  python batch_benchmark.py --dir ~/.diktate/recordings
+  python batch_benchmark.py --file talk.wav --clip-seconds 8 --limit 64
+  python batch_benchmark.py --dir clips/ --model small --batch-sizes 1,4,8,16
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.transcriber import Transcriber
+from faster_whisper import decode_audio
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg", ".m4a"}
+
+
+def load_clips(args) -> list:
+    """Load benchmark clips as 16 kHz float32 arrays."""
+    sample_rate = Transcriber.SAMPLE_RATE
+    clips = []
+    if args.dir:
+        for path in sorted(Path(args.dir).expanduser().iterdir()):
+            if path.suffix.lower() in AUDIO_EXTENSIONS:
+                clips.append(decode_audio(str(path), sampling_rate=sample_rate))
+    else:
+        audio = decode_audio(str(Path(args.file).expanduser()), sampling_rate=sample_rate)
+        step = int(args.clip_seconds * sample_rate)
+        clips = [audio[i : i + step] for i in range(0, len(audio), step)]
+    if args.limit:
+        clips = clips[: args.limit]
+    return clips
+
+
+def run(label: str, fn, clips: list, baseline: float | None = None) -> float:
+    """Time one pass over the clips and print throughput."""
+    start = time.perf_counter()
+    fn(clips)
+    elapsed = time.perf_counter() - start
+    rate = len(clips) / elapsed if elapsed > 0 else 0.0
+    speedup = f"  ({rate / baseline:.2f}x)" if baseline else ""
+    print(f"{label:<22} {elapsed:>8.2f}s  {rate:>8.2f} clips/s{speedup}")
+    return rate
+
+
+def main() -> int:
+    """Run the benchmark. Returns 0 on success, 1 on bad input."""
+    parser = argparse.ArgumentParser(description="Batched transcription throughput benchmark")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--dir", help="Directory of audio clips")
+    source.add_argument("--file", help="Single long audio file to cut into clips")
+    parser.add_argument("--clip-seconds", type=float, default=10.0, help="Clip length for --file")
+    parser.add_argument("--limit", type=int, default=0, help="Max number of clips (0=all)")
+    parser.add_argument("--model", default="base", help="Whisper model size (default: base)")
+    parser.add_argument("--device", default="cpu", help="cpu, cuda or auto (default: cpu)")
+    parser.add_argument("--language", default="en", help="Language code (default: en)")
+    parser.add_argument(
+        "--batch-sizes", default="4,8,16", help="Comma-separated batch sizes (default: 4,8,16)"
+    )
+    args = parser.parse_args()
+
+    clips = load_clips(args)
+    if not clips:
+        print("No clips found.")
+        return 1
+    total_s = sum(len(c) for c in clips) / Transcriber.SAMPLE_RATE
+    print(f"Clips: {len(clips)} ({total_s:.1f}s of audio)")
+
+    print(f"Loading Whisper '{args.model}' on {args.device}...")
+    transcriber = Transcriber(model_size=args.model, device=args.device)
+
+    # Warm up once so model initialization isn't charged to the first run
+    transcriber.transcribe_array(clips[0], language=args.language)
+
+    print(f"\n{'Mode':<22} {'Time':>9}  {'Throughput':>15}")
+    print("-" * 50)
+    baseline = run(
+        "sequential",
+        lambda cs: [transcriber.transcribe_array(c, language=args.language) for c in cs],
+        clips,
+    )
+    for size in (int(s) for s in args.batch_sizes.split(",") if s.strip()):
+        run(
+            f"batched (size {size})",
+            lambda cs, size=size: transcriber.transcribe_batch(
+                cs, language=args.language, batch_size=size
+            ),
+            clips,
+            baseline,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
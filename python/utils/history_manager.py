@@ -86,6 +86,9 @@ class HistoryManager:
     - Automatic cleanup of old records (30-90 day retention)
     """
 
+    # Columns update_session may change on an existing record
+    UPDATABLE_COLUMNS = ("raw_text", "processed_text", "draft_text", "refined_model")
+
     def __init__(self, db_path: str | None = None):
         """
         Initialize the HistoryManager.
@@ -165,6 +168,33 @@ class HistoryManager:
                 logger.info("Migrating history table: adding 'tokens_per_sec' column (HOTFIX_002)")
                 cursor.execute("ALTER TABLE history ADD COLUMN tokens_per_sec REAL")
 
+            # Migration: Add trimmed_silence_s (leading/trailing silence cut before Whisper)
+            if "trimmed_silence_s" not in columns:
+                logger.info("Migrating history table: adding 'trimmed_silence_s' column")
+                cursor.execute("ALTER TABLE history ADD COLUMN trimmed_silence_s REAL")
+
+            # Migrations: Whisper decoding profile and its measured real-time factor, CPU
+            # time used by Whisper / the local LLM per stage, and cascaded transcription
+            # (draft row later replaced by the refined text), and the model routing decision
+            for column, sql_type in (
+                ("decoding_profile", "TEXT"),
+                ("transcription_rtf", "REAL"),
+                ("transcription_cpu_ms", "REAL"),
+                ("processing_cpu_ms", "REAL"),
+                ("session_id", "TEXT"),
+                ("draft_text", "TEXT"),
+                ("refined_model", "TEXT"),
+                ("routing_reason", "TEXT"),
+                ("routing_cpu_percent", "REAL"),
+            ):
+                if column not in columns:
+                    logger.info(f"Migrating history table: adding '{column}' column")
+                    cursor.execute(f"ALTER TABLE history ADD COLUMN {column} {sql_type}")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_history_session
+                ON history(session_id)
+            """)
+
             # Create system_metrics table for Phase 2 monitoring
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS system_metrics (
@@ -231,6 +261,8 @@ class HistoryManager:
                 # Check if it's a metrics tuple or regular history dict
                 if isinstance(item, tuple) and item[0] == "metrics":
                     self._write_metrics_to_db(item[1])
+                elif isinstance(item, tuple) and item[0] == "update":
+                    self._update_in_db(item[1], item[2])
                 else:
                     self._write_to_db(item)
                 self.write_queue.task_done()
@@ -260,8 +292,10 @@ class HistoryManager:
                     timestamp, mode, transcriber_model, processor_model, provider,
                     raw_text, processed_text, audio_duration_s,
                     transcription_time_ms, processing_time_ms, total_time_ms,
-                    success, error_message, tokens_per_sec
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    success, error_message, tokens_per_sec, trimmed_silence_s,
+                    decoding_profile, transcription_rtf, transcription_cpu_ms, processing_cpu_ms,
+                    session_id, routing_reason, routing_cpu_percent
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
                 (
                     data.get("timestamp", datetime.now().isoformat()),
@@ -278,6 +312,14 @@ class HistoryManager:
                     data.get("success", True),
                     data.get("error_message"),
                     data.get("tokens_per_sec"),  # HOTFIX_002: GPU performance indicator
+                    data.get("trimmed_silence_s"),
+                    data.get("decoding_profile"),
+                    data.get("transcription_rtf"),
+                    data.get("transcription_cpu_ms"),
+                    data.get("processing_cpu_ms"),
+                    data.get("session_id"),
+                    data.get("routing_reason"),
+                    data.get("routing_cpu_percent"),
                 ),
             )
 
@@ -286,6 +328,29 @@ class HistoryManager:
         except sqlite3.Error as e:
             logger.warning(f"Failed to write history record: {e}")
 
+    def _update_in_db(self, session_id: str, data: dict[str, Any]) -> None:
+        """
+        Update columns of the record logged with a session_id.
+
+        Args:
+            session_id: session_id the record was logged with
+            data: Columns to set (only UPDATABLE_COLUMNS are applied)
+        """
+        fields = {k: v for k, v in data.items() if k in self.UPDATABLE_COLUMNS}
+        if not fields:
+            return
+        try:
+            conn = sqlite3.connect(self.db_path)
+            assignments = ", ".join(f"{column} = ?" for column in fields)
+            conn.execute(
+                f"UPDATE history SET {assignments} WHERE session_id = ?",
+                (*fields.values(), session_id),
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update history record: {e}")
+
     def wipe_all_data(self) -> bool:
         """
         Permanently delete all data from history and metrics tables AND file-based logs.
@@ -344,6 +409,24 @@ class HistoryManager:
         if self.logging_intensity == 0:
             return
 
+        # Queue the write asynchronously
+        self.write_queue.put(self._apply_privacy(data))
+
+    def update_session(self, session_id: str, data: dict[str, Any]) -> None:
+        """
+        Queue an update of a logged session (e.g. a cascade draft replaced by the refined
+        transcript). Non-blocking; applied after the session's own insert.
+
+        Args:
+            session_id: session_id the session was logged with
+            data: Columns to set (raw_text, processed_text, draft_text, refined_model)
+        """
+        if self.logging_intensity == 0 or not session_id:
+            return
+        self.write_queue.put(("update", session_id, self._apply_privacy(data)))
+
+    def _apply_privacy(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of session data with texts reduced to the logging intensity."""
         # Prepare data based on intensity
         processed_data = data.copy()
 
@@ -374,8 +457,16 @@ class HistoryManager:
                     processed_data.get("processed_text", "")
                 )
 
-        # Queue the write asynchronously
-        self.write_queue.put(processed_data)
+        # Cascade draft transcript: same treatment as raw_text
+        if "draft_text" in processed_data:
+            if self.logging_intensity in (1, 2):
+                processed_data["draft_text"] = None
+            elif self.pii_scrubber:
+                from utils.security import scrub_pii
+
+                processed_data["draft_text"] = scrub_pii(processed_data["draft_text"] or "")
+
+        return processed_data
 
     def log_system_metrics(self, metrics_data: dict[str, Any]) -> None:
         """
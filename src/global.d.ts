@@ -27,6 +27,8 @@ interface ElectronAPI {
   onPerformanceMetrics: (callback: (metrics: unknown) => void) => void;
   onModeChange: (callback: (mode: string) => void) => void;
   onBadgeUpdate: (callback: (badges: { processor?: string; authType?: string }) => void) => void;
+  onPartialTranscript: (callback: (text: string) => void) => void;
+  onAskResponseChunk: (callback: (chunk: { question: string; delta: string }) => void) => void;
   toggleRecording: () => Promise<unknown>;
   getInitialState: () => Promise<InitialState>;
   setSetting: (key: string, value: unknown) => Promise<void>;
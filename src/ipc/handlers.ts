@@ -10,7 +10,7 @@ import child_process from 'child_process';
 import * as path from 'path';
 import * as fs from 'fs';
 import Store from 'electron-store';
-import { UserSettings, DEFAULT_PROMPTS } from '../types/settings';
+import { UserSettings, DEFAULT_PROMPTS, BACKEND_TUNING_KEYS } from '../types/settings';
 import { PythonManager } from '../services/pythonManager';
 import { logger } from '../utils/logger';
 import { validateIpcMessage, SettingsSetSchema, redactSensitive } from '../utils/ipcSchemas';
@@ -239,6 +239,7 @@ export function registerCoreIpcHandlers(deps: CoreIpcHandlerDependencies): void
         'cloudPrompt_refine_instruction',
         'cloudPrompt_raw',
         'cloudPrompt_note',
+        ...BACKEND_TUNING_KEYS,
       ];
 
       if (syncKeys.includes(key as string)) {
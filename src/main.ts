@@ -26,6 +26,8 @@ import type {
   StatusCheckEvent,
   NoteSavedEvent,
   AskResponseEvent,
+  PartialTranscriptEvent,
+  TranscriptRefinedEvent,
   ProcessorFallbackEvent,
   RecordingAutoStoppedEvent,
   MicMutedEvent,
@@ -258,6 +260,13 @@ function setupPythonEventHandlers(): void {
     }
   });
 
+  // Live transcription while recording: show it in the status dashboard
+  pythonManager.on('partial-transcript', (data: PartialTranscriptEvent) => {
+    if (windowManager.getDebugWindow() && !windowManager.getDebugWindow()!.isDestroyed()) {
+      windowManager.getDebugWindow()!.webContents.send('partial-transcript', data.text);
+    }
+  });
+
   // Track quota for main dictation (SPEC_016 Phase 4) - REMOVED
   pythonManager.on('dictation-success', (data: DictationSuccessEvent) => {
     logger.info('MAIN', 'Dictation success event received', {
@@ -266,6 +275,15 @@ function setupPythonEventHandlers(): void {
     });
   });
 
+  // Cascaded transcription: the refined text is in history (and in the app if replaced)
+  pythonManager.on('transcript-refined', (data: TranscriptRefinedEvent) => {
+    logger.info('MAIN', 'Transcript refined', {
+      model: data.model,
+      refineMs: data.refine_ms,
+      replaced: data.replaced,
+    });
+  });
+
   // Southbound metrics
   pythonManager.on('system-metrics', (data: SystemMetricsEvent) => {
     const { phase, activity_count, metrics } = data;
@@ -331,6 +349,17 @@ function setupPythonEventHandlers(): void {
 
   // Handle Ask Mode responses
   pythonManager.on('ask-response', async (response: AskResponseEvent) => {
+    if (response.partial) {
+      // Answer still streaming: show it live in the debug window, deliver on the final event
+      if (windowManager.getDebugWindow() && !windowManager.getDebugWindow()!.isDestroyed()) {
+        windowManager.getDebugWindow()!.webContents.send('ask-response-chunk', {
+          question: response.question,
+          delta: response.delta,
+        });
+      }
+      return;
+    }
+
     logger.info('MAIN', 'Ask response received', { success: response.success });
 
     // Reset recording state
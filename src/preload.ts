@@ -41,6 +41,12 @@ const electronAPI = {
   onBadgeUpdate: (callback: (badges: { processor?: string; authType?: string }) => void) => {
     ipcRenderer.on('badge-update', (_, badges) => callback(badges));
   },
+  onPartialTranscript: (callback: (text: string) => void) => {
+    ipcRenderer.on('partial-transcript', (_, text) => callback(text));
+  },
+  onAskResponseChunk: (callback: (chunk: { question: string; delta: string }) => void) => {
+    ipcRenderer.on('ask-response-chunk', (_, chunk) => callback(chunk));
+  },
   toggleRecording: () => ipcRenderer.invoke('python:toggle-recording'),
   getInitialState: () => ipcRenderer.invoke('get-initial-state'),
   setSetting: (key: string, value: unknown) => ipcRenderer.invoke('settings:set', key, value),
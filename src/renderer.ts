@@ -36,6 +36,8 @@ interface Window {
     onPlaySound: (callback: (soundName: string) => void) => void;
     onBadgeUpdate: (callback: (badges: { processor?: string; authType?: string }) => void) => void;
     onModeChange: (callback: (mode: string) => void) => void;
+    onPartialTranscript: (callback: (text: string) => void) => void;
+    onAskResponseChunk: (callback: (chunk: { question: string; delta: string }) => void) => void;
     onSettingChange: (callback: (key: string, value: unknown) => void) => void;
     resizeWindow: (height: number) => void;
   };
@@ -112,6 +114,12 @@ let sessionCount = 0;
 let totalWords = 0;
 let totalTime = 0;
 
+// Characters of the live transcript shown next to the status
+const PARTIAL_TRANSCRIPT_CHARS = 48;
+
+// Ask Mode answer streamed so far; any status change starts over
+let streamingAnswer = '';
+
 // Live status messages for each state
 const STATUS_MESSAGES: Record<string, { text: string; message: string; typing?: boolean }> = {
   idle: { text: 'READY', message: '' },
@@ -137,6 +145,7 @@ function setStatus(state: string) {
   else if (s.includes('error')) stateKey = 'error';
 
   const statusInfo = STATUS_MESSAGES[stateKey] || STATUS_MESSAGES.idle;
+  streamingAnswer = '';
 
   // Update panel class
   statusPanel.className = `state-${stateKey}`;
@@ -219,6 +228,14 @@ function addLogEntry(level: string, message: string, _data?: Record<string, unkn
   // Log UI Removed - internal logging only
 }
 
+// Show the end of the live transcript next to the status (newest words stay visible)
+function showPartialTranscript(text: string) {
+  if (!liveMessage || !text) return;
+  liveMessage.textContent =
+    text.length > PARTIAL_TRANSCRIPT_CHARS ? `…${text.slice(-PARTIAL_TRANSCRIPT_CHARS)}` : text;
+  liveMessage.className = 'live-transcript';
+}
+
 // Helper to update labels
 function updateLabel(
   element: HTMLElement | null,
@@ -376,6 +393,21 @@ if (window.electronAPI) {
     });
   }
 
+  // Live transcript while recording; the next status change clears it
+  if (window.electronAPI.onPartialTranscript) {
+    window.electronAPI.onPartialTranscript((text: string) => {
+      showPartialTranscript(text);
+    });
+  }
+
+  // Ask Mode answer as it streams in, shown the same way as the live transcript
+  if (window.electronAPI.onAskResponseChunk) {
+    window.electronAPI.onAskResponseChunk(({ delta }) => {
+      streamingAnswer += delta;
+      showPartialTranscript(streamingAnswer);
+    });
+  }
+
   // Mode change handler (triggers status updates, not button changes)
   if (window.electronAPI.onModeChange) {
     window.electronAPI.onModeChange((mode: string) => {
@@ -13,6 +13,7 @@ import {
   CloudProfile,
   PythonConfig,
   DEFAULT_PROMPTS,
+  BACKEND_TUNING_KEYS,
 } from '../types/settings';
 import { PythonManager } from './pythonManager';
 import { logger } from '../utils/logger';
@@ -147,6 +148,15 @@ export async function syncPythonConfig(deps: ConfigSyncDependencies): Promise<vo
     privacyPiiScrubber: privacyPiiScrubber,
   };
 
+  // Backend tuning: Python's configure replaces the whole config, so every key it reads
+  // must be sent on each sync. Unset keys are left out so Python's defaults apply.
+  for (const key of BACKEND_TUNING_KEYS) {
+    const value = store.get(key);
+    if (value !== undefined) {
+      config[key] = value;
+    }
+  }
+
   // Get API credentials for all providers (SPEC_033: support multi-processor routing)
   try {
     const providers = [
@@ -390,9 +390,15 @@ export class PythonManager extends EventEmitter {
       this.emit('error', new Error(message));
     } else if (event.event === 'performance-metrics') {
       this.emit('performance-metrics', event);
+    } else if (event.event === 'partial-transcript') {
+      // Forward live transcription while recording (liveTranscription setting)
+      this.emit('partial-transcript', event);
     } else if (event.event === 'ask-response') {
       // Forward ask-response event for Q&A mode
       this.emit('ask-response', event);
+    } else if (event.event === 'transcript-refined') {
+      // Forward cascade refinement (draft replaced by the configured model's transcript)
+      this.emit('transcript-refined', event);
     } else if (event.event === 'processor-fallback') {
       // Forward processor fallback event for error recovery
       this.emit('processor-fallback', event);
@@ -89,9 +89,35 @@ export interface AskResponseEvent {
   question?: string;
   answer?: string;
   response?: string;
+  /** Streamed chunk of the answer; the final event carries the full answer */
+  partial?: boolean;
+  delta?: string;
   mode: string;
 }
 
+/**
+ * Live transcript of the recording in progress (liveTranscription setting)
+ */
+export interface PartialTranscriptEvent {
+  /** Committed text followed by the still-changing tail */
+  text: string;
+  committed: string;
+  pending: string;
+}
+
+/**
+ * Cascaded transcription: the draft was re-transcribed with the configured model
+ */
+export interface TranscriptRefinedEvent {
+  session_id: string;
+  draft: string;
+  text: string;
+  model: string;
+  refine_ms: number;
+  /** Whether the draft was replaced in the target app (cascadeReplaceInApp) */
+  replaced: boolean;
+}
+
 /**
  * Processor fell back to raw transcription (Ollama failure)
  */
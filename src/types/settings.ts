@@ -136,8 +136,111 @@ export interface UserSettings {
   uiShowActions?: boolean;
   uiShowSessionStats?: boolean;
   uiShowPerfStats?: boolean;
+
+  // Backend tuning (left unset, the Python backend applies its own defaults)
+  silenceTrimEnabled?: boolean;
+  silencePaddingMs?: number;
+  silenceRangeDb?: number;
+  silenceFloorDb?: number;
+  decodingProfile?: string; // 'instant' | 'balanced' | 'accurate'
+  instantProfileMaxS?: number;
+  decodingProfile_dictate?: string;
+  decodingProfile_ask?: string;
+  decodingProfile_refine?: string;
+  decodingProfile_translate?: string;
+  decodingProfile_note?: string;
+  liveTranscriptionEnabled?: boolean;
+  liveTranscriptionIntervalMs?: number;
+  warmInputEnabled?: boolean;
+  preRollMs?: number;
+  stickyLanguageEnabled?: boolean;
+  longFormEnabled?: boolean;
+  longFormMinS?: number;
+  longFormWorkers?: number;
+  cascadeEnabled?: boolean;
+  cascadeDraftModel?: string;
+  cascadeReplaceInApp?: boolean;
+  modelRoutingEnabled?: boolean;
+  routingFastModel?: string;
+  routingShortClipS?: number;
+  routingCpuBusyPercent?: number;
+  cpuPartitionEnabled?: boolean;
+  whisperCores?: number;
+  modelPoolBudgetGb?: number;
+  modelPoolGpuBudgetGb?: number;
+  streamInjection_standard?: boolean;
+  streamInjection_prompt?: boolean;
+  streamInjection_professional?: boolean;
+  streamInjection_ask?: boolean;
+  streamInjection_refine?: boolean;
+  streamInjection_refine_instruction?: boolean;
+  streamInjection_raw?: boolean;
+  streamInjection_note?: boolean;
+  responseCacheEnabled?: boolean;
+  responseCacheMaxEntries?: number;
+  responseCacheTtlHours?: number;
+  responseCacheMinPrivacyLevel?: number;
+  responseCachePersist?: boolean;
+  httpPoolConnections?: number;
+  httpPoolMaxsize?: number;
+  preconnectOnRecord?: boolean;
+  saveAudioFile?: boolean;
 }
 
+/**
+ * Backend tuning settings passed through to Python as-is.
+ * Only keys set in the store are synced; Python applies its own defaults for the rest.
+ */
+export const BACKEND_TUNING_KEYS = [
+  'silenceTrimEnabled',
+  'silencePaddingMs',
+  'silenceRangeDb',
+  'silenceFloorDb',
+  'decodingProfile',
+  'instantProfileMaxS',
+  'decodingProfile_dictate',
+  'decodingProfile_ask',
+  'decodingProfile_refine',
+  'decodingProfile_translate',
+  'decodingProfile_note',
+  'liveTranscriptionEnabled',
+  'liveTranscriptionIntervalMs',
+  'warmInputEnabled',
+  'preRollMs',
+  'stickyLanguageEnabled',
+  'longFormEnabled',
+  'longFormMinS',
+  'longFormWorkers',
+  'cascadeEnabled',
+  'cascadeDraftModel',
+  'cascadeReplaceInApp',
+  'modelRoutingEnabled',
+  'routingFastModel',
+  'routingShortClipS',
+  'routingCpuBusyPercent',
+  'cpuPartitionEnabled',
+  'whisperCores',
+  'modelPoolBudgetGb',
+  'modelPoolGpuBudgetGb',
+  'streamInjection_standard',
+  'streamInjection_prompt',
+  'streamInjection_professional',
+  'streamInjection_ask',
+  'streamInjection_refine',
+  'streamInjection_refine_instruction',
+  'streamInjection_raw',
+  'streamInjection_note',
+  'responseCacheEnabled',
+  'responseCacheMaxEntries',
+  'responseCacheTtlHours',
+  'responseCacheMinPrivacyLevel',
+  'responseCachePersist',
+  'httpPoolConnections',
+  'httpPoolMaxsize',
+  'preconnectOnRecord',
+  'saveAudioFile',
+] as const satisfies readonly (keyof UserSettings)[];
+
 /**
  * Local processing profile for a mode (Ollama)
  */
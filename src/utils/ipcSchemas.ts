@@ -4,6 +4,7 @@
  */
 
 import { z } from 'zod';
+import { BACKEND_TUNING_KEYS } from '../types/settings';
 
 // Settings schemas
 export const ProcessingModeSchema = z.enum(['local', 'cloud', 'google', 'anthropic', 'openai']);
@@ -114,6 +115,8 @@ export const SettingsKeySchema = z.enum([
   'uiShowActions',
   'uiShowSessionStats',
   'uiShowPerfStats',
+  // Backend tuning (synced to Python as-is)
+  ...BACKEND_TUNING_KEYS,
 ]);
 
 // API key provider schema
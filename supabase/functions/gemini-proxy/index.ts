@@ -15,6 +15,8 @@ interface GeminiRequest {
     topP?: number;
     maxOutputTokens?: number;
   };
+  /** Relay Gemini's streamGenerateContent events (SSE) instead of one JSON response */
+  stream?: boolean;
 }
 
 serve(async (req) => {
@@ -124,7 +126,7 @@ serve(async (req) => {
 
     // Parse request body
     const body = (await req.json()) as GeminiRequest;
-    const { model, contents, generationConfig } = body;
+    const { model, contents, generationConfig, stream } = body;
 
     if (!model || !contents) {
       return new Response(JSON.stringify({ error: 'Invalid request body' }), {
@@ -133,8 +135,23 @@ serve(async (req) => {
       });
     }
 
+    // Record usage if using trial credits
+    const recordUsage = async (responseText: string, tokensUsed: number) => {
+      if (usingCustomKey) return;
+      await supabase.from('api_usage').insert({
+        user_id: user.id,
+        provider: 'gemini',
+        model,
+        words_used: responseText.split(/\s+/).length,
+        tokens_used: tokensUsed,
+        cost: 0, // Free trial
+      });
+    };
+
     // Forward request to Gemini API
-    const geminiUrl = `${GEMINI_API_URL}/${model}:generateContent?key=${geminiApiKey}`;
+    const geminiUrl = stream
+      ? `${GEMINI_API_URL}/${model}:streamGenerateContent?alt=sse&key=${geminiApiKey}`
+      : `${GEMINI_API_URL}/${model}:generateContent?key=${geminiApiKey}`;
     const geminiResponse = await fetch(geminiUrl, {
       method: 'POST',
       headers: {
@@ -146,6 +163,48 @@ serve(async (req) => {
       }),
     });
 
+    if (stream && geminiResponse.ok && geminiResponse.body) {
+      // Relay events as they arrive, collecting the text to record usage at the end
+      const decoder = new TextDecoder();
+      let pending = '';
+      let responseText = '';
+      let tokensUsed = 0;
+      const meterLine = (line: string) => {
+        if (!line.startsWith('data:')) return;
+        try {
+          const event = JSON.parse(line.slice(5));
+          responseText += event.candidates?.[0]?.content?.parts?.[0]?.text || '';
+          tokensUsed = event.usageMetadata?.totalTokenCount || tokensUsed;
+        } catch {
+          // Not a JSON event; relayed as-is
+        }
+      };
+      const meter = new TransformStream<Uint8Array, Uint8Array>({
+        transform(chunk, controller) {
+          controller.enqueue(chunk);
+          pending += decoder.decode(chunk, { stream: true });
+          const lines = pending.split('\n');
+          pending = lines.pop() ?? '';
+          lines.forEach(meterLine);
+        },
+        async flush() {
+          // The last event may not end with a newline; it usually carries the token count
+          pending += decoder.decode();
+          pending.split('\n').forEach(meterLine);
+          await recordUsage(responseText, tokensUsed);
+        },
+      });
+
+      return new Response(geminiResponse.body.pipeThrough(meter), {
+        status: 200,
+        headers: {
+          'Content-Type': 'text/event-stream',
+          'Cache-Control': 'no-cache',
+          'Access-Control-Allow-Origin': '*',
+        },
+      });
+    }
+
     const geminiData = await geminiResponse.json();
 
     if (!geminiResponse.ok) {
@@ -155,22 +214,10 @@ serve(async (req) => {
       });
     }
 
-    // Calculate word count from response
-    const responseText = geminiData.candidates?.[0]?.content?.parts?.[0]?.text || '';
-    const wordsUsed = responseText.split(/\s+/).length;
-    const tokensUsed = geminiData.usageMetadata?.totalTokenCount || 0;
-
-    // Record usage if using trial credits
-    if (!usingCustomKey) {
-      await supabase.from('api_usage').insert({
-        user_id: user.id,
-        provider: 'gemini',
-        model,
-        words_used: wordsUsed,
-        tokens_used: tokensUsed,
-        cost: 0, // Free trial
-      });
-    }
+    await recordUsage(
+      geminiData.candidates?.[0]?.content?.parts?.[0]?.text || '',
+      geminiData.usageMetadata?.totalTokenCount || 0
+    );
 
     // Return the response
     return new Response(JSON.stringify(geminiData), {
@@ -3,6 +3,7 @@
 import os
 import sys
 import tempfile
+import time
 
 import pytest
 
@@ -94,9 +95,8 @@ class TestRecorderTranscriber:
         recorder = Recorder(temp_dir=temp_audio_dir)
         recorder.start()
 
-        # Simulate some audio recording (read 10 chunks)
-        for _ in range(10):
-            recorder.read_chunk()
+        # The stream callback captures audio in the background
+        time.sleep(0.5)
 
         recorder.stop()
 
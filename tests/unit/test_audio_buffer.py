@@ -0,0 +1,132 @@
+"""
+Unit tests for core/audio_buffer.py
+
+Tests appends, growth, zero-copy views and reuse between recordings.
+"""
+
+import unittest
+
+import numpy as np
+from core.audio_buffer import AudioBuffer, PreRollBuffer
+
+
+class TestAudioBuffer(unittest.TestCase):
+    """Test suite for AudioBuffer"""
+
+    def test_append_bytes_and_view(self):
+        """Chunks from PyAudio (bytes) are stored in order"""
+        buf = AudioBuffer(sample_rate=16000, initial_seconds=1.0)
+        first = np.arange(1024, dtype=np.int16)
+        second = np.arange(1024, 2048, dtype=np.int16)
+
+        buf.append(first.tobytes())
+        buf.append(second.tobytes())
+
+        self.assertEqual(len(buf), 2048)
+        self.assertEqual(buf.frames, 2048)
+        np.testing.assert_array_equal(buf.view(), np.arange(2048, dtype=np.int16))
+
+    def test_view_is_zero_copy(self):
+        """view() aliases the internal storage instead of copying it"""
+        buf = AudioBuffer(sample_rate=16000, initial_seconds=1.0)
+        buf.append(np.ones(512, dtype=np.int16))
+
+        self.assertTrue(np.shares_memory(buf.view(), buf.view()))
+        self.assertEqual(len(buf.as_bytes()), 1024)
+
+    def test_growth_preserves_samples(self):
+        """Appending past capacity grows the buffer without losing data"""
+        buf = AudioBuffer(sample_rate=1000, initial_seconds=1.0)
+        self.assertEqual(buf.capacity, 1000)
+
+        for i in range(5):
+            buf.append(np.full(700, i, dtype=np.int16))
+
+        self.assertEqual(len(buf), 3500)
+        self.assertGreaterEqual(buf.capacity, 3500)
+        self.assertEqual(buf.view()[0], 0)
+        self.assertEqual(buf.view()[-1], 4)
+
+    def test_view_detached_by_growth(self):
+        """A view taken before a growing append keeps the old samples only"""
+        buf = AudioBuffer(sample_rate=1000, initial_seconds=1.0)
+        buf.append(np.full(800, 1, dtype=np.int16))
+        before = buf.view()
+
+        buf.append(np.full(800, 2, dtype=np.int16))  # Past capacity: reallocates
+
+        self.assertFalse(np.shares_memory(before, buf.view()))
+        self.assertEqual(len(before), 800)
+
+    def test_clear_reuses_and_releases_capacity(self):
+        """clear() keeps normal capacity but releases oversized buffers"""
+        buf = AudioBuffer(sample_rate=1000, initial_seconds=1.0)
+        buf.append(np.zeros(500, dtype=np.int16))
+        buf.clear()
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(buf.capacity, 1000)
+
+        buf.append(np.zeros(10000, dtype=np.int16))
+        buf.clear()
+        self.assertEqual(buf.capacity, 1000)
+
+    def test_stereo_frames(self):
+        """frames counts samples per channel"""
+        buf = AudioBuffer(sample_rate=16000, channels=2, initial_seconds=1.0)
+        buf.append(np.zeros(2048, dtype=np.int16))
+        self.assertEqual(buf.frames, 1024)
+
+
+class TestPreRollBuffer(unittest.TestCase):
+    """Test suite for PreRollBuffer"""
+
+    def test_partial_fill_keeps_everything(self):
+        """Before the ring is full, snapshot() returns every sample in order"""
+        ring = PreRollBuffer(capacity=8)
+        ring.write(np.arange(5, dtype=np.int16).tobytes())
+
+        self.assertEqual(len(ring), 5)
+        np.testing.assert_array_equal(ring.snapshot(), np.arange(5, dtype=np.int16))
+
+    def test_wraparound_keeps_newest_oldest_first(self):
+        """Writes that wrap past the end overwrite the oldest samples"""
+        ring = PreRollBuffer(capacity=8)
+        ring.write(np.arange(6, dtype=np.int16))
+        ring.write(np.arange(6, 11, dtype=np.int16))  # Wraps: 3 at the end, 2 at the start
+
+        self.assertEqual(len(ring), 8)
+        np.testing.assert_array_equal(ring.snapshot(), np.arange(3, 11, dtype=np.int16))
+
+        ring.write(np.arange(11, 14, dtype=np.int16))
+        np.testing.assert_array_equal(ring.snapshot(), np.arange(6, 14, dtype=np.int16))
+
+    def test_oversized_write_keeps_tail(self):
+        """A chunk larger than the ring leaves only its last `capacity` samples"""
+        ring = PreRollBuffer(capacity=4)
+        ring.write(np.arange(3, dtype=np.int16))
+        ring.write(np.arange(100, 110, dtype=np.int16))
+
+        np.testing.assert_array_equal(ring.snapshot(), np.arange(106, 110, dtype=np.int16))
+
+    def test_snapshot_is_a_copy(self):
+        """Later writes don't change a snapshot already handed to a recording"""
+        ring = PreRollBuffer(capacity=4)
+        ring.write(np.ones(4, dtype=np.int16))
+        snapshot = ring.snapshot()
+
+        ring.write(np.full(4, 7, dtype=np.int16))
+
+        np.testing.assert_array_equal(snapshot, np.ones(4, dtype=np.int16))
+
+    def test_clear(self):
+        """clear() empties the ring"""
+        ring = PreRollBuffer(capacity=4)
+        ring.write(np.ones(6, dtype=np.int16))
+        ring.clear()
+
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(len(ring.snapshot()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
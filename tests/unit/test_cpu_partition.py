@@ -0,0 +1,110 @@
+"""
+Unit tests for core/cpu_partition.py
+
+Tests how plan_partition() splits CPUs between Whisper and Ollama and how
+StageCpuMeter attributes process CPU time to pipeline stages (psutil is
+patched with fake processes).
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import psutil
+
+from core.cpu_partition import StageCpuMeter, plan_partition
+
+
+class TestPlanPartition(unittest.TestCase):
+    """Test plan_partition()."""
+
+    @patch("core.cpu_partition.psutil.cpu_count", return_value=8)
+    def test_default_is_half(self, _):
+        """By default Whisper gets the first half of the CPUs, Ollama the rest"""
+        assert plan_partition() == ([0, 1, 2, 3], 4)
+
+    @patch("core.cpu_partition.psutil.cpu_count", return_value=8)
+    def test_whisper_cores(self, _):
+        """whisperCores sets Whisper's share; Ollama keeps at least one CPU"""
+        assert plan_partition(6) == ([0, 1, 2, 3, 4, 5], 2)
+        assert plan_partition(32) == ([0, 1, 2, 3, 4, 5, 6], 1)
+        assert plan_partition(0) == ([0, 1, 2, 3], 4)  # Unset in the settings UI
+
+    @patch("core.cpu_partition.psutil.cpu_count", return_value=1)
+    def test_single_cpu(self, _):
+        """With one CPU there is nothing to split"""
+        assert plan_partition() == ([0], 1)
+
+
+class FakeProcesses:
+    """psutil.Process stand-in with settable CPU times per pid."""
+
+    def __init__(self):
+        self.cpu_s: dict[int, float] = {}
+
+    def __call__(self, pid: int):
+        if pid not in self.cpu_s:
+            raise psutil.NoSuchProcess(pid)
+        user = self.cpu_s[pid]
+        return SimpleNamespace(cpu_times=lambda: SimpleNamespace(user=user, system=0.0))
+
+
+class TestStageCpuMeter(unittest.TestCase):
+    """Test StageCpuMeter.start()/end()."""
+
+    def setUp(self):
+        self.processes = FakeProcesses()
+        patcher = patch("core.cpu_partition.psutil.Process", self.processes)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.whisper_pid = 100
+        self.meter = StageCpuMeter(lambda: self.whisper_pid)
+
+    def test_whisper_stage_measures_transcriber_process(self):
+        """A transcription stage reports the CPU time of the Whisper process"""
+        self.processes.cpu_s = {100: 5.0}
+        self.meter.start("transcription")
+        self.processes.cpu_s = {100: 7.5}
+
+        assert self.meter.end("transcription") == 2500.0
+
+    def test_llm_stage_measures_ollama_processes(self):
+        """LLM stages add up the CPU time of every Ollama process"""
+        ollama = [
+            SimpleNamespace(info={"pid": 200, "name": "ollama.exe"}),
+            SimpleNamespace(info={"pid": 201, "name": "ollama_llama_server"}),
+            SimpleNamespace(info={"pid": 300, "name": "python"}),
+        ]
+        self.processes.cpu_s = {200: 1.0, 201: 10.0, 300: 50.0}
+        with patch("core.cpu_partition.psutil.process_iter", return_value=ollama):
+            self.meter.start("processing")
+        self.processes.cpu_s = {200: 1.5, 201: 12.0, 300: 90.0}
+
+        assert self.meter.end("processing") == 2500.0
+
+    def test_ollama_scan_is_cached(self):
+        """Ollama pids are looked up again only after OLLAMA_SCAN_INTERVAL_S"""
+        with patch("core.cpu_partition.psutil.process_iter", return_value=[]) as process_iter:
+            self.meter.start("processing")
+            self.meter.start("ask")
+
+        process_iter.assert_called_once()
+
+    def test_unmeasured_stages(self):
+        """Other stages, or a stage that was never started, return None"""
+        self.meter.start("injection")
+
+        assert self.meter.end("injection") is None
+        assert self.meter.end("transcription") is None
+
+    def test_exited_process_is_skipped(self):
+        """A process that exits mid-stage doesn't fail the measurement"""
+        self.processes.cpu_s = {100: 5.0}
+        self.meter.start("transcription")
+        self.processes.cpu_s = {}  # Worker crashed
+
+        assert self.meter.end("transcription") == 0.0
+
+
+if __name__ == "__main__":
+    unittest.main()
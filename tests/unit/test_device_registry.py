@@ -0,0 +1,126 @@
+"""
+Unit tests for core/device_registry.py
+
+Tests label resolution, cache hits, stale-entry invalidation and the miss
+backoff of AudioDeviceRegistry against a fake PyAudio device list.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from core.device_registry import AudioDeviceRegistry
+
+
+class FakePyAudio:
+    """Minimal PyAudio stand-in: a list of devices on host API 0, with call counts."""
+
+    def __init__(self, devices: list[dict]):
+        self.devices = devices
+        self.enumerations = 0
+        self.lookups = 0
+
+    def get_host_api_info_by_index(self, index: int) -> dict:
+        self.enumerations += 1
+        return {"deviceCount": len(self.devices)}
+
+    def get_device_info_by_host_api_device_index(self, host_api: int, i: int) -> dict:
+        return self.devices[i]
+
+    def get_device_info_by_index(self, index: int) -> dict:
+        self.lookups += 1
+        for device in self.devices:
+            if device["index"] == index:
+                return device
+        raise OSError(f"Invalid device index {index}")
+
+
+def _device(index: int, name: str, inputs: int = 1) -> dict:
+    return {"index": index, "name": name, "maxInputChannels": inputs}
+
+
+class TestAudioDeviceRegistry(unittest.TestCase):
+    """Test AudioDeviceRegistry.resolve() and its cache."""
+
+    def setUp(self):
+        self.p = FakePyAudio(
+            [
+                _device(0, "Speakers (Realtek)", inputs=0),
+                _device(1, "Microphone (Realtek)"),
+                _device(2, "Headset Microphone (Jabra)"),
+            ]
+        )
+        self.registry = AudioDeviceRegistry()
+
+    def test_default_device_skips_enumeration(self):
+        """No label and the default id resolve to None without touching PyAudio"""
+        assert self.registry.resolve(self.p, "default", None) is None
+        assert self.p.enumerations == 0
+        assert self.registry.status()["name"] == "Default"
+
+    def test_fuzzy_match_on_input_devices(self):
+        """The label matches case-insensitively against input devices only"""
+        assert self.registry.resolve(self.p, "abc", "headset microphone") == 2
+        assert self.registry.resolve(self.p, "abc", "Speakers") is None  # Output only
+
+    def test_second_resolve_is_a_cache_hit(self):
+        """A known label is validated with one lookup instead of a full enumeration"""
+        self.registry.resolve(self.p, "abc", "Jabra")
+        index = self.registry.resolve(self.p, "abc", "Jabra")
+
+        assert index == 2
+        assert self.p.enumerations == 1
+        assert self.p.lookups == 1
+        assert self.registry.status() == {
+            "label": "Jabra",
+            "index": 2,
+            "name": "Headset Microphone (Jabra)",
+            "cached": True,
+        }
+
+    def test_renamed_device_is_re_enumerated(self):
+        """An entry whose index now holds another device is dropped and re-resolved"""
+        self.registry.resolve(self.p, "abc", "Jabra")
+        # Unplugged: the indexes shift and 2 is now a different device
+        self.p.devices = [
+            _device(0, "Speakers (Realtek)", inputs=0),
+            _device(1, "Headset Microphone (Jabra)"),
+            _device(2, "Microphone (Realtek)"),
+        ]
+
+        assert self.registry.resolve(self.p, "abc", "Jabra") == 1
+        assert self.p.enumerations == 2
+        assert self.registry.status()["cached"] is False
+
+    def test_missing_device_is_re_enumerated(self):
+        """An entry whose index no longer exists is re-resolved"""
+        self.registry.resolve(self.p, "abc", "Jabra")
+        self.p.devices = self.p.devices[:2]
+
+        assert self.registry.resolve(self.p, "abc", "Jabra") is None
+        assert self.p.enumerations == 2
+
+    def test_invalidate_forces_enumeration(self):
+        """invalidate(label) drops that entry (e.g. after a failed stream open)"""
+        self.registry.resolve(self.p, "abc", "Jabra")
+        self.registry.invalidate("JABRA")
+        self.registry.resolve(self.p, "abc", "Jabra")
+
+        assert self.p.enumerations == 2
+
+    def test_miss_is_retried_after_backoff(self):
+        """A label that matched nothing is only re-enumerated every MISS_TTL_S"""
+        with patch("core.device_registry.time.time", return_value=1000.0):
+            assert self.registry.resolve(self.p, "abc", "USB Mic") is None
+
+        self.p.devices.append(_device(3, "USB Mic"))
+        with patch("core.device_registry.time.time", return_value=1029.0):
+            assert self.registry.resolve(self.p, "abc", "USB Mic") is None  # Still backing off
+        assert self.p.enumerations == 1
+
+        with patch("core.device_registry.time.time", return_value=1031.0):
+            assert self.registry.resolve(self.p, "abc", "USB Mic") == 3  # Plugged in meanwhile
+        assert self.p.enumerations == 2
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -167,6 +167,91 @@ class TestHistoryManagerInit:
             manager.shutdown()
 
 
+class TestMigrations:
+    """Test columns added to an existing history table."""
+
+    def _legacy_db(self, db_path: Path) -> None:
+        """Create a history table as shipped before the per-session metrics columns."""
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, mode TEXT, raw_text TEXT, "
+            "success BOOLEAN)"
+        )
+        conn.execute("INSERT INTO history (mode, raw_text, success) VALUES ('dictate', 'old', 1)")
+        conn.commit()
+        conn.close()
+
+    def _columns(self, db_path: Path) -> set[str]:
+        conn = sqlite3.connect(str(db_path))
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(history)")}
+        conn.close()
+        return columns
+
+    def test_adds_trimmed_silence_column(self):
+        """Opening a legacy database adds trimmed_silence_s and keeps existing rows"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            self._legacy_db(db_path)
+
+            manager = HistoryManager(db_path=str(db_path))
+
+            assert "trimmed_silence_s" in self._columns(db_path)
+            rows = manager.get_sessions_by_mode("dictate")
+            assert len(rows) == 1
+            assert rows[0]["trimmed_silence_s"] is None
+
+            manager.shutdown()
+
+    def test_adds_decoding_profile_columns(self):
+        """Opening a legacy database adds decoding_profile and transcription_rtf"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            self._legacy_db(db_path)
+
+            manager = HistoryManager(db_path=str(db_path))
+
+            assert {"decoding_profile", "transcription_rtf"} <= self._columns(db_path)
+
+            manager.shutdown()
+
+    def test_adds_stage_cpu_columns(self):
+        """Opening a legacy database adds transcription_cpu_ms and processing_cpu_ms"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            self._legacy_db(db_path)
+
+            manager = HistoryManager(db_path=str(db_path))
+
+            assert {"transcription_cpu_ms", "processing_cpu_ms"} <= self._columns(db_path)
+
+            manager.shutdown()
+
+    def test_adds_cascade_columns(self):
+        """Opening a legacy database adds session_id, draft_text and refined_model"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            self._legacy_db(db_path)
+
+            manager = HistoryManager(db_path=str(db_path))
+
+            assert {"session_id", "draft_text", "refined_model"} <= self._columns(db_path)
+
+            manager.shutdown()
+
+    def test_adds_routing_columns(self):
+        """Opening a legacy database adds routing_reason and routing_cpu_percent"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            self._legacy_db(db_path)
+
+            manager = HistoryManager(db_path=str(db_path))
+
+            assert {"routing_reason", "routing_cpu_percent"} <= self._columns(db_path)
+
+            manager.shutdown()
+
+
 class TestPrivacySettings:
     """Test privacy-related methods."""
 
@@ -354,6 +439,175 @@ class TestLogSession:
 
             manager.shutdown()
 
+    def test_log_session_stores_trimmed_silence(self):
+        """log_session should store the silence trimmed before transcription"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            manager = HistoryManager(db_path=str(db_path))
+
+            manager.log_session(
+                {
+                    "mode": "dictate",
+                    "audio_duration_s": 3.0,
+                    "trimmed_silence_s": 0.84,
+                    "success": True,
+                }
+            )
+            manager.write_queue.join()
+
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute("SELECT trimmed_silence_s FROM history").fetchone()
+            conn.close()
+
+            assert row[0] == pytest.approx(0.84)
+
+            manager.shutdown()
+
+    def test_log_session_stores_decoding_profile(self):
+        """log_session should store the decoding profile and its real-time factor"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            manager = HistoryManager(db_path=str(db_path))
+
+            manager.log_session(
+                {
+                    "mode": "dictate",
+                    "audio_duration_s": 2.5,
+                    "decoding_profile": "instant",
+                    "transcription_rtf": 0.12,
+                    "success": True,
+                }
+            )
+            manager.write_queue.join()
+
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute("SELECT decoding_profile, transcription_rtf FROM history").fetchone()
+            conn.close()
+
+            assert row[0] == "instant"
+            assert row[1] == pytest.approx(0.12)
+
+            manager.shutdown()
+
+    def test_log_session_stores_stage_cpu_time(self):
+        """log_session should store the CPU time Whisper and the local LLM used"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            manager = HistoryManager(db_path=str(db_path))
+
+            manager.log_session(
+                {
+                    "mode": "dictate",
+                    "transcription_cpu_ms": 2400.0,
+                    "processing_cpu_ms": 950.5,
+                    "success": True,
+                }
+            )
+            manager.write_queue.join()
+
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute(
+                "SELECT transcription_cpu_ms, processing_cpu_ms FROM history"
+            ).fetchone()
+            conn.close()
+
+            assert row == (pytest.approx(2400.0), pytest.approx(950.5))
+
+            manager.shutdown()
+
+    def test_log_session_stores_routing_decision(self):
+        """log_session should store which model the clip was routed to and why"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            manager = HistoryManager(db_path=str(db_path))
+
+            manager.log_session(
+                {
+                    "mode": "dictate",
+                    "transcriber_model": "base",
+                    "routing_reason": "cpu_busy",
+                    "routing_cpu_percent": 91.5,
+                    "success": True,
+                }
+            )
+            manager.write_queue.join()
+
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute(
+                "SELECT transcriber_model, routing_reason, routing_cpu_percent FROM history"
+            ).fetchone()
+            conn.close()
+
+            assert row == ("base", "cpu_busy", pytest.approx(91.5))
+
+            manager.shutdown()
+
+
+class TestUpdateSession:
+    """Test update_session() (cascade refinement of a logged session)."""
+
+    def _log_draft(self, manager: HistoryManager) -> None:
+        manager.log_session(
+            {
+                "mode": "dictate",
+                "transcriber_model": "tiny",
+                "raw_text": "wreck a nice beach",
+                "processed_text": "Wreck a nice beach.",
+                "session_id": "abc123",
+                "success": True,
+            }
+        )
+
+    def test_update_session_replaces_draft(self):
+        """update_session should replace the draft text of the logged session"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            manager = HistoryManager(db_path=str(db_path))
+            manager.set_privacy_settings(level=3, scrub=False)
+
+            self._log_draft(manager)
+            manager.update_session(
+                "abc123",
+                {
+                    "raw_text": "recognize speech",
+                    "processed_text": "Recognize speech.",
+                    "draft_text": "wreck a nice beach",
+                    "refined_model": "turbo",
+                },
+            )
+            manager.write_queue.join()
+
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute(
+                "SELECT processed_text, draft_text, refined_model, transcriber_model FROM history"
+            ).fetchone()
+            conn.close()
+
+            assert row == ("Recognize speech.", "wreck a nice beach", "turbo", "tiny")
+
+            manager.shutdown()
+
+    def test_update_session_applies_privacy_level(self):
+        """update_session should drop text the privacy level doesn't allow storing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            manager = HistoryManager(db_path=str(db_path))
+            manager.set_privacy_settings(level=1, scrub=False)
+
+            self._log_draft(manager)
+            manager.update_session(
+                "abc123", {"raw_text": "recognize speech", "refined_model": "turbo"}
+            )
+            manager.write_queue.join()
+
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute("SELECT raw_text, refined_model FROM history").fetchone()
+            conn.close()
+
+            assert row == (None, "turbo")
+
+            manager.shutdown()
+
 
 class TestQueryMethods:
     """Test search and query methods."""
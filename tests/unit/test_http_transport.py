@@ -0,0 +1,92 @@
+"""
+Unit tests for core/http_transport.py
+
+Tests connection reuse, prewarming and pool sizing of the shared transport
+against a local keep-alive HTTP server.
+"""
+
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.http_transport import HttpTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep the connection open between requests
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpTransport(unittest.TestCase):
+    """Test the shared pooled transport."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.origin = f"http://127.0.0.1:{self.server.server_port}"
+        self.transport = HttpTransport(pool_connections=2, pool_maxsize=2)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _host_stats(self) -> dict:
+        return self.transport.stats()["hosts"].get(self.origin, {})
+
+    def test_requests_reuse_one_connection(self):
+        """Sequential requests to a host share one keep-alive connection"""
+        for _ in range(3):
+            self.transport.session.get(f"{self.origin}/api/tags", timeout=5)
+
+        host = self._host_stats()
+        assert host["requests"] == 3
+        assert host["connections"] == 1
+        assert host["reused"] == 2
+        assert self.transport.stats()["reuse_rate"] == 0.667
+
+    def test_prewarm_opens_connection_for_next_request(self):
+        """A prewarmed connection is reused by the next request, and not warmed twice"""
+        assert self.transport.prewarm(f"{self.origin}/api/generate") is True
+
+        # The HEAD's connection is back in the pool once the prewarm thread is done with it
+        deadline = time.monotonic() + 5
+        while self._host_stats().get("idle") != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.transport.prewarm(f"{self.origin}/api/generate") is False
+
+        self.transport.session.get(f"{self.origin}/api/tags", timeout=5)
+        host = self._host_stats()
+        assert host["connections"] == 1
+        assert host["reused"] == 1
+        assert self.transport.stats()["prewarms"] == 1
+
+    def test_configure_resizes_pools(self):
+        """Resizing replaces the pools; the session keeps working"""
+        self.transport.session.get(f"{self.origin}/", timeout=5)
+
+        self.transport.configure(pool_maxsize=8)
+
+        stats = self.transport.stats()
+        assert stats["pool_connections"] == 2
+        assert stats["pool_maxsize"] == 8
+        assert stats["hosts"] == {}
+        assert self.transport.session.get(f"{self.origin}/", timeout=5).status_code == 200
+
+
+if __name__ == "__main__":
+    unittest.main()
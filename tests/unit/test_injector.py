@@ -400,5 +400,48 @@ class TestTypeText(unittest.TestCase):
             mock_paste_text.assert_called_once_with("test text")
 
 
+class TestReplaceLast(unittest.TestCase):
+    """Test replace_last method (cascade draft replacement)."""
+
+    def _injector(self, trailing_space: bool) -> Injector:
+        injector = Injector()
+        injector.keyboard = Mock()
+        injector.keyboard.pressed = MagicMock()
+        injector.add_trailing_space = trailing_space
+        return injector
+
+    @patch("time.sleep")
+    def test_replace_last_selects_previous_paste_with_space(self, mock_sleep):
+        """replace_last should Shift+Left over the draft and its trailing space, then paste"""
+        injector = self._injector(trailing_space=True)
+
+        with patch.object(injector, "paste_text") as mock_paste_text:
+            injector.replace_last("Draft.", "Refined text.")
+
+        injector.keyboard.pressed.assert_called_once_with(Key.shift)
+        assert injector.keyboard.press.call_args_list == [call(Key.left)] * 7
+        assert injector.keyboard.release.call_count == 7
+        mock_paste_text.assert_called_once_with("Refined text.")
+
+    @patch("time.sleep")
+    def test_replace_last_without_trailing_space(self, mock_sleep):
+        """replace_last should select only the draft when no trailing space was pasted"""
+        injector = self._injector(trailing_space=False)
+
+        with patch.object(injector, "paste_text"):
+            injector.replace_last("Draft.", "Refined text.")
+
+        assert injector.keyboard.press.call_count == 6
+
+    @patch("time.sleep")
+    def test_replace_last_raises_on_error(self, mock_sleep):
+        """replace_last should re-raise so the caller can report it as not replaced"""
+        injector = self._injector(trailing_space=True)
+        injector.keyboard.press.side_effect = RuntimeError("no input desktop")
+
+        with pytest.raises(RuntimeError):
+            injector.replace_last("Draft.", "Refined text.")
+
+
 if __name__ == "__main__":
     unittest.main()
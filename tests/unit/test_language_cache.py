@@ -0,0 +1,74 @@
+"""
+Unit tests for core/language_cache.py
+
+Tests reuse of confident detections, re-detection triggers and persistence.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.language_cache import LanguageCache
+
+
+class TestLanguageCache(unittest.TestCase):
+    """Test suite for LanguageCache"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = Path(self.test_dir) / "language_cache.json"
+        self.cache = LanguageCache(self.path)
+        self.key = LanguageCache.key_for("USB Mic")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_reuses_confident_detection(self):
+        """A confident detection is returned until REDETECT_EVERY reuses"""
+        self.assertIsNone(self.cache.lookup(self.key))
+        self.cache.update(self.key, "es", 0.97)
+
+        for _ in range(LanguageCache.REDETECT_EVERY):
+            self.assertEqual(self.cache.lookup(self.key), "es")
+        self.assertIsNone(self.cache.lookup(self.key))
+
+    def test_low_probability_not_reused(self):
+        """Detections below MIN_PROBABILITY force detection on the next clip"""
+        self.cache.update(self.key, "pt", 0.55)
+        self.assertIsNone(self.cache.lookup(self.key))
+
+    def test_keyed_per_device(self):
+        """Each input device keeps its own language"""
+        self.cache.update(self.key, "de", 0.99)
+        self.assertIsNone(self.cache.lookup(LanguageCache.key_for("Headset")))
+
+    def test_persists_across_instances(self):
+        """Entries survive a restart"""
+        self.cache.update(self.key, "fr", 0.92)
+        self.assertEqual(LanguageCache(self.path).lookup(self.key), "fr")
+
+    def test_old_detection_expires(self):
+        """An entry older than MAX_AGE_S is detected again"""
+        with patch("core.language_cache.time.time", return_value=1000.0):
+            self.cache.update(self.key, "it", 0.95)
+        with patch("core.language_cache.time.time", return_value=1001.0 + LanguageCache.MAX_AGE_S):
+            self.assertIsNone(self.cache.lookup(self.key))
+
+    def test_invalidate(self):
+        """invalidate() forgets the entry on disk too"""
+        self.cache.update(self.key, "fr", 0.92)
+        self.cache.invalidate(self.key)
+
+        self.assertIsNone(LanguageCache(self.path).lookup(self.key))
+
+    def test_corrupt_file_is_ignored(self):
+        """A damaged cache file starts an empty cache instead of failing"""
+        self.path.write_text("{not json")
+
+        self.assertEqual(LanguageCache(self.path).status()["entries"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Unit tests for core/live_transcriber.py
+
+Tests how LiveTranscriber commits stable segments, moves its window and
+finalizes, driving _decode_window() directly with a fake recorder and a mock
+transcriber.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from core.live_transcriber import LiveTranscriber
+
+SAMPLE_RATE = 16000
+
+
+def _segment(text: str, end: float) -> SimpleNamespace:
+    return SimpleNamespace(text=text, end=end)
+
+
+class FakeRecorder:
+    """Recorder stand-in: get_audio() slices a fixed float32 recording."""
+
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self, audio: np.ndarray):
+        self.audio = audio
+
+    def get_audio(self, start_frame: int = 0) -> np.ndarray:
+        return self.audio[start_frame:]
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+class TestLiveTranscriber(unittest.TestCase):
+    """Test _decode_window() and finalize()."""
+
+    def setUp(self):
+        self.transcriber = MagicMock()
+        self.emit = MagicMock()
+        self.recorder = FakeRecorder(_speech(5.0))
+        self.live = LiveTranscriber(self.transcriber, self.recorder, self.emit, profile="accurate")
+
+    def test_commits_segments_clear_of_the_end(self):
+        """Segments ending before the commit margin are committed and the window moves past them"""
+        self.transcriber.transcribe_segments.return_value = [
+            _segment("Hello there.", 1.5),
+            _segment("How are you?", 3.0),
+            _segment("I'm", 4.8),  # Within COMMIT_MARGIN_S of the end: may still change
+        ]
+
+        self.live._decode_window()
+
+        assert self.live.committed_segments == ["Hello there.", "How are you?"]
+        assert self.live.committed_samples == 3 * SAMPLE_RATE
+        self.transcriber.transcribe_segments.assert_called_once()
+        assert self.transcriber.transcribe_segments.call_args.kwargs["profile"] == "instant"
+        self.emit.assert_called_once_with(
+            "partial-transcript",
+            {
+                "text": "Hello there. How are you? I'm",
+                "committed": "Hello there. How are you?",
+                "pending": "I'm",
+            },
+        )
+
+    def test_last_segment_is_never_committed(self):
+        """A single segment stays pending even when it ends early"""
+        self.transcriber.transcribe_segments.return_value = [_segment("Hello.", 1.0)]
+
+        self.live._decode_window()
+
+        assert self.live.committed_segments == []
+        assert self.live.committed_samples == 0
+
+    def test_next_window_starts_after_committed_audio(self):
+        """The following decode only covers uncommitted audio, prompted with committed text"""
+        self.transcriber.transcribe_segments.return_value = [
+            _segment("Hello there.", 2.0),
+            _segment("How", 4.9),
+        ]
+        self.live._decode_window()
+        self.recorder.audio = _speech(7.0)
+
+        self.live._decode_window()
+
+        audio = self.transcriber.transcribe_segments.call_args.args[0]
+        assert len(audio) == 5 * SAMPLE_RATE
+        assert self.transcriber.transcribe_segments.call_args.kwargs["initial_prompt"] == (
+            "Hello there."
+        )
+
+    def test_long_window_is_trimmed(self):
+        """Past MAX_WINDOW_S everything but the last segment is committed, stable or not"""
+        self.recorder.audio = _speech(LiveTranscriber.MAX_WINDOW_S + 1)
+        self.transcriber.transcribe_segments.return_value = [
+            _segment("One long sentence", 10.0),
+            _segment("that keeps going", 20.5),
+            _segment("on", 21.0),
+        ]
+
+        self.live._decode_window()
+
+        assert self.live.committed_segments == ["One long sentence", "that keeps going"]
+        assert self.live.committed_samples == int(20.5 * SAMPLE_RATE)
+
+    def test_silent_window_is_skipped(self):
+        """Silence before the first word is skipped without a decode"""
+        self.recorder.audio = np.zeros(3 * SAMPLE_RATE, dtype=np.float32)
+
+        self.live._decode_window()
+
+        self.transcriber.transcribe_segments.assert_not_called()
+        self.emit.assert_not_called()
+        keep = int(LiveTranscriber.SILENCE_KEEP_S * SAMPLE_RATE)
+        assert self.live.committed_samples == 3 * SAMPLE_RATE - keep
+
+    def test_short_window_waits(self):
+        """Less than MIN_WINDOW_S of new audio is not decoded"""
+        self.recorder.audio = _speech(0.5)
+
+        self.live._decode_window()
+
+        self.transcriber.transcribe_segments.assert_not_called()
+
+    def test_finalize_decodes_only_the_tail(self):
+        """finalize() appends the tail transcription to the committed text"""
+        self.live.committed_segments = ["Hello there."]
+        self.transcriber.transcribe_segments.return_value = [_segment("Bye.", 1.0)]
+        tail = _speech(1.0)
+
+        text = self.live.finalize(tail)
+
+        assert text == "Hello there. Bye."
+        self.transcriber.transcribe_segments.assert_called_once_with(
+            tail, language=None, initial_prompt="Hello there.", profile="accurate"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
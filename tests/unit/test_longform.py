@@ -0,0 +1,56 @@
+"""
+Unit tests for long-form chunking.
+Tests that chunks cover the recording and that cuts land in pauses.
+"""
+
+import unittest
+
+import numpy as np
+from core.longform import split_on_silence
+
+SAMPLE_RATE = 16000
+
+
+def _speech(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (0.3 * rng.standard_normal(int(SAMPLE_RATE * seconds))).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.float32)
+
+
+class TestSplitOnSilence(unittest.TestCase):
+    """Test suite for split_on_silence"""
+
+    def setUp(self):
+        # 4s phrases separated by 0.6s pauses, about 5 minutes in total
+        self.audio = np.concatenate([np.concatenate((_speech(4.0), _silence(0.6)))] * 65)
+
+    def test_chunks_cover_recording_in_order(self):
+        """Chunks are contiguous and span every sample"""
+        bounds = split_on_silence(self.audio, 60.0)
+
+        self.assertEqual(bounds[0][0], 0)
+        self.assertEqual(bounds[-1][1], len(self.audio))
+        for (_, end), (start, _) in zip(bounds, bounds[1:], strict=False):
+            self.assertEqual(end, start)
+
+    def test_cuts_land_in_pauses(self):
+        """Every cut is in silence, close to the target length"""
+        bounds = split_on_silence(self.audio, 60.0)
+
+        self.assertEqual(len(bounds), 5)
+        for start, end in bounds[:-1]:
+            self.assertEqual(self.audio[end], 0.0)
+            self.assertAlmostEqual((end - start) / SAMPLE_RATE, 60.0, delta=5.0)
+
+    def test_short_recording_is_one_chunk(self):
+        """Recordings up to 1.5 chunks long are not split"""
+        bounds = split_on_silence(self.audio[: SAMPLE_RATE * 80], 60.0)
+
+        self.assertEqual(bounds, [(0, SAMPLE_RATE * 80)])
+
+
+if __name__ == "__main__":
+    unittest.main()
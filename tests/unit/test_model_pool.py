@@ -0,0 +1,227 @@
+"""
+Unit tests for core/model_pool.py
+
+Tests reuse, LRU eviction against the RAM and VRAM budgets, size estimates,
+background loading and reloads of TranscriberPool, with a fake Transcriber that
+loads instantly (or when a test releases it).
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.model_pool import TranscriberPool
+
+
+class FakeTranscriber:
+    """Transcriber stand-in that resolves device and compute type like the real one."""
+
+    created: list[str] = []
+    gate: threading.Event | None = None  # Set by a test to hold loads until released
+
+    def __init__(self, model_size: str, device: str = "auto", compute_type: str | None = None):
+        if FakeTranscriber.gate is not None:
+            FakeTranscriber.gate.wait(timeout=5)
+        self.model_size = model_size
+        self.resolved_device = "cuda" if device == "cuda" else "cpu"
+        self.resolved_compute_type = compute_type or (
+            "int8_float16" if self.resolved_device == "cuda" else "int8"
+        )
+        FakeTranscriber.created.append(model_size)
+
+
+class PoolTestCase(unittest.TestCase):
+    """TranscriberPool building FakeTranscribers."""
+
+    def setUp(self):
+        FakeTranscriber.created = []
+        FakeTranscriber.gate = None
+        patcher = patch("core.model_pool.Transcriber", FakeTranscriber)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = TranscriberPool(budget_gb=1.0, warmup=False)
+
+    def loaded(self) -> list[str]:
+        return self.pool.status()["loaded"]
+
+
+class TestLoadAndEviction(PoolTestCase):
+    """Test load(), LRU eviction and the memory budgets."""
+
+    def test_loaded_model_is_reused(self):
+        """Loading the same configuration again returns the pooled instance"""
+        first = self.pool.load("small", device="cpu")
+        self.pool.load("base", device="cpu")
+
+        assert self.pool.load("small", device="cpu") is first
+        assert FakeTranscriber.created == ["small", "base"]
+        assert self.pool.status()["active"] == "small"
+
+    def test_least_recently_used_idle_model_is_evicted(self):
+        """Over the RAM budget, the idle model used longest ago goes first"""
+        self.pool.load("tiny", device="cpu")  # 0.1 GB
+        self.pool.load("base", device="cpu")  # 0.15 GB
+        self.pool.get(TranscriberPool.key_for("tiny", "cpu"))  # tiny is now more recent
+
+        self.pool.load("medium", device="cpu")  # 0.9 GB: 1.15 GB total
+
+        assert self.loaded() == ["tiny", "medium"]
+
+    def test_active_and_pinned_models_are_never_evicted(self):
+        """The active model and pinned models stay loaded even over budget"""
+        self.pool.load("medium", device="cpu")
+        self.pool.pinned.add(TranscriberPool.key_for("medium", "cpu"))
+
+        self.pool.load("large", device="cpu")  # 2.6 GB total, 1 GB budget
+
+        assert self.loaded() == ["medium", "large"]
+
+    def test_set_budget_evicts(self):
+        """Lowering the budget evicts idle models right away"""
+        self.pool.load("small", device="cpu")
+        self.pool.load("base", device="cpu")
+
+        self.pool.set_budget(0.2)
+
+        assert self.loaded() == ["base"]
+
+    def test_idle_gpu_model_is_evicted_by_default(self):
+        """With the default VRAM budget only the active CUDA model stays loaded"""
+        self.pool.load("small", device="cuda")
+        self.pool.load("tiny", device="cpu")  # CPU models use the RAM budget
+        self.pool.load("base", device="cuda")
+
+        assert self.loaded() == ["tiny", "base"]
+
+    def test_gpu_budget_keeps_idle_models(self):
+        """A VRAM budget lets idle CUDA models stay for instant switching"""
+        self.pool.set_budget(gpu_budget_gb=1.0)
+        self.pool.load("small", device="cuda")
+        self.pool.load("base", device="cuda")
+
+        assert self.loaded() == ["small", "base"]
+
+    def test_estimate_uses_resolved_compute_type(self):
+        """The size estimate follows the compute type the model loaded with"""
+        self.pool.load("small", device="cpu")
+        key = TranscriberPool.key_for("small", "cpu")
+        self.pool.get(key).resolved_compute_type = "float32"  # e.g. a calibrated CPU setting
+
+        assert key[2] == "default"
+        assert self.pool.estimate_gb(key) == TranscriberPool.MODEL_SIZE_GB["small"] * 4.0
+
+
+class TestBackgroundLoad(PoolTestCase):
+    """Test acquire() loading models off the calling thread."""
+
+    def test_acquire_loads_in_background_then_activates(self):
+        """A new model is loaded on a thread and handed to on_ready"""
+        self.pool.load("base", device="cpu")
+        ready = threading.Event()
+        on_ready = MagicMock(side_effect=lambda _: ready.set())
+
+        assert self.pool.acquire("small", device="cpu", on_ready=on_ready) is None
+        assert ready.wait(timeout=5)
+
+        on_ready.assert_called_once()
+        assert on_ready.call_args.args[0].model_size == "small"
+        assert self.pool.status()["active"] == "small"
+        assert self.pool.acquire("small", device="cpu") is on_ready.call_args.args[0]
+
+    def test_superseded_load_is_kept_idle(self):
+        """A model requested and then replaced by another request is not activated"""
+        self.pool.load("base", device="cpu")
+        FakeTranscriber.gate = threading.Event()
+        on_ready = MagicMock()
+
+        self.pool.acquire("small", device="cpu", on_ready=on_ready)
+        self.pool.acquire("base", device="cpu")  # User switched back before small loaded
+        FakeTranscriber.gate.set()
+        for _ in range(500):
+            if not self.pool.status()["loading"]:
+                break
+            time.sleep(0.01)
+
+        on_ready.assert_not_called()
+        assert self.pool.status()["active"] == "base"
+        assert self.loaded() == ["base", "small"]
+
+    def test_duplicate_request_starts_one_load(self):
+        """Acquiring a model that is already loading doesn't start a second load"""
+        FakeTranscriber.gate = threading.Event()
+
+        self.pool.acquire("small", device="cpu")
+        self.pool.acquire("small", device="cpu")
+        assert self.pool.status()["loading"] == ["small"]
+        FakeTranscriber.gate.set()
+        for _ in range(500):
+            if not self.pool.status()["loading"]:
+                break
+            time.sleep(0.01)
+
+        assert FakeTranscriber.created == ["small"]
+
+
+class TestReload(PoolTestCase):
+    """Test reload() replacing a pooled model with a fresh instance."""
+
+    def setUp(self):
+        super().setUp()
+        self.released: list = []
+        self.swapped = threading.Event()
+        patcher = patch.object(
+            TranscriberPool, "_release", side_effect=lambda *t: self.released.extend(t)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_active_model_is_swapped_and_old_released(self):
+        """The new instance replaces the active one, which is released after on_ready"""
+        old = self.pool.load("small", device="cpu")
+        on_ready = MagicMock(side_effect=lambda _: self.swapped.set())
+
+        self.pool.reload("small", device="cpu", on_ready=on_ready)
+        assert self.swapped.wait(timeout=5)
+        for _ in range(500):
+            if self.released:
+                break
+            time.sleep(0.01)
+
+        new = on_ready.call_args.args[0]
+        assert new is not old
+        assert self.pool.get(TranscriberPool.key_for("small", "cpu")) is new
+        assert self.released == [old]
+
+    def test_reload_while_loading_is_skipped(self):
+        """A model that is already loading isn't popped, so nothing is left unreleased"""
+        FakeTranscriber.gate = threading.Event()
+        self.pool.acquire("small", device="cpu")
+
+        self.pool.reload("small", device="cpu")
+        FakeTranscriber.gate.set()
+        for _ in range(500):
+            if not self.pool.status()["loading"]:
+                break
+            time.sleep(0.01)
+
+        assert FakeTranscriber.created == ["small"]
+        assert self.loaded() == ["small"]
+
+    def test_failed_reload_keeps_old_instance(self):
+        """If the fresh load fails, the old instance stays pooled and is not released"""
+        old = self.pool.load("small", device="cpu")
+
+        with patch.object(self.pool, "_create", side_effect=RuntimeError("out of memory")):
+            self.pool.reload("small", device="cpu")
+            for _ in range(500):
+                if not self.pool.status()["loading"]:
+                    break
+                time.sleep(0.01)
+
+        assert self.pool.get(TranscriberPool.key_for("small", "cpu")) is old
+        assert self.released == []
+
+
+if __name__ == "__main__":
+    unittest.main()
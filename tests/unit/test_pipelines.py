@@ -0,0 +1,518 @@
+"""
+Unit tests for core/pipelines.py
+
+Tests PipelineExecutor helpers against a mock PipelineHost (no audio hardware,
+Whisper or LLM involved).
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from core.language_cache import LanguageCache
+from core.pipelines import INSTANT_PROFILE_MAX_S, PipelineExecutor
+from core.response_cache import ResponseCache
+from core.transcriber import Transcriber
+from models import State
+
+
+def _executor(**config) -> PipelineExecutor:
+    """PipelineExecutor on a mock host with the given config."""
+    host = MagicMock()
+    host.config = config
+    host.recording_mode = "dictate"
+    host.audio_data = None
+    host.audio_sample_rate = 16000
+    host.audio_file = None
+    host.device_label = None
+    host.transcriber.DECODING_PROFILES = Transcriber.DECODING_PROFILES
+    host.startup_timeline = {}
+    host.is_calibrating_cpu = False
+    return PipelineExecutor(host, Path(tempfile.gettempdir()), "test")
+
+
+class TestReleaseAudio(unittest.TestCase):
+    """Test _release_audio()."""
+
+    def test_drops_in_memory_recording(self):
+        """The captured array is released after the pipeline"""
+        executor = _executor()
+        executor.host.audio_data = np.zeros(16000, dtype=np.float32)
+
+        executor._release_audio()
+
+        assert executor.host.audio_data is None
+
+    def test_keeps_saved_wav(self):
+        """A WAV written on request (saveAudioFile) is not deleted"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "recording.wav")
+            Path(path).write_bytes(b"RIFF")
+            executor = _executor(saveAudioFile=True)
+            executor.host.audio_file = path
+
+            executor._release_audio()
+
+            assert os.path.exists(path)
+
+
+class TestSampleRate(unittest.TestCase):
+    """Test the handoff of in-memory audio captured at another rate than 16 kHz."""
+
+    def test_capture_is_resampled_before_decoding(self):
+        """A 48 kHz recording reaches Whisper as 16 kHz samples, with the rate passed along"""
+        executor = _executor(silenceTrimEnabled=False)
+        host = executor.host
+        host.live_transcriber = None
+        host.audio_data = np.zeros(48000, dtype=np.float32)
+        host.audio_sample_rate = 48000
+        host.transcriber.transcribe_array.return_value = "Hello."
+
+        assert executor._transcribe(language="en") == "Hello."
+
+        call = host.transcriber.transcribe_array.call_args
+        assert len(call.args[0]) == 16000
+        assert call.kwargs["sample_rate"] == 16000
+        assert host.audio_sample_rate == 16000
+
+    def test_16khz_capture_is_untouched(self):
+        """Audio already at 16 kHz is handed over as-is"""
+        executor = _executor(silenceTrimEnabled=False)
+        audio = np.zeros(16000, dtype=np.float32)
+        executor.host.audio_data = audio
+
+        executor._to_whisper_rate()
+
+        assert executor.host.audio_data is audio
+
+
+class TestSelectProfile(unittest.TestCase):
+    """Test _select_profile() and the RTF bookkeeping of _record_rtf()."""
+
+    def test_short_clip_takes_instant_path(self):
+        """Recordings up to instantProfileMaxS use the instant profile"""
+        executor = _executor()
+
+        assert executor._select_profile(INSTANT_PROFILE_MAX_S) == "instant"
+        assert executor._select_profile(INSTANT_PROFILE_MAX_S + 0.1) == "accurate"
+        assert executor._select_profile(None) == "accurate"  # Duration unknown
+
+    def test_global_profile_and_instant_threshold_are_configurable(self):
+        """decodingProfile sets the default and instantProfileMaxS the fast-path cutoff"""
+        executor = _executor(decodingProfile="balanced", instantProfileMaxS=2.0)
+
+        assert executor._select_profile(1.5) == "instant"
+        assert executor._select_profile(3.0) == "balanced"
+
+    def test_mode_profile_overrides(self):
+        """decodingProfile_{mode} wins over the instant path and the global profile"""
+        executor = _executor(decodingProfile="balanced", decodingProfile_note="accurate")
+        executor.host.recording_mode = "note"
+
+        assert executor._select_profile(1.0) == "accurate"
+
+        executor.host.recording_mode = "dictate"
+        assert executor._select_profile(1.0) == "instant"  # Other modes unaffected
+
+    def test_unknown_profile_falls_back(self):
+        """A misspelled profile name falls back to the default profile"""
+        executor = _executor(decodingProfile_dictate="fastest")
+
+        assert executor._select_profile(1.0) == "accurate"
+
+    def test_record_rtf(self):
+        """The real-time factor is decode time over audio time; the first decode is timed"""
+        executor = _executor()
+
+        executor._record_rtf("instant", 4.0, 0.5)
+        executor._record_rtf("accurate", None, 1.0)
+
+        assert executor.decoding_profile == "accurate"
+        assert executor.transcription_rtf is None
+        assert executor.host.startup_timeline == {
+            "first_transcription_ms": 500,
+            "first_transcription_rtf": 0.125,
+        }
+
+    def test_record_rtf_skipped_during_cpu_calibration(self):
+        """Decodes competing with a CPU calibration leave no timing behind"""
+        executor = _executor()
+        executor.host.is_calibrating_cpu = True
+
+        executor._record_rtf("instant", 4.0, 0.5)
+
+        assert executor.decoding_profile == "instant"
+        assert executor.transcription_rtf is None
+        assert executor.host.startup_timeline == {}
+
+
+class TestStickyLanguage(unittest.TestCase):
+    """Test _sticky_language() keying the language cache by recording device."""
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.executor = _executor()
+        self.host = self.executor.host
+        self.host.language_cache = LanguageCache(Path(tmpdir.name) / "language_cache.json")
+        self.host.perf.end.return_value = 40.0
+        self.audio = np.zeros(16000, dtype=np.float32)
+
+    def test_language_is_cached_per_device(self):
+        """A language detected on one microphone is not reused on another"""
+        detect = self.host.transcriber.detect_language
+        detect.side_effect = [("de", 0.95), ("en", 0.97)]
+
+        self.host.device_label = "Headset Microphone"
+        assert self.executor._sticky_language(self.audio) == "de"
+        self.host.device_label = "USB Audio Device"
+        assert self.executor._sticky_language(self.audio) == "en"
+        self.host.device_label = "Headset Microphone"
+        assert self.executor._sticky_language(self.audio) == "de"
+
+        assert detect.call_count == 2
+
+    def test_disabled(self):
+        """stickyLanguageEnabled off leaves detection to Whisper"""
+        self.host.config["stickyLanguageEnabled"] = False
+
+        assert self.executor._sticky_language(self.audio) is None
+        self.host.transcriber.detect_language.assert_not_called()
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(16000 * seconds)) / 16000
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+class TestCascade(unittest.TestCase):
+    """Test the cascaded draft-then-refine transcription helpers."""
+
+    def setUp(self):
+        self.executor = _executor(cascadeReplaceInApp=True)
+        self.host = self.executor.host
+        self.host.state = State.IDLE
+        self.host.last_injected_text = "Wreck a nice beach."
+        self.host.transcriber.model_size = "turbo"
+        self.processor = MagicMock()
+        self.processor.prompt = "Clean up: {text}"
+        self.host.response_cache.process.side_effect = (
+            lambda processor, text, prompt_override=None: f"{text}."
+        )
+
+    def refine(self, refined_raw: str, draft_raw: str = "wreck a nice beach"):
+        self.host.transcriber.transcribe_array.return_value = refined_raw
+        self.executor._refine_transcript(
+            "abc123",
+            _speech(1.0),
+            "en",
+            draft_raw,
+            "Wreck a nice beach.",
+            self.processor,
+            "Clean up: {text}",
+        )
+
+    def test_draft_uses_draft_model_instant_profile(self):
+        """The draft is decoded by the draft model with the instant profile"""
+        self.host.audio_data = _speech(1.0)
+        self.host.draft_transcriber.transcribe_array.return_value = "wreck a nice beach"
+
+        assert self.executor._transcribe_draft("en") == "wreck a nice beach"
+
+        kwargs = self.host.draft_transcriber.transcribe_array.call_args.kwargs
+        assert kwargs == {"language": "en", "profile": "instant"}
+        assert self.executor.decoding_profile == "instant"
+        self.host.transcriber.transcribe_array.assert_not_called()
+
+    def test_silent_draft_skips_decode(self):
+        """A silent recording returns an empty draft without decoding"""
+        self.host.audio_data = np.zeros(16000, dtype=np.float32)
+
+        assert self.executor._transcribe_draft(None) == ""
+        self.host.draft_transcriber.transcribe_array.assert_not_called()
+
+    def test_confirmed_draft_is_kept(self):
+        """A refinement that only differs in case and spacing changes nothing"""
+        self.refine("Wreck a  nice beach")
+
+        self.host.history_manager.update_session.assert_not_called()
+        self.host.injector.replace_last.assert_not_called()
+        self.host._emit_event.assert_not_called()
+
+    def test_different_transcript_replaces_draft(self):
+        """A different transcript is processed, replaces the draft and is announced"""
+        self.refine("recognize speech")
+
+        self.host.response_cache.process.assert_called_once_with(
+            self.processor, "recognize speech", prompt_override="Clean up: {text}"
+        )
+        self.host.injector.replace_last.assert_called_once_with(
+            "Wreck a nice beach.", "recognize speech."
+        )
+        assert self.host.last_injected_text == "recognize speech."
+        self.host.history_manager.update_session.assert_called_once_with(
+            "abc123",
+            {
+                "raw_text": "recognize speech",
+                "processed_text": "recognize speech.",
+                "draft_text": "wreck a nice beach",
+                "refined_model": "turbo",
+            },
+        )
+        event, payload = self.host._emit_event.call_args.args
+        assert event == "transcript-refined"
+        assert payload["text"] == "recognize speech."
+        assert payload["replaced"] is True
+
+    def test_refine_uses_prompt_from_submit_time(self):
+        """A prompt switched by the next recording doesn't leak into the queued refine"""
+        cache = ResponseCache()
+        self.host.response_cache = cache
+        self.processor.process.side_effect = lambda text, prompt_override: prompt_override.format(
+            text=text
+        )
+        gate = threading.Event()
+        self.executor._refine_pool.submit(gate.wait, 5)  # Busy with an earlier refine
+        self.host.transcriber.transcribe_array.return_value = "recognize speech"
+
+        future = self.executor._refine_pool.submit(
+            self.executor._refine_transcript,
+            "abc123",
+            _speech(1.0),
+            "en",
+            "wreck a nice beach",
+            "Wreck a nice beach.",
+            self.processor,
+            self.processor.prompt,
+        )
+        self.processor.prompt = "Answer: {text}"  # Next recording is an ask
+        gate.set()
+        future.result(timeout=5)
+
+        assert self.host.last_injected_text == "Clean up: recognize speech"
+        self.processor.prompt = "Clean up: {text}"
+        assert cache.lookup(self.processor, "recognize speech") == "Clean up: recognize speech"
+        self.processor.prompt = "Answer: {text}"
+        assert cache.lookup(self.processor, "recognize speech") is None
+
+    def test_refinement_failure_keeps_draft(self):
+        """If the refining model fails, the draft stays as it is"""
+        self.host.transcriber.transcribe_array.side_effect = RuntimeError("CUDA OOM")
+
+        self.executor._refine_transcript(
+            "abc123", _speech(1.0), None, "wreck a nice beach", "Wreck a nice beach.", None
+        )
+
+        self.host.history_manager.update_session.assert_not_called()
+        self.host._emit_event.assert_not_called()
+
+    def test_processor_failure_uses_raw_refinement(self):
+        """A failing processor still lets the raw refined transcript through"""
+        self.host.response_cache.process.side_effect = RuntimeError("Ollama down")
+
+        self.refine("recognize speech")
+
+        assert self.host._emit_event.call_args.args[1]["text"] == "recognize speech"
+
+    def test_replace_only_when_cursor_is_after_draft(self):
+        """The draft is not replaced in the app once something else was injected"""
+        self.host.last_injected_text = "Another dictation."
+
+        assert self.executor._replace_draft("Wreck a nice beach.", "Recognize speech.") is False
+        self.host.injector.replace_last.assert_not_called()
+
+        self.host.last_injected_text = "Wreck a nice beach."
+        self.host.state = State.RECORDING
+        assert self.executor._replace_draft("Wreck a nice beach.", "Recognize speech.") is False
+
+    def test_replace_disabled(self):
+        """Replacing in the app is opt-in and off when an additional key was pressed"""
+        self.host.config["cascadeReplaceInApp"] = False
+        assert self.executor._replace_draft("Wreck a nice beach.", "Recognize speech.") is False
+
+        self.host.config.update(cascadeReplaceInApp=True, additionalKeyEnabled=True)
+        assert self.executor._replace_draft("Wreck a nice beach.", "Recognize speech.") is False
+        self.host.injector.replace_last.assert_not_called()
+
+    def test_replace_failure_is_not_fatal(self):
+        """An injector error leaves the draft in place and reports it as not replaced"""
+        self.host.injector.replace_last.side_effect = RuntimeError("no focus")
+
+        assert self.executor._replace_draft("Wreck a nice beach.", "Recognize speech.") is False
+        assert self.host.last_injected_text == "Wreck a nice beach."
+
+
+class TestRouteTranscriber(unittest.TestCase):
+    """Test _route_transcriber() (modelRoutingEnabled)."""
+
+    def setUp(self):
+        self.executor = _executor(modelRoutingEnabled=True)
+        self.host = self.executor.host
+        self.host.transcriber.model_size = "turbo"
+        self.host.transcriber.resolved_device = "cpu"
+        self.host.fast_transcriber.model_size = "base"
+        self.host.system_monitor.cpu_load.return_value = 20.0
+
+    def test_short_clip_goes_to_fast_model(self):
+        """Clips under routingShortClipS are decoded by the fast model"""
+        assert self.executor._route_transcriber(2.0) is self.host.fast_transcriber
+        assert self.executor.routed_model == "base"
+        assert self.executor.routing_reason == "short_clip"
+        assert self.executor.routing_cpu_percent == 20.0
+
+    def test_long_clip_on_idle_cpu_uses_configured_model(self):
+        """Longer clips use the configured model while the CPU has headroom"""
+        assert self.executor._route_transcriber(10.0) is self.host.transcriber
+        assert self.executor.routed_model == "turbo"
+        assert self.executor.routing_reason == "default"
+
+    def test_busy_cpu_goes_to_fast_model(self):
+        """Above routingCpuBusyPercent, CPU inference is routed to the fast model"""
+        self.host.system_monitor.cpu_load.return_value = 95.0
+
+        assert self.executor._route_transcriber(10.0) is self.host.fast_transcriber
+        assert self.executor.routing_reason == "cpu_busy"
+
+    def test_busy_cpu_ignored_on_gpu(self):
+        """CPU load doesn't slow down GPU inference, so it doesn't reroute"""
+        self.host.system_monitor.cpu_load.return_value = 95.0
+        self.host.transcriber.resolved_device = "cuda"
+
+        assert self.executor._route_transcriber(10.0) is self.host.transcriber
+
+    def test_thresholds_are_configurable(self):
+        """routingShortClipS and routingCpuBusyPercent move the cutoffs"""
+        self.host.config.update(routingShortClipS=12.0, routingCpuBusyPercent=10.0)
+        assert self.executor._route_transcriber(10.0) is self.host.fast_transcriber
+        assert self.executor.routing_reason == "short_clip"
+
+        assert self.executor._route_transcriber(15.0) is self.host.fast_transcriber
+        assert self.executor.routing_reason == "cpu_busy"
+
+    def test_unknown_cpu_load(self):
+        """Without a CPU reading only the duration decides"""
+        self.host.system_monitor = None
+
+        assert self.executor._route_transcriber(10.0) is self.host.transcriber
+        assert self.executor.routing_cpu_percent is None
+
+    def test_fast_model_still_loading(self):
+        """Until the fast model has loaded, every clip uses the configured model"""
+        self.host.fast_transcriber = None
+
+        assert self.executor._route_transcriber(1.0) is self.host.transcriber
+        assert self.executor.routing_reason is None
+
+    def test_fast_model_is_the_configured_model(self):
+        """Routing to the same model is skipped (and not recorded)"""
+        self.host.fast_transcriber = self.host.transcriber
+
+        assert self.executor._route_transcriber(1.0) is self.host.transcriber
+        assert self.executor.routing_reason is None
+
+    def test_disabled(self):
+        """Without modelRoutingEnabled the configured model is always used"""
+        self.host.config["modelRoutingEnabled"] = False
+
+        assert self.executor._route_transcriber(1.0) is self.host.transcriber
+
+
+def _stream(*deltas, error: Exception | None = None):
+    """Processor whose process_stream() yields the deltas, then raises error if given."""
+
+    def process_stream(_text):
+        yield from deltas
+        if error is not None:
+            raise error
+
+    processor = MagicMock()
+    processor.process_stream.side_effect = process_stream
+    processor.last_ttft_ms = 120.0
+    return processor
+
+
+class TestStreamInject(unittest.TestCase):
+    """Test _stream_inject() and the raw-text fallback of _restore_raw()."""
+
+    def setUp(self):
+        self.executor = _executor(trailingSpaceEnabled=False)
+        self.host = self.executor.host
+        self.pasted: list[tuple[str, bool]] = []
+        injector = self.host.injector
+        injector.paste_text.side_effect = lambda text: self.pasted.append(
+            (text, injector.add_trailing_space)
+        )
+
+    def test_complete_sentences_are_pasted_in_batches(self):
+        """Each run of finished sentences is pasted as it streams in, the rest at the end"""
+        processor = _stream("Hello", " there. How", " are you? Fine", " thanks")
+
+        result = self.executor._stream_inject(processor, "hello there how are you fine thanks")
+
+        assert result == "Hello there. How are you? Fine thanks"
+        # Batches are separated by a space; the last one follows trailingSpaceEnabled
+        assert self.pasted == [
+            ("Hello there.", True),
+            ("How are you?", True),
+            ("Fine thanks", False),
+        ]
+        assert self.host.injector.add_trailing_space is False
+        self.host._set_state.assert_called_once_with(State.INJECTING)
+        recorded = [c.args[0] for c in self.host.perf.record.call_args_list]
+        assert recorded == ["first_sentence", "llm_ttft"]
+
+    def test_sentences_in_one_delta_form_one_batch(self):
+        """Several sentences that arrive together are pasted in one go"""
+        processor = _stream("One. Two. Three")
+
+        assert self.executor._stream_inject(processor, "one two three") == "One. Two. Three"
+        assert [text for text, _ in self.pasted] == ["One. Two.", "Three"]
+
+    def test_failure_after_partial_injection_restores_raw(self):
+        """A stream that fails after a batch was pasted replaces it with the raw transcript"""
+        processor = _stream("First sentence. Sec", error=ConnectionError("Ollama died"))
+
+        with self.assertRaises(ConnectionError):
+            self.executor._stream_inject(processor, "first sentence second")
+
+        assert self.pasted == [("First sentence.", True)]
+        # The pasted batch was followed by a space even without trailing spaces
+        self.host.injector.replace_last.assert_called_once_with(
+            "First sentence. ", "first sentence second"
+        )
+
+    def test_failure_with_trailing_space_restores_raw(self):
+        """With trailing spaces on, the batch's own space stays in the replaced text"""
+        self.host.config["trailingSpaceEnabled"] = True
+        processor = _stream("One. Two. Thr", error=ConnectionError("Ollama died"))
+
+        with self.assertRaises(ConnectionError):
+            self.executor._stream_inject(processor, "one two three")
+
+        self.host.injector.replace_last.assert_called_once_with("One. Two.", "one two three")
+
+    def test_failure_before_output_pastes_raw(self):
+        """If nothing was pasted yet, the raw transcript is simply pasted"""
+        processor = _stream("No sentence end yet", error=RuntimeError("model unloaded"))
+
+        with self.assertRaises(RuntimeError):
+            self.executor._stream_inject(processor, "raw transcript")
+
+        assert self.pasted == [("raw transcript", False)]
+        self.host.injector.replace_last.assert_not_called()
+        self.host._set_state.assert_not_called()
+
+    def test_restore_failure_is_not_fatal(self):
+        """An injector error during the fallback is logged, not raised"""
+        self.host.injector.replace_last.side_effect = RuntimeError("no focus")
+
+        self.executor._restore_raw("Partial.", "raw transcript")
+
+
+if __name__ == "__main__":
+    unittest.main()
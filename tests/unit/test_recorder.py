@@ -0,0 +1,203 @@
+"""
+Unit tests for core/recorder.py
+
+Tests the PortAudio callback path of Recorder by feeding _on_audio synthetic
+chunks; the stream itself is a mock (PyAudio is mocked by conftest).
+"""
+
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+import core.recorder as recorder_module
+from core.recorder import Recorder
+
+PA_CONTINUE, PA_COMPLETE, PA_INPUT_OVERFLOW = 0, 1, 2
+
+
+def _chunk(value: int, frames: int = 160) -> bytes:
+    """One callback's worth of int16 mono PCM filled with `value`."""
+    return np.full(frames, value, dtype=np.int16).tobytes()
+
+
+class RecorderTestCase(unittest.TestCase):
+    """Recorder with an open, active mock stream and real PyAudio flag values."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        patcher = patch.multiple(
+            recorder_module.pyaudio,
+            paContinue=PA_CONTINUE,
+            paComplete=PA_COMPLETE,
+            paInputOverflow=PA_INPUT_OVERFLOW,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.recorder = Recorder(sample_rate=16000, temp_dir=self.tmpdir.name)
+        self.recorder.stream = MagicMock()
+        self.recorder.stream.is_active.return_value = True
+        self.recorder._capturing = True
+        self.recorder._stream_device = ""  # Opened for the default device
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def feed(self, data: bytes, status_flags: int = 0, adc_time: float = 0.0):
+        frames = len(data) // 2
+        return self.recorder._on_audio(
+            data, frames, {"input_buffer_adc_time": adc_time}, status_flags
+        )
+
+
+class TestCallback(RecorderTestCase):
+    """Test _on_audio(): capture, frame-count auto-stop and overflow accounting."""
+
+    def setUp(self):
+        super().setUp()
+        self.recorder.is_recording = True
+
+    def test_appends_chunks_while_recording(self):
+        """Each callback's PCM is appended and the stream keeps running"""
+        assert self.feed(_chunk(1)) == (None, PA_CONTINUE)
+        assert self.feed(_chunk(2)) == (None, PA_CONTINUE)
+
+        assert self.recorder.audio_data.frames == 320
+        assert self.recorder.is_recording is True
+
+    def test_auto_stop_truncates_to_max_duration(self):
+        """The chunk crossing max_duration is cut so exactly max_frames are kept"""
+        self.recorder._max_frames = 400
+        self.recorder.max_duration = 1
+        callback = MagicMock()
+        self.recorder.auto_stop_callback = callback
+
+        self.feed(_chunk(1))
+        self.feed(_chunk(2))
+        result = self.feed(_chunk(3))
+
+        assert result == (None, PA_COMPLETE)
+        assert self.recorder.audio_data.frames == 400
+        np.testing.assert_array_equal(self.recorder.audio_data.view()[320:], np.full(80, 3))
+        assert self.recorder.is_recording is False
+        assert self.recorder._capturing is False
+        for _ in range(100):  # Called on its own thread, never on the audio thread
+            if callback.called:
+                break
+            time.sleep(0.01)
+        callback.assert_called_once_with(1)
+
+    def test_auto_stop_on_exact_boundary(self):
+        """A chunk that ends exactly at max_duration stops without truncation"""
+        self.recorder._max_frames = 320
+
+        self.feed(_chunk(1))
+        assert self.feed(_chunk(2)) == (None, PA_COMPLETE)
+        assert self.recorder.audio_data.frames == 320
+
+    def test_auto_stop_keeps_warm_stream_running(self):
+        """In warm-input mode the stream continues (paContinue) to refill the pre-roll"""
+        self.recorder.warm_input = True
+        self.recorder._max_frames = 100
+
+        assert self.feed(_chunk(1)) == (None, PA_CONTINUE)
+        assert self.recorder.audio_data.frames == 100
+        assert self.recorder.is_recording is False
+        assert self.recorder._capturing is True
+
+    def test_counts_overflows_and_dropped_frames(self):
+        """paInputOverflow callbacks are counted; the ADC clock gap estimates drops"""
+        self.feed(_chunk(0), adc_time=1.0)
+        # 160 frames = 10ms; this chunk arrives 60ms later, so ~50ms (800 frames) were lost
+        self.feed(_chunk(0), status_flags=PA_INPUT_OVERFLOW, adc_time=1.06)
+        # No ADC clock on this host API: counted, but no drop estimate
+        self.feed(_chunk(0), status_flags=PA_INPUT_OVERFLOW, adc_time=0.0)
+
+        assert self.recorder.overflow_count == 2
+        assert self.recorder.dropped_frames == 800
+        assert self.recorder.audio_data.frames == 480  # Flagged chunks are still kept
+
+
+class TestWarmInput(RecorderTestCase):
+    """Test the idle pre-roll and the warm-stream handoff in start()."""
+
+    def setUp(self):
+        super().setUp()
+        self.recorder.enable_warm_input(preroll_ms=20)  # 320 samples; stream already open
+
+    def test_idle_audio_fills_preroll_only(self):
+        """While not recording, callbacks go to the pre-roll ring"""
+        self.feed(_chunk(1))
+
+        assert len(self.recorder.preroll) == 160
+        assert len(self.recorder.audio_data) == 0
+
+    def test_start_prefixes_recording_with_preroll(self):
+        """A warm start() begins with the audio captured just before it"""
+        for value in (1, 2, 3):  # 480 samples into a 320-sample ring: wraps
+            self.feed(_chunk(value))
+
+        with patch.object(self.recorder, "_open_stream") as open_stream:
+            self.recorder.start()
+        self.feed(_chunk(4))
+
+        open_stream.assert_not_called()  # No device setup on the warm path
+        audio = self.recorder.audio_data.view()
+        np.testing.assert_array_equal(audio, np.repeat(np.array([2, 3, 4], dtype=np.int16), 160))
+        assert self.recorder.first_sample_latency_ms is not None
+
+    def test_stop_keeps_stream_and_clears_preroll(self):
+        """stop() leaves the stream open and doesn't replay the dictation's tail"""
+        self.recorder.start()
+        self.feed(_chunk(5))
+
+        self.recorder.stop()
+        self.recorder.stream.close.assert_not_called()
+        assert len(self.recorder.preroll) == 0
+
+        self.feed(_chunk(6))
+        self.recorder.start()
+        np.testing.assert_array_equal(
+            self.recorder.audio_data.view(), np.full(160, 6, dtype=np.int16)
+        )
+
+    def test_dead_stream_takes_cold_path(self):
+        """If the warm stream stopped delivering audio, start() reopens the device"""
+        self.feed(_chunk(1))
+        self.recorder.stream.is_active.return_value = False
+
+        with (
+            patch.object(self.recorder, "_open_stream") as open_stream,
+            patch.object(self.recorder, "_start_capture"),
+        ):
+            self.recorder.start()
+
+        open_stream.assert_called_once()
+        assert len(self.recorder.audio_data) == 0  # No stale pre-roll
+
+    def test_configured_device_stream_is_reused(self):
+        """The stream configure opens for the synced device serves start_recording"""
+        with patch.object(self.recorder.device_registry, "resolve", return_value=3) as resolve:
+            self.recorder.enable_warm_input(preroll_ms=20, device_label="USB Microphone")
+            stream = self.recorder.stream
+            self.recorder.start(device_label="USB Microphone")
+
+        assert self.recorder.stream is stream
+        resolve.assert_called_once()
+
+    def test_default_label_matches_missing_label(self):
+        """audioDeviceLabel "Default" and a start_recording without a label are one device"""
+        stream = self.recorder.stream
+        self.recorder.enable_warm_input(preroll_ms=20, device_label="Default")
+
+        with patch.object(self.recorder, "_open_stream") as open_stream:
+            self.recorder.start(device_label=None)
+
+        open_stream.assert_not_called()
+        assert self.recorder.stream is stream
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Unit tests for core/response_cache.py
+
+Tests normalization, LRU eviction, expiry, persistence and the privacy-driven
+disable path of the processor response cache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.response_cache import MAX_INPUT_CHARS, ResponseCache, normalize_text
+
+
+def _processor(model: str = "gemma3:4b", prompt: str = "Clean up: {text}") -> MagicMock:
+    processor = MagicMock()
+    processor.model = model
+    processor.prompt = prompt
+    processor.process.side_effect = lambda text, prompt_override=None: f"<{text.strip()}>"
+    return processor
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the processor response cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "response_cache.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_normalize_text(self):
+        """Case, whitespace runs, Unicode forms and trailing punctuation are folded"""
+        assert normalize_text("  Thanks,   talk SOON. ") == "thanks, talk soon"
+        assert normalize_text("Ｈｉ there!") == "hi there"
+
+    def test_repeat_with_different_punctuation_hits(self):
+        """A re-dictated phrase is served from the cache"""
+        cache = ResponseCache()
+        processor = _processor()
+
+        first = cache.process(processor, "new paragraph please.")
+        second = cache.process(processor, "New paragraph  please")
+
+        assert first == second == "<new paragraph please.>"
+        assert processor.process.call_count == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_key_includes_prompt_and_model(self):
+        """A different prompt, prompt override or model is a different entry"""
+        cache = ResponseCache()
+        processor = _processor()
+        cache.process(processor, "hello world")
+
+        cache.process(processor, "hello world", prompt_override="Translate: {text}")
+        processor.prompt = "Formal: {text}"
+        cache.process(processor, "hello world")
+        processor.model = "llama3.2:3b"
+        cache.process(processor, "hello world")
+
+        assert processor.process.call_count == 4
+        assert cache.stats()["hits"] == 0
+
+    def test_long_inputs_are_not_cached(self):
+        """Inputs above MAX_INPUT_CHARS always go to the processor"""
+        cache = ResponseCache()
+        processor = _processor()
+        text = "word " * (MAX_INPUT_CHARS // 5 + 1)
+
+        cache.process(processor, text)
+        cache.process(processor, text)
+
+        assert processor.process.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = ResponseCache(max_entries=2)
+        processor = _processor()
+        cache.process(processor, "one")
+        cache.process(processor, "two")
+        cache.process(processor, "one")  # Hit: "two" is now least recently used
+        cache.process(processor, "three")
+
+        assert cache.lookup(processor, "one") == "<one>"
+        assert cache.lookup(processor, "two") is None
+        assert cache.stats()["entries"] == 2
+
+    def test_expired_entries_miss(self):
+        """Entries older than the TTL are dropped on lookup"""
+        cache = ResponseCache(ttl_s=60)
+        processor = _processor()
+        cache.process(processor, "hello")
+
+        with patch("core.response_cache.time.time", return_value=time.time() + 61):
+            assert cache.lookup(processor, "hello") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_persisted_entries_survive_restart(self):
+        """Entries written to the database are loaded by the next instance"""
+        cache = ResponseCache(persist_path=self.db_path)
+        cache.process(_processor(), "see you tomorrow")
+        cache.close()
+
+        reloaded = ResponseCache(persist_path=self.db_path)
+        processor = _processor()
+        assert reloaded.process(processor, "See you tomorrow.") == "<see you tomorrow>"
+        processor.process.assert_not_called()
+        assert reloaded.stats()["persisted"] is True
+        reloaded.close()
+
+    def test_disable_forgets_everything(self):
+        """Disabling clears memory and the database; lookups stop"""
+        cache = ResponseCache(persist_path=self.db_path)
+        processor = _processor()
+        cache.process(processor, "hello")
+
+        cache.configure(enabled=False)
+        assert cache.stats()["entries"] == 0
+        assert cache.lookup(processor, "hello") is None
+
+        reloaded = ResponseCache(persist_path=self.db_path)
+        assert reloaded.stats()["entries"] == 0
+        reloaded.close()
+
+    def test_dropping_persistence_wipes_file_entries(self):
+        """Turning persistence off keeps memory entries but empties the database"""
+        cache = ResponseCache(persist_path=self.db_path)
+        processor = _processor()
+        cache.process(processor, "hello")
+
+        cache.configure(enabled=True, persist_path=None)
+        assert cache.lookup(processor, "hello") == "<hello>"
+
+        reloaded = ResponseCache(persist_path=self.db_path)
+        assert reloaded.stats()["entries"] == 0
+        reloaded.close()
+
+    def test_starts_disabled_until_configured(self):
+        """A cache built disabled neither opens its database nor caches until enabled"""
+        cache = ResponseCache(persist_path=self.db_path)
+        cache.process(_processor(), "see you tomorrow")
+        cache.close()
+
+        disabled = ResponseCache(persist_path=self.db_path, enabled=False)
+        processor = _processor()
+        disabled.process(processor, "see you tomorrow")
+        processor.process.assert_called_once()
+        assert disabled.stats()["persisted"] is False
+
+        disabled.configure(enabled=True, persist_path=self.db_path)
+        assert disabled.lookup(processor, "see you tomorrow") == "<see you tomorrow>"
+        disabled.close()
+
+    def test_disabled_at_start_deletes_earlier_database(self):
+        """Starting disabled removes entries persisted by an earlier run"""
+        cache = ResponseCache(persist_path=self.db_path)
+        cache.process(_processor(), "hello")
+        cache.close()
+
+        restarted = ResponseCache(enabled=False)
+        restarted.configure(enabled=False, persist_path=self.db_path)
+
+        assert not os.path.exists(self.db_path)
+        restarted.configure(enabled=True, persist_path=self.db_path)
+        assert restarted.stats()["entries"] == 0
+        restarted.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Unit tests for core/silence_trim.py
+
+Tests leading/trailing trimming, padding, the peak-relative gate and fully
+silent recordings.
+"""
+
+import unittest
+
+import numpy as np
+from core.silence_trim import trim_silence
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.float32)
+
+
+class TestSilenceTrim(unittest.TestCase):
+    """Test suite for trim_silence"""
+
+    def test_trims_both_ends_with_padding(self):
+        """Leading/trailing silence is removed, keeping the padding"""
+        audio = np.concatenate((_silence(1.0), _tone(1.0), _silence(0.5)))
+
+        trimmed, removed_s = trim_silence(audio, SAMPLE_RATE, padding_ms=100)
+
+        self.assertAlmostEqual(len(trimmed) / SAMPLE_RATE, 1.2, places=2)
+        self.assertAlmostEqual(removed_s, 1.3, places=2)
+
+    def test_keeps_inner_silence(self):
+        """Pauses between words are not touched"""
+        audio = np.concatenate((_tone(0.5), _silence(1.0), _tone(0.5)))
+
+        trimmed, removed_s = trim_silence(audio, SAMPLE_RATE)
+
+        self.assertEqual(len(trimmed), len(audio))
+        self.assertEqual(removed_s, 0.0)
+
+    def test_all_silent_returns_empty(self):
+        """A recording with no speech trims to nothing"""
+        audio = _silence(2.0) + np.float32(1e-4)
+
+        trimmed, removed_s = trim_silence(audio, SAMPLE_RATE)
+
+        self.assertEqual(len(trimmed), 0)
+        self.assertAlmostEqual(removed_s, 2.0)
+
+    def test_quiet_speech_is_kept(self):
+        """A whisper on a low-gain mic (~-57 dBFS) is trimmed like normal speech"""
+        audio = np.concatenate((_silence(0.5), _tone(0.5, amplitude=0.002), _silence(0.5)))
+
+        trimmed, removed_s = trim_silence(audio, SAMPLE_RATE, padding_ms=100)
+
+        self.assertAlmostEqual(len(trimmed) / SAMPLE_RATE, 0.7, places=2)
+        self.assertAlmostEqual(removed_s, 0.8, places=2)
+
+    def test_gate_follows_the_noise_floor(self):
+        """Room noise well below the speech is trimmed even though it isn't digital silence"""
+        rng = np.random.default_rng(0)
+        noise = (0.001 * rng.standard_normal(SAMPLE_RATE * 2)).astype(np.float32)  # ~-60 dBFS
+        noise[SAMPLE_RATE // 2 : SAMPLE_RATE] += _tone(0.5)
+
+        trimmed, removed_s = trim_silence(noise, SAMPLE_RATE, padding_ms=0)
+
+        self.assertAlmostEqual(len(trimmed) / SAMPLE_RATE, 0.5, places=2)
+        self.assertAlmostEqual(removed_s, 1.5, places=2)
+
+    def test_floor_is_configurable(self):
+        """Only a clip whose loudest frame is under floor_db counts as silent"""
+        audio = np.concatenate((_silence(0.5), _tone(0.5, amplitude=0.001), _silence(0.5)))
+
+        self.assertGreater(len(trim_silence(audio, SAMPLE_RATE)[0]), 0)  # ~-63 dBFS peak
+        self.assertEqual(len(trim_silence(audio, SAMPLE_RATE, floor_db=-60.0)[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
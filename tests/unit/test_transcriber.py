@@ -12,6 +12,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 python_dir = Path(__file__).parent.parent.parent / "python"
@@ -192,7 +193,11 @@ class TestTranscribe(unittest.TestCase):
 
         assert result == "Hello world. This is a test."
         mock_model_instance.transcribe.assert_called_once_with(
-            "test.wav", language=None, task="transcribe"
+            "test.wav",
+            language=None,
+            task="transcribe",
+            initial_prompt=None,
+            **transcriber.decode_options(),
         )
 
     @patch.object(transcriber_module, "WhisperModel")
@@ -211,7 +216,11 @@ class TestTranscribe(unittest.TestCase):
 
         assert result == "Test text"
         mock_model_instance.transcribe.assert_called_once_with(
-            "test.wav", language="en", task="transcribe"
+            "test.wav",
+            language="en",
+            task="transcribe",
+            initial_prompt=None,
+            **transcriber.decode_options(),
         )
 
     @patch.object(transcriber_module, "WhisperModel")
@@ -273,6 +282,58 @@ class TestTranscribe(unittest.TestCase):
         assert "Transcription failed" in str(exc_info.value)
 
 
+class TestTranscribeBatch(unittest.TestCase):
+    """Test transcribe_batch() mapping segments back to their clips."""
+
+    @patch.object(transcriber_module, "BatchedInferencePipeline")
+    @patch.object(transcriber_module, "WhisperModel")
+    def test_segments_map_to_clips_by_start(self, mock_whisper_model, mock_pipeline):
+        """Each segment goes to the clip its start time falls in; empty clips stay empty"""
+        sr = Transcriber.SAMPLE_RATE
+        gap_s = Transcriber.BATCH_GAP_S
+        clips = [np.zeros(sr), np.zeros(0), np.zeros(2 * sr), np.zeros(sr // 2)]
+        # Timeline: clip 0 at 0s, clip 2 at 1s + gap, clip 3 after clip 2 and two gaps
+        clip2_start = 1.0 + gap_s
+        clip3_start = clip2_start + 2.0 + gap_s
+        mock_pipeline.return_value.transcribe.return_value = (
+            [
+                Mock(start=0.0, text=" Hello."),
+                Mock(start=clip2_start, text=" Second clip"),
+                Mock(start=clip2_start + 1.2, text=" keeps going."),
+                Mock(start=clip3_start + 0.1, text=" Third."),
+            ],
+            Mock(),
+        )
+        mock_whisper_model.return_value = Mock()
+
+        transcriber = Transcriber(model_size="base", device="cpu")
+        result = transcriber.transcribe_batch(clips, language="en")
+
+        assert result == ["Hello.", "", "Second clip keeps going.", "Third."]
+        kwargs = mock_pipeline.return_value.transcribe.call_args.kwargs
+        assert kwargs["clip_timestamps"] == [
+            {"start": 0.0, "end": pytest.approx(1.0 + gap_s)},
+            {"start": pytest.approx(clip2_start), "end": pytest.approx(clip3_start)},
+            {"start": pytest.approx(clip3_start), "end": pytest.approx(clip3_start + 0.5 + gap_s)},
+        ]
+        assert "word_timestamps" not in kwargs
+        assert kwargs["vad_filter"] is False
+
+    @patch.object(transcriber_module, "BatchedInferencePipeline")
+    @patch.object(transcriber_module, "WhisperModel")
+    def test_long_clip_is_transcribed_alone(self, mock_whisper_model, mock_pipeline):
+        """A clip longer than a 30s batch window falls back to a sequential decode"""
+        mock_model_instance = Mock()
+        mock_model_instance.transcribe.return_value = ([Mock(text="Long note.")], Mock())
+        mock_whisper_model.return_value = mock_model_instance
+
+        transcriber = Transcriber(model_size="base", device="cpu")
+        result = transcriber.transcribe_batch([np.zeros(31 * Transcriber.SAMPLE_RATE)])
+
+        assert result == ["Long note."]
+        mock_pipeline.return_value.transcribe.assert_not_called()
+
+
 class TestSupportedModels(unittest.TestCase):
     """Test SUPPORTED_MODELS constant."""
 
@@ -0,0 +1,176 @@
+"""
+Unit tests for core/transcription_worker.py
+
+Tests the parent side of RemoteTranscriber: the shared memory handoff and the
+request protocol, including the retry after a worker crash. No worker process
+is spawned; the pipe is a scripted fake connection.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from core.transcription_worker import RemoteTranscriber
+
+
+class FakeConn:
+    """Pipe end that records sent requests and replays scripted replies.
+
+    A reply may be an exception to raise or a callable to run (e.g. to simulate
+    the watchdog restarting the worker) before raising what it returns.
+    """
+
+    def __init__(self, replies: list):
+        self.replies = list(replies)
+        self.sent: list = []
+
+    def send(self, message) -> None:
+        self.sent.append(message)
+
+    def recv(self):
+        reply = self.replies.pop(0)
+        if callable(reply):
+            reply = reply()
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+
+class RemoteTranscriberTestCase(unittest.TestCase):
+    """RemoteTranscriber with process startup and the watchdog patched out."""
+
+    def setUp(self):
+        with (
+            patch.object(RemoteTranscriber, "_start_process"),
+            patch.object(RemoteTranscriber, "_watch"),
+        ):
+            self.remote = RemoteTranscriber(model_size="base", device="cpu")
+        self.addCleanup(self._release_shm)
+
+    def _release_shm(self):
+        if self.remote._shm is not None:
+            self.remote._shm.close()
+            self.remote._shm.unlink()
+
+    def connect(self, conn: FakeConn) -> None:
+        """Attach a (re)started worker, as _start_process does."""
+        with self.remote._state:
+            self.remote._conn = conn
+            self.remote._generation += 1
+            self.remote._available = True
+            self.remote._state.notify_all()
+
+
+class TestAudioArgs(RemoteTranscriberTestCase):
+    """Test _audio_args(): the shared memory block is reused and grown in steps."""
+
+    def test_path_is_passed_through(self):
+        """File paths go over the pipe as-is"""
+        assert self.remote._audio_args("note.wav") == {"path": "note.wav"}
+        assert self.remote._audio_args(None) == {}
+
+    def test_block_is_reused_and_grown(self):
+        """Clips that fit reuse the block; a larger one replaces it with a bigger block"""
+        step = RemoteTranscriber.SHM_STEP_BYTES
+        first = self.remote._audio_args(np.arange(1000, dtype=np.float32))
+        block = self.remote._shm
+        assert first == {"shm": block.name, "samples": 1000}
+        assert block.size >= step
+
+        second = self.remote._audio_args(np.ones(500, dtype=np.float32))
+        assert second["shm"] == first["shm"]
+        assert self.remote._shm is block
+
+        samples = step // 4 + 1  # One float32 more than a step holds
+        third = self.remote._audio_args(np.full(samples, 0.5, dtype=np.float32))
+        assert third["shm"] != first["shm"]
+        assert self.remote._shm.size >= 2 * step
+        view = np.ndarray((samples,), dtype=np.float32, buffer=self.remote._shm.buf)
+        assert view[0] == 0.5 and view[-1] == 0.5
+
+    def test_samples_are_copied_as_float32(self):
+        """The worker reads exactly the samples that were sent"""
+        audio = np.linspace(-1.0, 1.0, 320)  # float64 in, float32 in the block
+        args = self.remote._audio_args(audio)
+
+        view = np.ndarray((args["samples"],), dtype=np.float32, buffer=self.remote._shm.buf)
+        np.testing.assert_allclose(view, audio.astype(np.float32))
+
+
+class TestRequest(RemoteTranscriberTestCase):
+    """Test _request() through the public transcription methods."""
+
+    def test_segments_stream_back(self):
+        """Segments are yielded as they arrive; the request carries the decode options"""
+        conn = FakeConn(
+            [
+                ("pong", None),  # Late reply to a timed-out health check
+                ("segment", (0.0, 1.0, "Hello")),
+                ("segment", (1.0, 2.0, "there.")),
+                ("done", None),
+            ]
+        )
+        self.connect(conn)
+
+        text = self.remote.transcribe_array(np.zeros(16000), language="en", profile="instant")
+
+        assert text == "Hello there."
+        command, args = conn.sent[0]
+        assert command == "transcribe"
+        assert args["language"] == "en"
+        assert args["profile"] == "instant"
+        assert args["samples"] == 16000
+        assert self.remote._busy is False
+
+    def test_retried_once_after_worker_crash(self):
+        """A request in flight when the worker died is resent to the restarted worker"""
+        restarted = FakeConn([("segment", (0.0, 1.0, "Recovered.")), ("done", None)])
+
+        def crash():
+            self.remote._available = False
+            self.connect(restarted)  # What the watchdog does after the crash
+            return EOFError()
+
+        self.connect(FakeConn([crash]))
+
+        assert self.remote.transcribe_array(np.zeros(16000)) == "Recovered."
+        assert restarted.sent[0][0] == "transcribe"
+
+    def test_crash_after_output_is_not_retried(self):
+        """Once segments were yielded a retry would duplicate text, so the error surfaces"""
+        self.connect(FakeConn([("segment", (0.0, 1.0, "Partial")), EOFError()]))
+
+        with self.assertRaises(RuntimeError):
+            self.remote.transcribe_array(np.zeros(16000))
+
+    def test_second_crash_fails(self):
+        """A request that crashes the restarted worker too is not retried again"""
+
+        def crash_again():
+            self.connect(FakeConn([EOFError()]))
+            return EOFError()
+
+        self.connect(FakeConn([crash_again]))
+
+        with self.assertRaises(RuntimeError):
+            self.remote.transcribe_array(np.zeros(16000))
+
+    def test_worker_error_is_raised(self):
+        """An exception inside the worker is reported as a RuntimeError"""
+        self.connect(FakeConn([("error", "CUDA out of memory")]))
+
+        with self.assertRaisesRegex(RuntimeError, "CUDA out of memory"):
+            self.remote.transcribe("note.wav")
+
+    def test_unavailable_worker_times_out(self):
+        """Requests fail when no worker comes up within START_TIMEOUT_S"""
+        with (
+            patch.object(RemoteTranscriber, "START_TIMEOUT_S", 0.01),
+            self.assertRaisesRegex(RuntimeError, "not available"),
+        ):
+            self.remote.transcribe("note.wav")
+
+
+if __name__ == "__main__":
+    unittest.main()